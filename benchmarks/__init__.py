@@ -0,0 +1 @@
+"""Benchmark package initialization."""
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""UI responsiveness while many asyncio tasks run on the bridged loop.
+
+Run with: python benchmarks/bench_async.py [--tasks 5000]
+
+A 10 ms Qt timer probes the event loop while the tasks sleep, wake and
+yield; the largest gap between probe ticks is the worst input latency a
+user would have seen.
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication
+
+from benchmarks.harness import benchmark
+from core.async_bridge import async_bridge
+
+PROBE_INTERVAL = 10
+
+async def _worker(seed, rounds=5):
+    rng = random.Random(seed)
+    total = 0
+    for _ in range(rounds):
+        await asyncio.sleep(rng.uniform(0.0, 0.05))
+        total += sum(range(50))
+    return total
+
+def run(tasks=5000):
+    """Run tasks concurrently and return completion time and UI lag."""
+    app = QApplication.instance() or QApplication(sys.argv)
+    bridge = async_bridge()
+    ticks = []
+    probe = QTimer()
+    probe.timeout.connect(lambda: ticks.append(time.perf_counter()))
+    probe.start(PROBE_INTERVAL)
+
+    async def main():
+        return await asyncio.gather(*(_worker(i) for i in range(tasks)))
+
+    start = time.perf_counter()
+    ticks.append(start)
+    bridge.run_until_complete(main())
+    elapsed = time.perf_counter() - start
+    probe.stop()
+    app.processEvents()
+    gaps = [b - a for a, b in zip(ticks, ticks[1:])]
+    return {
+        'async_tasks': tasks,
+        'async_total_s': elapsed,
+        'async_max_ui_gap_ms': max(gaps) * 1000 if gaps else 0.0,
+        'async_probe_ticks': len(ticks) - 1,
+        'async_max_pump_ms': bridge.max_pump_ms
+    }
+
+@benchmark("asyncio 1000 tasks round trip", repeat=10)
+def async_round_trip():
+    bridge = async_bridge()
+
+    async def step():
+        await asyncio.sleep(0)
+
+    async def main():
+        await asyncio.gather(*(step() for _ in range(1000)))
+
+    return lambda: bridge.run_until_complete(main())
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=5000)
+    args = parser.parse_args()
+    for name, value in run(args.tasks).items():
+        print(f"{name}: {value:.6g}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""Rendering throughput of ui.components.chart.TimeSeriesChart.
+
+Run with: python benchmarks/bench_chart.py [--points 1000000] [--frames 120]
+
+Each frame appends a batch of samples to every series (or pans the
+view) and renders the chart into an image, as a live dashboard would
+at display rate. Points per second counts the raw samples covered by
+each frame, before downsampling.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy
+from PyQt5.QtGui import QImage
+from PyQt5.QtWidgets import QApplication
+
+from benchmarks.harness import benchmark
+from ui.components.chart import TimeSeriesChart
+
+WIDTH, HEIGHT = 1000, 300
+
+def make_chart(points, series=2, seed=0):
+    """Return a chart with ``series`` random walks of ``points`` samples each."""
+    rng = numpy.random.default_rng(seed)
+    chart = TimeSeriesChart()
+    chart.resize(WIDTH, HEIGHT)
+    x = numpy.arange(points, dtype=numpy.float64)
+    for index in range(series):
+        chart.add_series(f"series {index}", capacity=points)
+        chart.extend(f"series {index}", x, numpy.cumsum(rng.normal(size=points)))
+    return chart, rng
+
+def _frames(chart, image, frames, step):
+    times = []
+    for frame in range(frames):
+        step(frame)
+        start = time.perf_counter()
+        chart.render(image)
+        times.append(time.perf_counter() - start)
+    return times
+
+def run(points=1_000_000, frames=120, batch=1000):
+    """Return frame times and throughput for streaming and panning."""
+    app = QApplication.instance() or QApplication(sys.argv)
+    chart, rng = make_chart(points)
+    image = QImage(WIDTH, HEIGHT, QImage.Format_ARGB32_Premultiplied)
+    state = {'next_x': float(points)}
+
+    def stream(frame):
+        xs = numpy.arange(state['next_x'], state['next_x'] + batch)
+        state['next_x'] += batch
+        for name in chart.series:
+            chart.extend(name, xs, rng.normal(size=batch).cumsum())
+
+    def pan(frame):
+        chart.pan(-points / 500)
+
+    results = {}
+    for label, step, setup in (("stream", stream, None), ("pan", pan, (points / 2,))):
+        if setup:
+            chart.span = setup[0]
+        chart.points_rendered = 0
+        times = _frames(chart, image, frames, step)
+        results[f'chart_{label}_frame_ms'] = sorted(times)[len(times) // 2] * 1000
+        results[f'chart_{label}_worst_frame_ms'] = max(times) * 1000
+        results[f'chart_{label}_points_per_s'] = chart.points_rendered / sum(times)
+    return results
+
+@benchmark("chart frame (2 x 1M points)", repeat=30)
+def chart_frame():
+    chart, rng = make_chart(1_000_000)
+    image = QImage(WIDTH, HEIGHT, QImage.Format_ARGB32_Premultiplied)
+    state = {'next_x': 1e6}
+    def run():
+        xs = numpy.arange(state['next_x'], state['next_x'] + 100)
+        state['next_x'] += 100
+        for name in chart.series:
+            chart.extend(name, xs, rng.normal(size=100))
+        chart.render(image)
+    return run
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=1_000_000)
+    parser.add_argument("--frames", type=int, default=120)
+    args = parser.parse_args()
+    for name, value in run(args.points, args.frames).items():
+        print(f"{name}: {value:.6g}")
+
+if __name__ == '__main__':
+    main()
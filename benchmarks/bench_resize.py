@@ -0,0 +1,83 @@
+"""Frame cost of dragging the window's size grip, throttled and unthrottled.
+
+Run with: python benchmarks/bench_resize.py [--moves 120] [--interval 4]
+
+Synthetic press, move and release events are sent to the main window's
+QSizeGrip, one move every ``interval`` ms, as a mouse would report them.
+Both runs go through LiveResizer and report its ``frame_times``, the
+cost of each applied resize and the layout passes it posts. The
+unthrottled run sets ``live_interval`` to 0, so every move is applied
+as it arrives, as it was before the throttle.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import Qt, QEvent, QPoint, QSize
+from PyQt5.QtGui import QMouseEvent
+from PyQt5.QtWidgets import QApplication, QSizeGrip
+
+def _mouse(kind, grip, global_pos):
+    buttons = Qt.NoButton if kind == QEvent.MouseButtonRelease else Qt.LeftButton
+    return QMouseEvent(kind, grip.mapFromGlobal(global_pos), global_pos,
+                       Qt.LeftButton, buttons, Qt.NoModifier)
+
+def drag(window, moves, interval, step=3):
+    """Drag the window's size grip by ``moves`` mouse moves ``interval`` ms apart."""
+    app = QApplication.instance()
+    grip = window.findChild(QSizeGrip)
+    origin = grip.mapToGlobal(grip.rect().center())
+    position = origin
+    QApplication.sendEvent(grip, _mouse(QEvent.MouseButtonPress, grip, origin))
+    deadline = time.perf_counter()
+    for move in range(1, moves + 1):
+        position = origin + QPoint(move * step, move * step)
+        QApplication.sendEvent(grip, _mouse(QEvent.MouseMove, grip, position))
+        # Let the throttle timer fire in real time between moves
+        deadline += interval / 1000
+        while time.perf_counter() < deadline:
+            app.processEvents()
+    QApplication.sendEvent(grip, _mouse(QEvent.MouseButtonRelease, grip, position))
+    app.processEvents()
+
+def run(moves=120, interval=4):
+    """Return LiveResizer frame statistics for a throttled and an unthrottled drag."""
+    app = QApplication.instance() or QApplication(sys.argv)
+    from benchmarks.bench_ui import _shown_window, _close
+    results = {}
+    for label, live_interval in (("throttled", None), ("unthrottled", 0)):
+        window = _shown_window()
+        window.change_page(1)
+        window.transition.finish()
+        window.resize(QSize(900, 600))
+        app.processEvents()
+        resizer = window.live_resizer
+        resizer.max_frame_samples = moves + 1
+        if live_interval is not None:
+            resizer.live_interval = live_interval
+        drag(window, moves, interval)
+        times = resizer.frame_times
+        if not times:
+            raise RuntimeError("the size grip drag did not reach LiveResizer")
+        results[f'{label}_resizes'] = resizer.resizes_applied
+        results[f'{label}_frame_ms'] = statistics.median(times)
+        results[f'{label}_worst_frame_ms'] = max(times)
+        results[f'{label}_total_ms'] = sum(times)
+        _close(window)()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--moves", type=int, default=120, help="mouse moves in the drag")
+    parser.add_argument("--interval", type=float, default=4, help="ms between mouse moves")
+    args = parser.parse_args()
+    for name, value in run(args.moves, args.interval).items():
+        print(f"{name}: {value:.6g}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Load and save latency of core.settings_store.SettingsStore.
+
+Run with: python benchmarks/bench_settings_store.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.harness import benchmark
+from core.settings_store import SettingsStore
+
+def make_settings(count):
+    return {f"section{i % 10}.key{i}": f"value {i}" for i in range(count)}
+
+def bench_load(path, repeat=50):
+    """Return the median load time in seconds."""
+    times = []
+    for _ in range(repeat):
+        store = SettingsStore(path)
+        store.load()
+        times.append(store.last_load_seconds)
+    return sorted(times)[len(times) // 2]
+
+def bench_update(store, keys, repeat=1000):
+    """Return the mean time of an update() call changing one key."""
+    start = time.perf_counter()
+    for i in range(repeat):
+        store.update({keys[i % len(keys)]: i})
+    return (time.perf_counter() - start) / repeat
+
+def run(count=200):
+    """Run the settings store benchmarks and return their results."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "settings.json")
+        store = SettingsStore(path, debounce=0.05)
+        store.update(make_settings(count))
+        store.close()
+
+        results = {'settings_load_s': bench_load(path)}
+
+        store = SettingsStore(path, debounce=0.05)
+        store.load()
+        keys = list(store.snapshot())
+        results['settings_update_s'] = bench_update(store, keys)
+        # The burst above must collapse into very few writes
+        time.sleep(0.2)
+        results['settings_writes_per_1000_updates'] = store.writes
+        store.update({'bench.forced_write': time.time()})
+        store.flush()
+        results['settings_write_s'] = store.last_write_seconds
+        store.close()
+    return results
+
+@benchmark("settings update (1 key)", repeat=200)
+def settings_update():
+    tmp = tempfile.TemporaryDirectory()
+    store = SettingsStore(os.path.join(tmp.name, "settings.json"))
+    store.update(make_settings(200))
+    state = {'value': 0}
+    def run():
+        state['value'] += 1
+        store.update({'section0.key0': state['value']})
+    def cleanup():
+        store.close()
+        tmp.cleanup()
+    return run, cleanup
+
+def main():
+    for name, value in run().items():
+        print(f"{name}: {value:.6g}")
+
+if __name__ == '__main__':
+    main()
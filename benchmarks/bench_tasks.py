@@ -0,0 +1,93 @@
+"""Result transfer and UI responsiveness of core.task_pool.TaskPool.
+
+Run with: python benchmarks/bench_tasks.py [--size 2000000]
+
+Compares returning a large float64 array from a worker by pickling it
+through the result pipe against handing it over in shared memory, and
+measures the worst gap seen by a 10 ms Qt timer while a CPU-bound job
+runs on the GUI thread versus in the pool.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication
+
+from benchmarks.harness import benchmark
+from core.task_pool import TaskPool
+
+PROBE_INTERVAL = 10
+
+def make_array(size):
+    return numpy.linspace(0.0, 1.0, size)
+
+def busy_sum(iterations):
+    total = 0
+    for i in range(iterations):
+        total += i * i % 7
+    return total
+
+def _wait(app, handle):
+    result = []
+    handle.finished.connect(result.append)
+    handle.failed.connect(result.append)
+    while not result:
+        app.processEvents(QEventLoop.AllEvents | QEventLoop.WaitForMoreEvents, 50)
+    return result[0]
+
+def _transfer_time(app, pool, size, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _wait(app, pool.submit(make_array, size))
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+def _max_gap(app, work):
+    ticks = [time.perf_counter()]
+    probe = QTimer()
+    probe.timeout.connect(lambda: ticks.append(time.perf_counter()))
+    probe.start(PROBE_INTERVAL)
+    work()
+    ticks.append(time.perf_counter())
+    probe.stop()
+    return max(b - a for a, b in zip(ticks, ticks[1:]))
+
+def run(size=2_000_000, iterations=3_000_000):
+    """Return transfer times and UI gaps in seconds."""
+    app = QApplication.instance() or QApplication(sys.argv)
+    pool = TaskPool(max_workers=1)
+    _wait(app, pool.submit(make_array, 1))
+    results = {}
+    try:
+        results['tasks_shared_memory_s'] = _transfer_time(app, pool, size)
+        pool.shared_memory_threshold = float("inf")
+        results['tasks_pickled_s'] = _transfer_time(app, pool, size)
+        results['tasks_gui_thread_gap_s'] = _max_gap(app, lambda: busy_sum(iterations))
+        results['tasks_pool_gap_s'] = _max_gap(app, lambda: _wait(app, pool.submit(busy_sum, iterations)))
+    finally:
+        pool.shutdown()
+    return results
+
+@benchmark("task pool 16 MB array result", repeat=10)
+def array_result():
+    app = QApplication.instance()
+    pool = TaskPool(max_workers=1)
+    _wait(app, pool.submit(make_array, 1))
+    return (lambda: _wait(app, pool.submit(make_array, 2_000_000))), pool.shutdown
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=2_000_000)
+    args = parser.parse_args()
+    for name, value in run(args.size).items():
+        print(f"{name}: {value:.6g}")
+
+if __name__ == '__main__':
+    main()
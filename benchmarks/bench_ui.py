@@ -0,0 +1,239 @@
+"""Page construction, navigation, styling, hover, resize and layout benchmarks.
+
+Needs a QApplication; benchmarks/run.py creates one on the offscreen platform.
+Windows are built with empty settings and a stylesheet cache in a scratch
+directory, so results do not depend on, and runs do not write to, the
+user's own settings and caches.
+"""
+import itertools
+import os
+import tempfile
+
+from PyQt5.QtCore import QEvent, QSize
+from PyQt5.QtWidgets import QApplication, QWidget
+
+from benchmarks.harness import benchmark
+from core.settings_store import SettingsStore
+from core.stylesheet import stylesheet_compiler
+from core.theme import PRESETS
+from core.utils import load_stylesheet
+from ui.main_window import MainWindow
+from ui.pages.home import HomePage, ActionCard
+from ui.pages.dashboard import DashboardPage, StatCard
+from ui.pages.settings import SettingsPage
+from ui.sidebar import Sidebar, NavGroup, NavEntry
+from ui.components.grid_layout import ResponsiveGridLayout
+
+_scratch = tempfile.TemporaryDirectory(prefix="modern-pyqt5-bench-")
+_windows = itertools.count()
+stylesheet_compiler.cache_dir = os.path.join(_scratch.name, "qss")
+stylesheet_compiler.clear()
+
+def new_window(**options):
+    """Return a MainWindow with its own empty settings file in the scratch directory."""
+    path = os.path.join(_scratch.name, f"settings-{next(_windows)}.json")
+    return MainWindow(settings_store=SettingsStore(path), **options)
+
+def _close(widget):
+    def cleanup():
+        widget.close()
+        widget.deleteLater()
+        QApplication.processEvents()
+    return cleanup
+
+def _shown_window(**options):
+    window = new_window(**options)
+    window.show()
+    QApplication.processEvents()
+    return window
+
+@benchmark("construct MainWindow", repeat=10)
+def construct_main_window():
+    windows = []
+    def run():
+        windows.append(new_window())
+    def cleanup():
+        for window in windows:
+            _close(window)()
+    return run, cleanup
+
+def _construct_page(page_class):
+    pages = []
+    def run():
+        pages.append(page_class())
+    def cleanup():
+        for page in pages:
+            page.deleteLater()
+        QApplication.processEvents()
+    return run, cleanup
+
+@benchmark("construct HomePage")
+def construct_home_page():
+    return _construct_page(HomePage)
+
+@benchmark("construct DashboardPage")
+def construct_dashboard_page():
+    return _construct_page(DashboardPage)
+
+@benchmark("construct SettingsPage")
+def construct_settings_page():
+    return _construct_page(SettingsPage)
+
+@benchmark("change_page warm", repeat=50)
+def change_page_warm():
+    window = _shown_window()
+    window.page_transition = None
+    pages = window.stacked_widget.count()
+    for index in range(pages):
+        window.change_page(index)
+    state = {'index': 0}
+    def run():
+        state['index'] = (state['index'] + 1) % pages
+        window.change_page(state['index'])
+        window.stacked_widget.currentWidget().repaint()
+    return run, _close(window)
+
+@benchmark("change_page slide snapshots", repeat=30)
+def change_page_slide():
+    window = _shown_window()
+    window.transition_budget_ms = float("inf")
+    pages = window.stacked_widget.count()
+    for index in range(pages):
+        window.pages.show(index)
+    state = {'index': 0}
+    def run():
+        # Snapshot both pages and start the slide; the animation itself
+        # runs on the clock and is cut short by the next switch
+        state['index'] = (state['index'] + 1) % pages
+        window.change_page(state['index'])
+    return run, _close(window)
+
+@benchmark("load_stylesheet + setStyleSheet", repeat=20)
+def apply_stylesheet():
+    window = _shown_window()
+    state = {'flip': False}
+    def run():
+        # Alternate a trailing comment so Qt cannot skip an identical sheet
+        state['flip'] = not state['flip']
+        style = load_stylesheet("resources/style.qss")
+        window.setStyleSheet(style + ("/* a */" if state['flip'] else "/* b */"))
+    return run, _close(window)
+
+def _hover_frames(card_class, page_index):
+    window = _shown_window()
+    window.change_page(page_index)
+    window.transition.finish()
+    QApplication.processEvents()
+    card = window.stacked_widget.currentWidget().findChildren(card_class)[0]
+    effect = card._hover_effect
+    state = {'hovered': False}
+    def run():
+        # One full hover transition, stepped frame by frame
+        state['hovered'] = not state['hovered']
+        if state['hovered']:
+            card.enterEvent(QEvent(QEvent.Enter))
+        else:
+            card.leaveEvent(QEvent(QEvent.Leave))
+        start = effect._start_time
+        for frame in range(1, 11):
+            effect.step(start + frame * 16)
+            card.repaint()
+    return run, _close(window)
+
+@benchmark("hover ActionCard (10 frames)")
+def hover_action_card():
+    return _hover_frames(ActionCard, 0)
+
+@benchmark("hover StatCard (10 frames)")
+def hover_stat_card():
+    return _hover_frames(StatCard, 1)
+
+def _resize_frames(**options):
+    window = _shown_window(**options)
+    window.change_page(1)
+    window.transition.finish()
+    sizes = [QSize(1000, 700), QSize(1200, 800)]
+    state = {'index': 0}
+    def run():
+        state['index'] ^= 1
+        window.resize(sizes[state['index']])
+        QApplication.processEvents()
+    return run, _close(window)
+
+@benchmark("resizeEvent + relayout", repeat=30)
+def resize_window():
+    return _resize_frames()
+
+@benchmark("resizeEvent + relayout (opaque)", repeat=30)
+def resize_window_opaque():
+    return _resize_frames(opaque=True)
+
+def _theme_switches(page_index):
+    window = _shown_window()
+    window.change_page(page_index)
+    window.transition.finish()
+    QApplication.processEvents()
+    engine = window.theme_engine
+    keys = [engine.current._replace(preset=name) for name in PRESETS]
+    engine.precompile(keys)
+    QApplication.processEvents()
+    state = {'index': 0}
+    def run():
+        state['index'] = (state['index'] + 1) % len(keys)
+        engine.apply(window, keys[state['index']])
+    return run, _close(window)
+
+@benchmark("theme switch (HomePage)")
+def theme_switch_home():
+    return _theme_switches(0)
+
+@benchmark("theme switch (DashboardPage)")
+def theme_switch_dashboard():
+    return _theme_switches(1)
+
+def _navigation(groups=10, entries=50):
+    icons = ["home", "dashboard", "settings"]
+    return [NavGroup(f"Group {g}", [NavEntry(icons[i % 3], f"Page {g}.{i}", g * entries + i)
+                                    for i in range(entries)])
+            for g in range(groups)]
+
+@benchmark("construct Sidebar (500 entries)")
+def construct_sidebar():
+    navigation = _navigation()
+    return _construct_page(lambda: Sidebar(navigation))
+
+@benchmark("Sidebar select (500 entries)", repeat=200)
+def sidebar_select():
+    sidebar = Sidebar(_navigation())
+    sidebar.resize(36, 600)
+    sidebar.show()
+    QApplication.processEvents()
+    state = {'page': 0}
+    def run():
+        state['page'] = (state['page'] + 7) % 500
+        sidebar.set_current_page(state['page'])
+    return run, _close(sidebar)
+
+def _card_grid(count=300, **options):
+    host = QWidget()
+    grid = ResponsiveGridLayout(host, **options)
+    for i in range(count):
+        grid.addWidget(ActionCard(f"Action {i}", "Reflowing card description " * (1 + i % 3)))
+    host.resize(1000, 800)
+    host.show()
+    QApplication.processEvents()
+    state = {'width': 1000}
+    def run():
+        # A live-resize drag: a new width every frame
+        state['width'] = 1000 if state['width'] <= 600 else state['width'] - 10
+        host.resize(state['width'], 800)
+        QApplication.processEvents()
+    return run, _close(host)
+
+@benchmark("grid relayout (300 cards)", repeat=40)
+def grid_relayout():
+    return _card_grid()
+
+@benchmark("flow relayout (300 cards)", repeat=40)
+def flow_relayout():
+    return _card_grid(uniform=False)
@@ -0,0 +1,79 @@
+"""Minimal benchmark registry, timer and baseline comparison."""
+import json
+import statistics
+import time
+
+BENCHMARKS = {}
+
+def benchmark(name, repeat=20, warmup=2):
+    """Register a benchmark.
+
+    The decorated function does any setup and returns the callable to
+    time, or a (callable, cleanup) pair. The callable is run ``warmup``
+    times untimed and then ``repeat`` times timed.
+    """
+    def decorator(setup):
+        BENCHMARKS[name] = (setup, repeat, warmup)
+        return setup
+    return decorator
+
+def run_benchmark(name, process_events=None):
+    """Run one registered benchmark and return its timing summary."""
+    setup, repeat, warmup = BENCHMARKS[name]
+    prepared = setup()
+    run, cleanup = prepared if isinstance(prepared, tuple) else (prepared, None)
+    try:
+        for _ in range(warmup):
+            run()
+            if process_events:
+                process_events()
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+            if process_events:
+                process_events()
+    finally:
+        if cleanup:
+            cleanup()
+    return {
+        'median_ms': statistics.median(times) * 1000,
+        'min_ms': min(times) * 1000,
+        'repeat': repeat
+    }
+
+def load_baseline(path):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def save_baseline(path, results):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=1, sort_keys=True)
+        f.write("\n")
+
+def compare(results, baseline, threshold=0.25, floor_ms=0.5):
+    """Return (name, baseline_ms, current_ms) for each regressed benchmark.
+
+    A benchmark regresses when both its median and its fastest run are
+    more than ``threshold`` slower than the baseline's and more than
+    ``floor_ms`` slower in absolute terms. Requiring the minimum to move
+    too, and ignoring sub-``floor_ms`` deltas, keeps scheduler noise on
+    short benchmarks from failing runs.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        slower = []
+        for key in ('median_ms', 'min_ms'):
+            # Older baselines may only have a median
+            before = baseline[name].get(key, baseline[name]['median_ms'])
+            after = result[key]
+            slower.append(after > before * (1 + threshold) and after - before > floor_ms)
+        if all(slower):
+            regressions.append((name, baseline[name]['median_ms'], result['median_ms']))
+    return regressions
@@ -0,0 +1,82 @@
+"""Switch pages repeatedly and fail if the object census keeps growing.
+
+Run with: python benchmarks/leak_check.py [--cycles 20] [--budget BYTES]
+
+A census is taken after one warm-up cycle through every page and again
+after ``--cycles`` more. Any growth in QObjects, widgets, effects,
+animations, timers or pixmaps is reported and fails the run, as does a
+total estimated size above ``--budget``. So does any page or the
+sidebar carrying more than ``--max-inline-stylesheets`` widgets with
+a stylesheet of their own, which should come from the window
+stylesheet instead.
+"""
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QCoreApplication, QEvent
+from PyQt5.QtWidgets import QApplication
+
+from benchmarks.bench_ui import new_window
+from ui.components.styled import inline_stylesheet_report
+
+def settle(app):
+    """Run pending events, deferred deletes and any finishing transition."""
+    app.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    app.processEvents()
+
+def cycle(window, app):
+    for index in range(window.stacked_widget.count()):
+        window.change_page(index)
+        window.transition.finish()
+        settle(app)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Page switch leak check")
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--budget", type=int, default=None,
+                        help="fail if the estimated total exceeds this many bytes")
+    parser.add_argument("--max-inline-stylesheets", type=int, default=0,
+                        help="fail if a page has more widgets with their own stylesheet")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    window = new_window()
+    window.show()
+    cycle(window, app)
+    before = window.census()
+    for _ in range(args.cycles):
+        cycle(window, app)
+    after = window.census()
+
+    for name, counts in sorted(after.sections.items()):
+        print(f"{name:<28} {counts['qobjects']:6d} objects {counts['approx_bytes'] / 1024:9.1f} KiB")
+    total = after.total()['approx_bytes']
+    print(f"{'total':<28} {after.total()['qobjects']:6d} objects {total / 1024:9.1f} KiB")
+
+    failed = False
+    for name, delta in sorted(after.diff(before).items()):
+        print(f"GROWTH {name}: {delta}")
+        failed = True
+    if args.budget is not None and total > args.budget:
+        print(f"OVER BUDGET: {total} > {args.budget} bytes")
+        failed = True
+    roots = {"sidebar": window.sidebar}
+    for index in range(window.stacked_widget.count()):
+        page = window.pages.page(index)
+        roots[f"page {index} {type(page).__name__}"] = page
+    for name, root in roots.items():
+        report = inline_stylesheet_report(root)
+        if report['inline_stylesheets'] > args.max_inline_stylesheets:
+            print(f"INLINE STYLESHEETS {name}: {', '.join(report['offenders'])}")
+            failed = True
+    window.close()
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
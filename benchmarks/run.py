@@ -0,0 +1,70 @@
+"""Run the headless benchmark suite and compare it against a baseline.
+
+Run with: python benchmarks/run.py [--update-baseline] [--threshold 0.25] [--floor-ms 0.5]
+
+Exits with status 1 when any benchmark is slower than its baseline by
+more than the threshold and the floor. Baselines are machine specific; regenerate
+them with --update-baseline after an intentional change or on new
+hardware.
+"""
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+
+from benchmarks.harness import BENCHMARKS, run_benchmark, load_baseline, save_baseline, compare
+
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Headless UI benchmarks")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="baseline JSON file to compare against")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown as a fraction of the baseline")
+    parser.add_argument("--floor-ms", type=float, default=0.5,
+                        help="ignore slowdowns smaller than this many ms")
+    parser.add_argument("--filter", default="",
+                        help="only run benchmarks whose name contains this text")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    # Relative resource paths are resolved from the project root
+    os.chdir(ROOT)
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    # Importing the modules registers their benchmarks
+    import benchmarks.bench_ui  # noqa: F401
+    import benchmarks.bench_settings_store  # noqa: F401
+    import benchmarks.bench_async  # noqa: F401
+    import benchmarks.bench_tasks  # noqa: F401
+    import benchmarks.bench_chart  # noqa: F401
+
+    results = {}
+    for name in BENCHMARKS:
+        if args.filter in name:
+            results[name] = run_benchmark(name, app.processEvents)
+            print(f"{name:<36} {results[name]['median_ms']:9.3f} ms  (min {results[name]['min_ms']:.3f})")
+
+    if args.update_baseline:
+        baseline = load_baseline(args.baseline)
+        baseline.update(results)
+        save_baseline(args.baseline, baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    regressions = compare(results, load_baseline(args.baseline), args.threshold, args.floor_ms)
+    for name, before, after in regressions:
+        print(f"REGRESSION {name}: {before:.3f} ms -> {after:.3f} ms")
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Compare the cached nine-patch card shadow with QGraphicsDropShadowEffect.
+
+Run with: python benchmarks/shadow_check.py [--tolerance 8]
+
+An opaque card is drawn on a white background twice, once under a
+ShadowHost with the cached shadow and once with the drop shadow effect
+the cache replaces. Every pixel around the card is compared; the run
+fails if any channel differs by more than ``--tolerance``.
+"""
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import Qt, QRect, QRectF
+from PyQt5.QtGui import QColor, QPalette, QPainter
+from PyQt5.QtWidgets import QApplication, QWidget, QGraphicsDropShadowEffect
+
+from ui.components.shadow import ShadowHost, CARD_SHADOW
+
+CARD = QRect(40, 40, 200, 100)
+
+def _solid(widget, color):
+    palette = widget.palette()
+    palette.setColor(QPalette.Window, color)
+    widget.setPalette(palette)
+    widget.setAutoFillBackground(True)
+
+class _Card(QWidget):
+    """Opaque white card with the spec's rounded corners, like ContentCard."""
+
+    def __init__(self, radius, parent=None):
+        super().__init__(parent)
+        self.radius = radius
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(255, 255, 255))
+        painter.drawRoundedRect(QRectF(self.rect()), self.radius, self.radius)
+
+def render(host, spec, cached):
+    """Return an image of an opaque card with its shadow on a white host."""
+    host.resize(CARD.right() + 40, CARD.bottom() + 40)
+    _solid(host, QColor(255, 255, 255))
+    card = _Card(spec.corner_radius, host)
+    card.setGeometry(CARD)
+    if cached:
+        card.shadow_spec = spec
+    else:
+        effect = QGraphicsDropShadowEffect()
+        effect.setBlurRadius(spec.blur_radius)
+        effect.setColor(QColor(*spec.color))
+        effect.setOffset(spec.offset_x, spec.offset_y)
+        card.setGraphicsEffect(effect)
+    host.show()
+    QApplication.processEvents()
+    image = host.grab().toImage()
+    host.close()
+    return image
+
+def compare(cached, effect):
+    """Return the largest channel difference and the (x, y) it occurs at."""
+    worst, where = 0, None
+    for y in range(cached.height()):
+        for x in range(cached.width()):
+            a, b = QColor(cached.pixel(x, y)), QColor(effect.pixel(x, y))
+            delta = max(abs(a.red() - b.red()), abs(a.green() - b.green()), abs(a.blue() - b.blue()))
+            if delta > worst:
+                worst, where = delta, (x, y)
+    return worst, where
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cached shadow vs drop shadow effect")
+    parser.add_argument("--tolerance", type=int, default=8)
+    args = parser.parse_args(argv)
+    app = QApplication.instance() or QApplication(sys.argv)
+    cached = render(ShadowHost(), CARD_SHADOW, True)
+    effect = render(QWidget(), CARD_SHADOW, False)
+    below = (CARD.center().x(), CARD.bottom() + 1 + CARD_SHADOW.offset_y)
+    side = (CARD.right() + 1, CARD.center().y())
+    for name, (x, y) in (("below card", below), ("side edge", side)):
+        print(f"{name:<11} cached {QColor(cached.pixel(x, y)).red():3d}  "
+              f"effect {QColor(effect.pixel(x, y)).red():3d}")
+    worst, where = compare(cached, effect)
+    print(f"max difference {worst} at {where}")
+    app.processEvents()
+    return 0 if worst <= args.tolerance else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
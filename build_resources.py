@@ -0,0 +1,79 @@
+"""Pack icons, pre-rasterized icon variants and compiled stylesheets into one file.
+
+Run with: python build_resources.py [--output PATH]
+
+The app maps the bundle at startup and serves resources from it, so a
+cold start opens one file instead of every icon and stylesheet. Rebuild
+it after changing anything under resources/; without it the app falls
+back to the loose files.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtGui import QGuiApplication
+
+from core.bundle import DEFAULT_BUNDLE_PATH, PROJECT_ROOT, raster_name, stylesheet_name, write_bundle
+from core.icon_cache import ICON_DIR, render_svg
+from core.stylesheet import StylesheetCompiler
+from core.theme import DEFAULT_THEME, PRESETS, theme_variables
+
+# Sizes drawn by the title bar, sidebar and buttons, at 1x and 2x
+RASTER_SIZES = (16, 24)
+RASTER_RATIOS = (1.0, 2.0)
+STYLESHEETS = ["resources/style.qss"]
+
+def theme_variable_sets():
+    """Variables for every preset at the default accent, plus light mode."""
+    keys = [DEFAULT_THEME._replace(preset=name) for name in PRESETS]
+    keys.append(DEFAULT_THEME._replace(dark=False))
+    return [None] + [theme_variables(key) for key in keys]
+
+def icon_entries():
+    entries = []
+    for path in sorted(glob.glob(os.path.join(ICON_DIR, "*.svg"))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        stat = os.stat(path)
+        with open(path, 'rb') as f:
+            meta = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+            entries.append((f"icons/{name}", f.read(), meta))
+        for size in RASTER_SIZES:
+            for ratio in RASTER_RATIOS:
+                image = render_svg(path, size, ratio)
+                pixels = image.constBits().asstring(image.sizeInBytes())
+                meta = {"size": [image.width(), image.height()], "icon_size": size, "dpr": ratio}
+                entries.append((raster_name(name, size, ratio), pixels, meta))
+    return entries
+
+def stylesheet_entries(compiler):
+    entries = []
+    for relative_path in STYLESHEETS:
+        path = os.path.join(PROJECT_ROOT, relative_path)
+        stat = os.stat(path)
+        with open(path, 'r') as f:
+            source = f.read()
+        for variables in theme_variable_sets():
+            variables_key = json.dumps(variables or {}, sort_keys=True)
+            style = compiler.compile(source, variables, resolve_urls=False)
+            meta = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+            entries.append((stylesheet_name(relative_path, variables_key), style.encode("utf-8"), meta))
+    return entries
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the packed resource bundle")
+    parser.add_argument("--output", default=DEFAULT_BUNDLE_PATH, help="bundle file to write")
+    args = parser.parse_args(argv)
+
+    app = QGuiApplication.instance() or QGuiApplication(sys.argv[:1])
+    compiler = StylesheetCompiler()
+    entries = icon_entries() + stylesheet_entries(compiler)
+    write_bundle(args.output, entries, meta={"icon_dir_mtime_ns": os.stat(ICON_DIR).st_mtime_ns})
+    print(f"Wrote {len(entries)} entries ({os.path.getsize(args.output)} bytes) to {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+from PyQt5.QtCore import QObject, QTimer, QEvent, QEventLoop, QSocketNotifier
+import asyncio
+import functools
+import time
+
+class AsyncBridge(QObject):
+    """Runs an asyncio event loop inside the Qt event loop.
+
+    The asyncio loop is never blocked on: each pump runs exactly one
+    non-blocking iteration (``stop`` scheduled, then ``run_forever``), so
+    coroutines execute on the GUI thread between Qt events and may touch
+    widgets after an ``await``. Pumps are triggered by a socket notifier
+    on the loop's selector (I/O, subprocesses and thread-safe wakeups) and
+    by a timer set to the next scheduled callback. Selectors without a
+    pollable descriptor fall back to polling every ``poll_interval`` ms
+    while the loop has unfinished tasks; an idle loop is not polled.
+
+    A pump runs at most ``max_callbacks_per_pump`` ready callbacks; the
+    rest wait for the next pump, so thousands of tasks becoming ready at
+    once are spread over several Qt event loop passes instead of one
+    long stall.
+    """
+
+    poll_interval = 10
+    max_callbacks_per_pump = 200
+
+    def __init__(self, loop=None, parent=None):
+        super().__init__(parent)
+        self.loop = loop or asyncio.new_event_loop()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._pump)
+        self._notifier = None
+        selector = getattr(self.loop, "_selector", None)
+        fileno = selector.fileno() if selector is not None and hasattr(selector, "fileno") else -1
+        if fileno >= 0:
+            self._notifier = QSocketNotifier(fileno, QSocketNotifier.Read, self)
+            self._notifier.activated.connect(self._pump)
+        self.pumps = 0
+        self.max_pump_ms = 0.0
+
+    def create_task(self, coro):
+        """Schedule a coroutine on the bridged loop and return its Task."""
+        task = self.loop.create_task(coro)
+        self._wake()
+        return task
+
+    def run_until_complete(self, coro):
+        """Run a coroutine to completion while still processing Qt events."""
+        task = self.create_task(coro)
+        if not task.done():
+            waiter = QEventLoop()
+            task.add_done_callback(lambda _: waiter.quit())
+            waiter.exec_()
+        return task.result()
+
+    def close(self):
+        """Cancel outstanding tasks and close the asyncio loop."""
+        self._timer.stop()
+        if self._notifier is not None:
+            self._notifier.setEnabled(False)
+        if self.loop.is_closed():
+            return
+        tasks = asyncio.all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            # Let every cancelled task finish unwinding before closing
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self.loop.close()
+
+    def _wake(self):
+        if not self._timer.isActive() or self._timer.remainingTime() > 0:
+            self._timer.start(0)
+
+    def _pump(self):
+        """Run one non-blocking iteration of the asyncio loop."""
+        if self.loop.is_running() or self.loop.is_closed():
+            return
+        start = time.perf_counter()
+        ready = getattr(self.loop, "_ready", None)
+        overflow = []
+        if ready is not None:
+            while len(ready) > self.max_callbacks_per_pump:
+                overflow.append(ready.pop())
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        if overflow:
+            # Deferred callbacks keep their place ahead of newly queued ones
+            ready.extendleft(overflow)
+        self.pumps += 1
+        self.max_pump_ms = max(self.max_pump_ms, (time.perf_counter() - start) * 1000)
+        self._schedule_next()
+
+    def _schedule_next(self):
+        # The loop exposes no public "next deadline", so peek at its queues
+        ready = getattr(self.loop, "_ready", None)
+        scheduled = getattr(self.loop, "_scheduled", None)
+        if ready:
+            self._timer.start(0)
+        elif scheduled:
+            delay = max(0.0, scheduled[0].when() - self.loop.time())
+            self._timer.start(min(int(delay * 1000) + 1, 2 ** 31 - 1))
+        elif self._notifier is None and asyncio.all_tasks(self.loop):
+            # Tasks may be waiting on I/O nothing would wake the bridge for
+            self._timer.start(self.poll_interval)
+        else:
+            # Idle; create_task wakes the bridge again
+            self._timer.stop()
+
+_bridge = None
+
+def async_bridge():
+    """Return the shared bridge, creating it on first use."""
+    global _bridge
+    if _bridge is None:
+        _bridge = AsyncBridge()
+        asyncio.set_event_loop(_bridge.loop)
+    return _bridge
+
+class PageTasks(QObject):
+    """Tasks owned by a widget, cancelled when it is hidden, closed or destroyed.
+
+    Use ``page_tasks(widget).spawn(coro)`` from page code; a page that is
+    shown again simply spawns its work again.
+    """
+
+    def __init__(self, widget, bridge=None):
+        super().__init__(widget)
+        self.bridge = bridge or async_bridge()
+        self._tasks = set()
+        widget.installEventFilter(self)
+        # This scope dies with the widget, so the slot must not reference it
+        widget.destroyed.connect(functools.partial(_cancel_tasks, self._tasks))
+
+    def spawn(self, coro):
+        """Run a coroutine until it finishes or the widget goes away."""
+        task = self.bridge.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def active_count(self):
+        return len(self._tasks)
+
+    def cancel_all(self):
+        """Cancel every task still running for this widget."""
+        _cancel_tasks(self._tasks)
+
+    def eventFilter(self, watched, event):
+        if event.type() in (QEvent.Hide, QEvent.Close):
+            self.cancel_all()
+        return False
+
+def _cancel_tasks(tasks, *args):
+    for task in list(tasks):
+        task.cancel()
+
+def page_tasks(widget):
+    """Return the PageTasks scope of a widget, creating it on first use."""
+    scope = getattr(widget, "_page_tasks", None)
+    if scope is None:
+        scope = PageTasks(widget)
+        widget._page_tasks = scope
+    return scope
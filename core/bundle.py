@@ -0,0 +1,123 @@
+from PyQt5.QtCore import QByteArray
+from PyQt5.QtGui import QImage
+import json
+import mmap
+import os
+import struct
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BUNDLE_PATH = os.path.join(PROJECT_ROOT, "resources", "resources.bundle")
+
+# magic, format version, index length
+_HEADER = struct.Struct("<4sII")
+_MAGIC = b"MPQB"
+_VERSION = 2
+
+def raster_name(name, size, device_pixel_ratio):
+    return f"raster/{name}@{size}x{device_pixel_ratio:g}"
+
+def stylesheet_name(relative_path, variables_key):
+    return f"qss/{relative_path}|{variables_key}"
+
+class ResourceBundle:
+    """Read-only view of a packed resource file.
+
+    The file is a small header, a JSON index and the concatenated
+    payloads. Opening it costs one open and one mmap; every lookup after
+    that is a dict access and a slice of the mapping, so serving icons
+    and stylesheets makes no further filesystem calls.
+
+    Index entries map a name to ``[offset, length, meta]``: ``icons/<name>``
+    holds SVG source, ``raster/<name>@<size>x<dpr>`` raw premultiplied
+    ARGB32 pixels and ``qss/<file>|<variables>`` a compiled stylesheet.
+    Icon and stylesheet meta record the source file's ``mtime_ns`` and
+    ``size`` so callers can tell when a loose file has changed since, and
+    the bundle meta the ``icon_dir_mtime_ns`` of the icon directory.
+    Stylesheets keep their ``url(resources/...)`` references relative.
+    """
+
+    def __init__(self, path, mapping, index, data_offset):
+        self.path = path
+        self._mapping = mapping
+        self._data_offset = data_offset
+        self.meta = index.get("meta", {})
+        self._entries = index["entries"]
+
+    @classmethod
+    def open(cls, path=DEFAULT_BUNDLE_PATH):
+        """Map a bundle file; return None if it is missing or unreadable."""
+        try:
+            with open(path, 'rb') as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            magic, version, index_length = _HEADER.unpack_from(mapping, 0)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError("not a resource bundle")
+            start = _HEADER.size
+            index = json.loads(mapping[start:start + index_length].decode("utf-8"))
+        except (struct.error, ValueError):
+            mapping.close()
+            return None
+        return cls(path, mapping, index, start + index_length)
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def names(self, prefix=""):
+        return [name for name in self._entries if name.startswith(prefix)]
+
+    def entry_meta(self, name):
+        entry = self._entries.get(name)
+        return entry[2] if entry else None
+
+    def data(self, name):
+        """Return a zero-copy memoryview of an entry, or None."""
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        offset = self._data_offset + entry[0]
+        return memoryview(self._mapping)[offset:offset + entry[1]]
+
+    def text(self, name):
+        data = self.data(name)
+        return bytes(data).decode("utf-8") if data is not None else None
+
+    def svg(self, name):
+        """Return the SVG source of an icon as a QByteArray, or None."""
+        data = self.data(f"icons/{name}")
+        return QByteArray(bytes(data)) if data is not None else None
+
+    def image(self, name, size, device_pixel_ratio=1.0):
+        """Return a pre-rasterized icon as a QImage, or None if not packed."""
+        key = raster_name(name, size, device_pixel_ratio)
+        data = self.data(key)
+        if data is None:
+            return None
+        width, height = self._entries[key][2]["size"]
+        # Copy so the image does not outlive the mapping it points into
+        image = QImage(bytes(data), width, height, width * 4,
+                       QImage.Format_ARGB32_Premultiplied).copy()
+        image.setDevicePixelRatio(device_pixel_ratio)
+        return image
+
+    def close(self):
+        self._mapping.close()
+
+def write_bundle(path, entries, meta=None):
+    """Write (name, payload bytes, meta) entries to a bundle file atomically."""
+    index = {}
+    offset = 0
+    for name, payload, entry_meta in entries:
+        index[name] = [offset, len(payload), entry_meta]
+        offset += len(payload)
+    index_bytes = json.dumps({"meta": meta or {}, "entries": index},
+                             separators=(",", ":")).encode("utf-8")
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, len(index_bytes)))
+        f.write(index_bytes)
+        for _, payload, _ in entries:
+            f.write(payload)
+    os.replace(tmp_path, path)
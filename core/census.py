@@ -0,0 +1,104 @@
+from PyQt5.QtCore import QObject, QTimer, QAbstractAnimation
+from PyQt5.QtWidgets import QWidget, QLabel, QGraphicsEffect
+from PyQt5.QtGui import QPixmap, QImage
+import json
+
+# Rough resident size of a bare QObject and of a QWidget with its private data
+OBJECT_BYTES = 160
+WIDGET_BYTES = 1024
+
+COUNT_KEYS = ("qobjects", "widgets", "effects", "animations", "timers",
+              "pixmaps", "pixmap_bytes", "approx_bytes")
+
+def image_bytes(image):
+    """Return the pixel memory of a QPixmap or QImage."""
+    if image is None or image.isNull():
+        return 0
+    return image.width() * image.height() * image.depth() // 8
+
+def _held_images(obj):
+    """Yield pixmaps and images held by an object, in Qt or as Python attributes."""
+    if isinstance(obj, QLabel):
+        pixmap = obj.pixmap()
+        if pixmap is not None:
+            yield pixmap
+    for value in getattr(obj, "__dict__", {}).values():
+        if isinstance(value, (QPixmap, QImage)):
+            yield value
+
+def count_objects(root):
+    """Count the objects under root (inclusive) and estimate their memory.
+
+    Pixmaps shown by labels or kept as Python attributes are counted once
+    each by cache key; shared cache entries are reported separately by
+    the caches themselves.
+    """
+    counts = dict.fromkeys(COUNT_KEYS, 0)
+    seen_images = set()
+    seen_effects = set()
+    for obj in [root] + root.findChildren(QObject):
+        counts["qobjects"] += 1
+        if isinstance(obj, QWidget):
+            counts["widgets"] += 1
+            effect = obj.graphicsEffect()
+            if effect is not None and id(effect) not in seen_effects:
+                seen_effects.add(id(effect))
+                counts["effects"] += 1
+        elif isinstance(obj, QGraphicsEffect) and id(obj) not in seen_effects:
+            seen_effects.add(id(obj))
+            counts["effects"] += 1
+        elif isinstance(obj, QAbstractAnimation):
+            counts["animations"] += 1
+        elif isinstance(obj, QTimer):
+            counts["timers"] += 1
+        for image in _held_images(obj):
+            if image.cacheKey() not in seen_images:
+                seen_images.add(image.cacheKey())
+                counts["pixmaps"] += 1
+                counts["pixmap_bytes"] += image_bytes(image)
+    counts["approx_bytes"] = (counts["qobjects"] * OBJECT_BYTES
+                              + counts["widgets"] * (WIDGET_BYTES - OBJECT_BYTES)
+                              + counts["pixmap_bytes"])
+    return counts
+
+class CensusSnapshot:
+    """Per-section object counts taken at one point in time.
+
+    Two snapshots can be diffed to spot sections that keep growing, for
+    example across repeated page switches.
+    """
+
+    def __init__(self, sections):
+        self.sections = sections
+
+    def total(self):
+        """Return the counts summed over every section."""
+        total = dict.fromkeys(COUNT_KEYS, 0)
+        for counts in self.sections.values():
+            for key in COUNT_KEYS:
+                total[key] += counts.get(key, 0)
+        return total
+
+    def diff(self, earlier):
+        """Return {section: {key: change}} for every count that changed since earlier."""
+        changes = {}
+        for name in set(self.sections) | set(earlier.sections):
+            after = self.sections.get(name, {})
+            before = earlier.sections.get(name, {})
+            delta = {key: after.get(key, 0) - before.get(key, 0) for key in COUNT_KEYS}
+            delta = {key: value for key, value in delta.items() if value}
+            if delta:
+                changes[name] = delta
+        return changes
+
+    def to_json(self):
+        return json.dumps({"sections": self.sections, "total": self.total()}, indent=1)
+
+def take_census(roots, shared=None):
+    """Snapshot {name: root QObject} sections plus precomputed shared counts."""
+    sections = {name: count_objects(root) for name, root in roots.items()}
+    for name, counts in (shared or {}).items():
+        counts = dict(dict.fromkeys(COUNT_KEYS, 0), **counts)
+        counts["approx_bytes"] = counts["approx_bytes"] or counts["pixmap_bytes"]
+        sections[name] = counts
+    return CensusSnapshot(sections)
@@ -0,0 +1,148 @@
+from PyQt5.QtCore import QObject, QThread, QTimer, pyqtSignal
+import random
+import threading
+
+class DataProvider:
+    """Source of live metric values.
+
+    ``fetch`` is called on a background thread and returns a dict mapping
+    metric keys to raw values. It must not touch any widgets.
+    """
+
+    def fetch(self):
+        raise NotImplementedError
+
+class LocalDataProvider(DataProvider):
+    """Offline stand-in provider that random-walks a fixed set of metrics."""
+
+    def __init__(self, initial=None, volatility=0.01, seed=None):
+        self.values = dict(initial or {
+            'active_users': 1234,
+            'total_revenue': 5678.0,
+            'growth_rate': 12.3
+        })
+        self.volatility = volatility
+        self._random = random.Random(seed)
+
+    def fetch(self):
+        for key, value in self.values.items():
+            new_value = value + value * self.volatility * self._random.uniform(-1, 1)
+            self.values[key] = round(new_value) if isinstance(value, int) else new_value
+        return dict(self.values)
+
+# Poll threads that have not exited yet, including ones told to stop
+_threads = set()
+
+class _PollThread(QThread):
+    """Calls the provider in a loop and merges results into the pending dict.
+
+    Stopping only signals the loop, so a slow fetch never blocks the GUI
+    thread; the thread deletes itself once it has exited.
+    """
+
+    def __init__(self, feed):
+        super().__init__()
+        self.feed = feed
+        self._stopping = threading.Event()
+        _threads.add(self)
+        self.finished.connect(self._exited)
+
+    def run(self):
+        while not self._stopping.is_set():
+            try:
+                values = self.feed.provider.fetch()
+            except Exception as exc:
+                self.feed.last_error = exc
+            else:
+                self.feed._merge(values)
+            self._stopping.wait(self.feed.poll_interval)
+
+    def stop(self):
+        self._stopping.set()
+
+    def _exited(self):
+        _threads.discard(self)
+        self.deleteLater()
+
+class MetricFeed(QObject):
+    """Pulls metrics on a worker thread and applies them at a capped frame rate.
+
+    Values arriving between frames are coalesced per key, so only the
+    latest one is applied, and bindings are only called for keys whose
+    value actually changed since the last frame.
+    """
+
+    # Emitted on the GUI thread with the keys applied in a frame
+    updated = pyqtSignal(list)
+
+    def __init__(self, provider, poll_interval=0.05, max_fps=30, parent=None):
+        super().__init__(parent)
+        self.provider = provider
+        self.poll_interval = poll_interval
+        self.last_error = None
+        self._bindings = {}
+        self._applied = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setInterval(max(1, 1000 // max_fps))
+        self._frame_timer.timeout.connect(self.flush)
+        self.updates_received = 0
+        self.updates_applied = 0
+
+    def bind(self, key, callback, formatter=str):
+        """Call callback(formatter(value)) on the GUI thread when key changes."""
+        self._bindings.setdefault(key, []).append((callback, formatter))
+
+    def is_running(self):
+        return self._thread is not None
+
+    def start(self):
+        """Start polling the provider and applying updates."""
+        if self._thread is not None:
+            return
+        self._thread = _PollThread(self)
+        self._thread.start()
+        self._frame_timer.start()
+
+    def stop(self):
+        """Stop polling without waiting; pending values are applied one last time."""
+        if self._thread is None:
+            return
+        self._thread.stop()
+        self._thread = None
+        self._frame_timer.stop()
+        self.flush()
+
+    def push(self, values):
+        """Queue values from any thread as if the provider had returned them."""
+        self._merge(values)
+
+    def _merge(self, values):
+        with self._lock:
+            self._pending.update(values)
+            self.updates_received += len(values)
+
+    def flush(self):
+        """Apply coalesced pending values to their bindings."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        changed = []
+        for key, value in pending.items():
+            if key in self._applied and self._applied[key] == value:
+                continue
+            self._applied[key] = value
+            for callback, formatter in self._bindings.get(key, ()):
+                callback(formatter(value))
+            changed.append(key)
+        if changed:
+            self.updates_applied += len(changed)
+            self.updated.emit(changed)
+
+def stop_metric_feeds():
+    """Stop every feed's poll thread and wait for them to exit, e.g. on close."""
+    for thread in list(_threads):
+        thread.stop()
+    for thread in list(_threads):
+        thread.wait()
@@ -0,0 +1,269 @@
+from PyQt5.QtCore import Qt, QSize, QRectF
+from PyQt5.QtGui import QIcon, QImage, QPainter, QPixmap
+from PyQt5.QtSvg import QSvgRenderer
+from collections import OrderedDict
+import os
+import threading
+from core.profiler import profiler
+from core.bundle import raster_name
+from core.census import image_bytes
+
+ICON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        "resources", "icons")
+
+def render_svg(source, size, device_pixel_ratio=1.0):
+    """Rasterize an SVG file path or QByteArray into a transparent QImage.
+
+    QImage painting is safe outside the GUI thread, so this is what the
+    background pre-warm uses; QPixmaps are only created on the GUI thread.
+    """
+    renderer = QSvgRenderer(source)
+    if not renderer.isValid():
+        return QImage()
+    pixels = int(round(size * device_pixel_ratio))
+    image = QImage(pixels, pixels, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    renderer.render(painter, QRectF(0, 0, pixels, pixels))
+    painter.end()
+    image.setDevicePixelRatio(device_pixel_ratio)
+    return image
+
+class IconCache:
+    """Process-wide cache of icon paths, QIcons and rasterized pixmaps.
+
+    Pixmaps are keyed by (name, size, device pixel ratio) and evicted
+    least recently used first once ``max_pixmaps`` is exceeded. Prewarmed
+    images that have not been used yet count towards that limit and are
+    evicted first. Missing icons are remembered too, so repeated lookups
+    never touch the disk. With a ResourceBundle attached, packed rasters
+    and SVG sources are used before the loose files in ``icon_dir``.
+    The bundle is trusted as a whole while ``icon_dir`` keeps the mtime
+    recorded at build time, which costs one stat; after icons were
+    added, removed or replaced, each is checked against its own mtime
+    and size instead.
+    """
+
+    def __init__(self, icon_dir=ICON_DIR, max_pixmaps=256, bundle=None):
+        self.icon_dir = icon_dir
+        self.max_pixmaps = max_pixmaps
+        self.bundle = bundle
+        self._paths = {}
+        # name -> whether the bundle's copy is current, for self._packed_bundle
+        self._packed = {}
+        self._packed_bundle = None
+        self._packed_all = False
+        self._icons = {}
+        self._pixmaps = OrderedDict()
+        self._prewarmed = OrderedDict()
+        self._lock = threading.Lock()
+        self._prewarm_thread = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def icon_path(self, name):
+        """Return the SVG path for an icon name, or None if it doesn't exist."""
+        try:
+            return self._paths[name]
+        except KeyError:
+            path = os.path.join(self.icon_dir, f"{name}.svg")
+            self._paths[name] = path if os.path.exists(path) else None
+            return self._paths[name]
+
+    def _is_packed(self, name):
+        """Return whether the bundle holds a current copy of an icon."""
+        if self.bundle is None:
+            return False
+        if self._packed_bundle is not self.bundle:
+            self._packed = {}
+            self._packed_bundle = self.bundle
+            self._packed_all = self._icon_dir_unchanged()
+        if self._packed_all:
+            return f"icons/{name}" in self.bundle
+        packed = self._packed.get(name)
+        if packed is None:
+            entry = f"icons/{name}"
+            try:
+                stat = os.stat(os.path.join(self.icon_dir, f"{name}.svg"))
+            except OSError:
+                # Packaged builds may ship only the bundle
+                packed = entry in self.bundle
+            else:
+                meta = self.bundle.entry_meta(entry)
+                packed = bool(meta) and (meta["mtime_ns"], meta["size"]) == (stat.st_mtime_ns, stat.st_size)
+            self._packed[name] = packed
+        return packed
+
+    def _icon_dir_unchanged(self):
+        """Return whether icon_dir is absent or as it was when the bundle was built."""
+        try:
+            stat = os.stat(self.icon_dir)
+        except OSError:
+            # Packaged builds may ship only the bundle
+            return True
+        return self.bundle.meta.get("icon_dir_mtime_ns") == stat.st_mtime_ns
+
+    def _source(self, name):
+        """Return the SVG source for a name: packed bytes, a loose path or None."""
+        if self._is_packed(name):
+            svg = self.bundle.svg(name)
+            if svg is not None:
+                return svg
+        return self.icon_path(name)
+
+    def icon(self, name):
+        """Return a shared QIcon for the given icon name."""
+        icon = self._icons.get(name)
+        if icon is not None:
+            self.hits += 1
+            return icon
+        self.misses += 1
+        with profiler.span(f"icon {name}", "icon"):
+            icon = self._bundled_icon(name)
+            if icon is None:
+                path = self.icon_path(name)
+                # Empty icon if the file doesn't exist
+                icon = QIcon(path) if path else QIcon()
+        self._icons[name] = icon
+        return icon
+
+    def _bundled_icon(self, name):
+        """Return a QIcon holding every packed raster of name, or None."""
+        if not self._is_packed(name):
+            return None
+        variants = self.bundle.names(f"raster/{name}@")
+        if not variants:
+            return None
+        icon = QIcon()
+        for variant in variants:
+            meta = self.bundle.entry_meta(variant)
+            icon.addPixmap(self.pixmap(name, meta["icon_size"], meta["dpr"]))
+        return icon
+
+    def sized_icon(self, name, size, device_pixel_ratio=1.0):
+        """Return a shared QIcon backed by a single cached raster.
+
+        The icon is dropped along with its pixmap when that is evicted.
+        """
+        key = (name, size, device_pixel_ratio)
+        icon = self._icons.get(key)
+        if icon is not None:
+            self.hits += 1
+            self._pixmaps.move_to_end(key)
+            return icon
+        icon = QIcon(self.pixmap(name, size, device_pixel_ratio))
+        self._icons[key] = icon
+        return icon
+
+    def pixmap(self, name, size, device_pixel_ratio=1.0):
+        """Return a cached pixmap of the icon rendered at size x size."""
+        if isinstance(size, QSize):
+            size = size.width()
+        key = (name, size, device_pixel_ratio)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            self._pixmaps.move_to_end(key)
+            return pixmap
+
+        with self._lock:
+            image = self._prewarmed.pop(key, None)
+        if image is None and self._is_packed(name):
+            image = self.bundle.image(name, size, device_pixel_ratio)
+        if image is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            with profiler.span(f"rasterize {name}@{size}", "icon"):
+                source = self._source(name)
+                image = render_svg(source, size, device_pixel_ratio) if source else QImage()
+
+        pixmap = QPixmap.fromImage(image)
+        self._pixmaps[key] = pixmap
+        with self._lock:
+            self._evict()
+        return pixmap
+
+    def _evict(self, pixmaps=True):
+        """Evict down to max_pixmaps entries; the caller holds the lock.
+
+        Unused prewarmed images go first. Pixmaps may only be released
+        on the GUI thread, so other threads pass pixmaps=False.
+        """
+        while len(self._pixmaps) + len(self._prewarmed) > self.max_pixmaps:
+            if self._prewarmed:
+                self._prewarmed.popitem(last=False)
+            elif pixmaps:
+                key, _ = self._pixmaps.popitem(last=False)
+                # A sized icon would keep the evicted pixmap alive
+                self._icons.pop(key, None)
+            else:
+                break
+            self.evictions += 1
+
+    def prewarm(self, specs, device_pixel_ratio=1.0):
+        """Rasterize (name, size) pairs on a background thread.
+
+        Lookups made before the thread finishes simply render inline,
+        and the thread then skips the icons that were.
+        """
+        pending = []
+        for name, size in specs:
+            key = (name, size, device_pixel_ratio)
+            if key in self._pixmaps:
+                continue
+            if self._is_packed(name) and raster_name(*key) in self.bundle:
+                # Already rasterized at build time
+                continue
+            source = self._source(name)
+            if source:
+                pending.append((key, source))
+
+        def worker():
+            for key, source in pending:
+                if key in self._pixmaps:
+                    continue
+                with profiler.span(f"prewarm {key[0]}@{key[1]}", "icon"):
+                    image = render_svg(source, key[1], key[2])
+                with self._lock:
+                    if key not in self._pixmaps:
+                        self._prewarmed[key] = image
+                        self._evict(pixmaps=False)
+
+        self._prewarm_thread = threading.Thread(target=worker, name="icon-prewarm", daemon=True)
+        self._prewarm_thread.start()
+        return self._prewarm_thread
+
+    def stats(self):
+        """Return hit/miss counters and current cache sizes."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'icons': len(self._icons),
+            'pixmaps': len(self._pixmaps),
+            'prewarmed': len(self._prewarmed)
+        }
+
+    def memory(self):
+        """Return the number and pixel bytes of the cached pixmaps and prewarmed images."""
+        with self._lock:
+            images = list(self._pixmaps.values()) + list(self._prewarmed.values())
+        return {
+            'pixmaps': len(images),
+            'pixmap_bytes': sum(image_bytes(image) for image in images)
+        }
+
+    def clear(self):
+        """Drop every cached entry and reset the counters."""
+        with self._lock:
+            self._prewarmed.clear()
+        self._paths.clear()
+        self._packed.clear()
+        self._icons.clear()
+        self._pixmaps.clear()
+        self.hits = self.misses = self.evictions = 0
+
+# Shared instance used by core.utils.get_icon
+icon_cache = IconCache()
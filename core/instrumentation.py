@@ -0,0 +1,124 @@
+from PyQt5.QtCore import QObject, QEvent, QTimer, QElapsedTimer, pyqtSignal
+from PyQt5.QtWidgets import QApplication
+from collections import defaultdict
+import time
+
+class Instrumentation(QObject):
+    """Samples event-loop lag, paint times, repolishes and counter rates.
+
+    Nothing is hooked while disabled. When enabled, an application-wide
+    event filter times every paint event and counts style changes, a
+    probe timer measures how late the event loop runs it, and registered
+    counters are turned into per-second rates. A ``sampled`` signal
+    carries a snapshot of the last window every ``window_ms``.
+    """
+
+    sampled = pyqtSignal(dict)
+
+    def __init__(self, window_ms=1000, probe_ms=50, parent=None):
+        super().__init__(parent)
+        self.enabled = False
+        self.window_ms = window_ms
+        self.probe_ms = probe_ms
+        self.page_resolver = None
+        self.ignored = set()
+        self._delivering = None
+        self._counters = {}
+        self._counter_values = {}
+        self._reset_window()
+        self.latest = {}
+
+        self._probe = QTimer(self)
+        self._probe.setInterval(probe_ms)
+        self._probe.timeout.connect(self._on_probe)
+        self._probe_clock = QElapsedTimer()
+        self._window_timer = QTimer(self)
+        self._window_timer.setInterval(window_ms)
+        self._window_timer.timeout.connect(self._on_window)
+
+    def add_counter(self, name, read):
+        """Report the per-second rate of a monotonically increasing counter."""
+        self._counters[name] = read
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        self._reset_window()
+        self._counter_values = {name: read() for name, read in self._counters.items()}
+        QApplication.instance().installEventFilter(self)
+        self._probe_clock.start()
+        self._probe.start()
+        self._window_timer.start()
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        QApplication.instance().removeEventFilter(self)
+        self._probe.stop()
+        self._window_timer.stop()
+
+    def set_enabled(self, enabled):
+        if enabled:
+            self.enable()
+        else:
+            self.disable()
+
+    def _reset_window(self):
+        self._paint_by_page = defaultdict(float)
+        self._paint_by_class = defaultdict(float)
+        self._paint_count = 0
+        self._repolish = 0
+        self._lag_max = 0.0
+        self._lag_total = 0.0
+        self._lag_samples = 0
+
+    def eventFilter(self, watched, event):
+        kind = event.type()
+        if (kind == QEvent.Paint and watched is not self._delivering
+                and watched.isWidgetType() and watched not in self.ignored):
+            # Re-send the paint ourselves so it can be timed; the nested
+            # delivery passes straight through this filter
+            self._delivering = watched
+            start = time.perf_counter()
+            try:
+                QApplication.sendEvent(watched, event)
+            finally:
+                self._delivering = None
+            elapsed = (time.perf_counter() - start) * 1000
+            self._paint_count += 1
+            self._paint_by_class[type(watched).__name__] += elapsed
+            if self.page_resolver is not None:
+                page = self.page_resolver(watched)
+                if page:
+                    self._paint_by_page[page] += elapsed
+            return True
+        if kind in (QEvent.StyleChange, QEvent.Polish):
+            self._repolish += 1
+        return False
+
+    def _on_probe(self):
+        lag = max(0.0, self._probe_clock.restart() - self.probe_ms)
+        self._lag_max = max(self._lag_max, lag)
+        self._lag_total += lag
+        self._lag_samples += 1
+
+    def _on_window(self):
+        seconds = self.window_ms / 1000
+        rates = {}
+        for name, read in self._counters.items():
+            value = read()
+            rates[name] = (value - self._counter_values.get(name, value)) / seconds
+            self._counter_values[name] = value
+        self.latest = {
+            'lag_max_ms': self._lag_max,
+            'lag_avg_ms': self._lag_total / self._lag_samples if self._lag_samples else 0.0,
+            'paints_per_s': self._paint_count / seconds,
+            'paint_ms_by_page': dict(self._paint_by_page),
+            'paint_ms_by_class': dict(self._paint_by_class),
+            'repolish_per_s': self._repolish / seconds,
+            'rates': rates
+        }
+        self._reset_window()
+        self.sampled.emit(self.latest)
@@ -0,0 +1,145 @@
+from PyQt5.QtCore import QObject, QEvent, QTimer
+from contextlib import contextmanager
+import json
+import os
+import threading
+import time
+
+class StartupProfiler:
+    """Records a timeline of named spans and instant marks.
+
+    Disabled by default; while disabled ``span`` and ``mark`` cost a
+    single attribute check. Times are in seconds relative to ``origin``,
+    which is when this module was first imported.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.enabled = False
+        self.events = []
+        self._lock = threading.Lock()
+
+    def enable(self):
+        self.enabled = True
+
+    def now(self):
+        """Return seconds since the profiler origin."""
+        return time.perf_counter() - self.origin
+
+    @contextmanager
+    def span(self, name, category="startup"):
+        """Record the duration of the enclosed block."""
+        if not self.enabled:
+            yield
+            return
+        start = self.now()
+        try:
+            yield
+        finally:
+            self._record(name, category, start, self.now() - start)
+
+    def mark(self, name, category="startup"):
+        """Record an instant event."""
+        if self.enabled:
+            self._record(name, category, self.now(), None)
+
+    def _record(self, name, category, start, duration):
+        with self._lock:
+            self.events.append({
+                'name': name,
+                'cat': category,
+                'start': start,
+                'duration': duration,
+                'thread': threading.current_thread().name,
+                'thread_id': threading.get_ident()
+            })
+
+    def find(self, name):
+        """Return the first recorded event with the given name, or None."""
+        for event in self.events:
+            if event['name'] == name:
+                return event
+        return None
+
+    def to_json(self):
+        """Return the timeline as a plain dict with millisecond times."""
+        first_frame = self.find("first_frame")
+        return {
+            'time_to_first_frame_ms': first_frame['start'] * 1000 if first_frame else None,
+            'events': [
+                {
+                    'name': event['name'],
+                    'cat': event['cat'],
+                    'start_ms': event['start'] * 1000,
+                    'duration_ms': event['duration'] * 1000 if event['duration'] is not None else None,
+                    'thread': event['thread']
+                }
+                for event in self.events
+            ]
+        }
+
+    def to_chrome_trace(self):
+        """Return the timeline in Chrome trace event format (chrome://tracing).
+
+        Threads get small integer ids in order of first appearance, each
+        named by a "thread_name" metadata event.
+        """
+        pid = os.getpid()
+        trace = []
+        # Idents are reused once a thread exits, so the name is part of the key
+        tids = {}
+        for event in self.events:
+            thread = (event['thread_id'], event['thread'])
+            if thread not in tids:
+                tids[thread] = len(tids) + 1
+                trace.append({'name': 'thread_name', 'ph': 'M', 'pid': pid,
+                              'tid': tids[thread], 'args': {'name': event['thread']}})
+            entry = {
+                'name': event['name'],
+                'cat': event['cat'],
+                'ts': event['start'] * 1e6,
+                'pid': pid,
+                'tid': tids[thread]
+            }
+            if event['duration'] is None:
+                entry.update(ph='i', s='p')
+            else:
+                entry.update(ph='X', dur=event['duration'] * 1e6)
+            trace.append(entry)
+        return {'traceEvents': trace, 'displayTimeUnit': 'ms'}
+
+    def dump(self, path, fmt="json"):
+        """Write the timeline to path as "json" or "chrome" format."""
+        data = self.to_chrome_trace() if fmt == "chrome" else self.to_json()
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=1)
+
+class FirstFrameWatcher(QObject):
+    """Marks the first paint of a window and the end of that frame.
+
+    ``first_paint`` is recorded when the window receives its first paint
+    event and ``first_frame`` once control returns to the event loop
+    after it, then ``callback`` is called if given.
+    """
+
+    def __init__(self, window, profiler, callback=None):
+        super().__init__(window)
+        self.window = window
+        self.profiler = profiler
+        self.callback = callback
+        window.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint:
+            self.window.removeEventFilter(self)
+            self.profiler.mark("first_paint")
+            QTimer.singleShot(0, self._frame_done)
+        return False
+
+    def _frame_done(self):
+        self.profiler.mark("first_frame")
+        if self.callback:
+            self.callback()
+
+# Shared instance used by the startup path
+profiler = StartupProfiler()
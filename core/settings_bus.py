@@ -0,0 +1,103 @@
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from collections import namedtuple
+from contextlib import contextmanager
+
+# changes maps dotted keys to new values; folded is the number of raw
+# publishes that were coalesced into this delivery
+SettingsDelta = namedtuple("SettingsDelta", "changes folded")
+
+class SettingsBus(QObject):
+    """Coalesces fine-grained setting changes into batched deliveries.
+
+    Publishes are collected and delivered once per event-loop tick, or
+    once ``quiet_period`` milliseconds have passed without a publish.
+    Inside ``transaction()`` nothing is delivered until the outermost
+    block exits. Keys that end up back at their last delivered value are
+    dropped from the diff.
+    """
+
+    # Emitted with every delivery: (changes, folded)
+    delivered = pyqtSignal(dict, int)
+
+    def __init__(self, quiet_period=0, parent=None):
+        super().__init__(parent)
+        self._subscribers = {}
+        self._next_handle = 0
+        self._state = {}
+        self._pending = {}
+        self._folded = 0
+        self._depth = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(quiet_period)
+        self._timer.timeout.connect(self.deliver)
+        self.raw_changes = 0
+        self.deliveries = 0
+
+    def set_quiet_period(self, milliseconds):
+        self._timer.setInterval(milliseconds)
+
+    def seed(self, values):
+        """Set the baseline state without delivering anything."""
+        self._state.update(values)
+
+    def value(self, key, default=None):
+        """Return the last delivered value of a key."""
+        return self._state.get(key, default)
+
+    def subscribe(self, callback, prefix=""):
+        """Call callback(SettingsDelta) for deliveries touching keys under prefix.
+
+        Returns a handle for unsubscribe().
+        """
+        handle = self._next_handle
+        self._next_handle += 1
+        self._subscribers[handle] = (prefix, callback)
+        return handle
+
+    def unsubscribe(self, handle):
+        self._subscribers.pop(handle, None)
+
+    def publish(self, key, value):
+        """Record a raw change; it is delivered on a later tick."""
+        self._pending[key] = value
+        self._folded += 1
+        self.raw_changes += 1
+        if self._depth == 0:
+            # Restarting the timer extends the quiet period
+            self._timer.start()
+
+    @contextmanager
+    def transaction(self):
+        """Group every publish inside the block into one delivery."""
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0 and self._pending:
+                self._timer.start()
+
+    def deliver(self):
+        """Deliver pending changes now."""
+        self._timer.stop()
+        if self._depth or not self._pending:
+            return
+        changes = {key: value for key, value in self._pending.items()
+                   if key not in self._state or self._state[key] != value}
+        folded = self._folded
+        self._pending = {}
+        self._folded = 0
+        if not changes:
+            return
+        self._state.update(changes)
+        self.deliveries += 1
+
+        for prefix, callback in list(self._subscribers.values()):
+            if prefix:
+                filtered = {key: value for key, value in changes.items() if key.startswith(prefix)}
+                if filtered:
+                    callback(SettingsDelta(filtered, folded))
+            else:
+                callback(SettingsDelta(changes, folded))
+        self.delivered.emit(changes, folded)
@@ -0,0 +1,160 @@
+import json
+import os
+import threading
+import time
+
+DEFAULT_SETTINGS_PATH = os.path.join(
+    os.environ.get("XDG_CONFIG_HOME", os.path.join(os.path.expanduser("~"), ".config")),
+    "modern-pyqt5-app", "settings.json"
+)
+
+def flatten(settings, prefix=""):
+    """Flatten nested dicts into a single dict with dotted keys."""
+    flat = {}
+    for key, value in settings.items():
+        dotted = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{dotted}."))
+        else:
+            flat[dotted] = value
+    return flat
+
+class SettingsStore:
+    """JSON settings file written atomically on a background thread.
+
+    Settings are kept as a flat dict of dotted keys. Each key's value is
+    JSON-encoded once when it changes and the file is assembled from
+    those cached fragments, so a save only serializes what changed.
+    Saves within ``debounce`` seconds of each other are coalesced into a
+    single write, which goes through a temp file and os.replace so the
+    file on disk is always either the old or the new version.
+    """
+
+    def __init__(self, path=DEFAULT_SETTINGS_PATH, debounce=0.25):
+        self.path = path
+        self.debounce = debounce
+        self._values = {}
+        self._encoded = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._last_change = 0.0
+        self._closed = False
+        self._thread = None
+        self.last_error = None
+        self.saves_requested = 0
+        self.writes = 0
+        self.last_load_seconds = 0.0
+        self.last_write_seconds = 0.0
+
+    def load(self):
+        """Read the settings file synchronously; a missing file loads empty."""
+        start = time.perf_counter()
+        try:
+            with open(self.path, 'r') as f:
+                values = json.load(f)
+        except FileNotFoundError:
+            values = {}
+        except (OSError, ValueError) as exc:
+            self.last_error = exc
+            values = {}
+        with self._lock:
+            self._values = flatten(values)
+            self._encoded = {key: json.dumps(value) for key, value in self._values.items()}
+        self.last_load_seconds = time.perf_counter() - start
+        return dict(self._values)
+
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+
+    def snapshot(self):
+        """Return a copy of every setting as a flat dotted-key dict."""
+        with self._lock:
+            return dict(self._values)
+
+    def update(self, settings):
+        """Merge settings (nested or dotted) and schedule a write if anything changed.
+
+        Returns the list of keys whose value changed.
+        """
+        changed = []
+        with self._lock:
+            for key, value in flatten(settings).items():
+                if key in self._values and self._values[key] == value:
+                    continue
+                self._values[key] = value
+                self._encoded[key] = json.dumps(value)
+                changed.append(key)
+            self.saves_requested += 1
+            if changed:
+                self._dirty = True
+                self._last_change = time.monotonic()
+                self._ensure_thread()
+                self._wake.notify()
+        return changed
+
+    def flush(self):
+        """Write pending changes now, on the calling thread."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            payload = self._render()
+        self._write(payload)
+
+    def close(self):
+        """Flush pending changes and stop the writer thread."""
+        with self._lock:
+            self._closed = True
+            self._wake.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _ensure_thread(self):
+        if self._thread is None and not self._closed:
+            self._thread = threading.Thread(target=self._run, name="settings-writer", daemon=True)
+            self._thread.start()
+
+    def _render(self):
+        """Assemble the JSON document from the cached per-key fragments."""
+        items = ",\n".join(f"  {json.dumps(key)}: {self._encoded[key]}" for key in sorted(self._encoded))
+        return "{\n" + items + "\n}\n"
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while not self._dirty and not self._closed:
+                    self._wake.wait()
+                if self._closed:
+                    return
+                # Wait for a quiet period so rapid saves coalesce
+                remaining = self._last_change + self.debounce - time.monotonic()
+                if remaining > 0:
+                    self._wake.wait(remaining)
+                    continue
+                self._dirty = False
+                payload = self._render()
+            self._write(payload)
+
+    def _write(self, payload):
+        with self._write_lock:
+            self._write_file(payload)
+
+    def _write_file(self, payload):
+        start = time.perf_counter()
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            self.last_error = exc
+            return
+        self.writes += 1
+        self.last_write_seconds = time.perf_counter() - start
@@ -0,0 +1,186 @@
+import hashlib
+import json
+import os
+import re
+from core.bundle import stylesheet_name
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+    "modern-pyqt5-app", "qss"
+)
+
+# "@name: value;" on its own line declares a variable
+_DECLARATION_RE = re.compile(r"^[ \t]*@([A-Za-z_][\w-]*)[ \t]*:[ \t]*([^;\n]+);[ \t]*\n?", re.M)
+_REFERENCE_RE = re.compile(r"@([A-Za-z_][\w-]*)")
+_RESOURCE_URL_RE = re.compile(r"""url\((["']?)resources/""")
+
+def parse_variables(source):
+    """Split QSS source into its variable declarations and the remaining body."""
+    variables = {name: value.strip() for name, value in _DECLARATION_RE.findall(source)}
+    return variables, _DECLARATION_RE.sub("", source)
+
+def _write_atomic(path, text):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+class StylesheetCompiler:
+    """Compiles QSS with named variables and caches the result on disk.
+
+    Compiled stylesheets are stored under the hash of everything that
+    went into them. A small index maps each source file's mtime and size
+    to its compiled hash, so a warm launch costs one stat and one read of
+    the compiled file; the source itself is never read or rewritten.
+    Compiled files the index no longer refers to are deleted whenever it
+    is rewritten. When a ResourceBundle is attached, stylesheets packed
+    in it are used first, as long as the source file is unchanged or
+    absent.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, resource_dir=None, bundle=None):
+        self.cache_dir = cache_dir
+        self.resource_dir = resource_dir or os.path.join(PROJECT_ROOT, "resources")
+        self.bundle = bundle
+        self._index = None
+        self._memory = {}
+
+    def compile(self, source, variables=None, resolve_urls=True):
+        """Return compiled QSS for source, with variables overriding its own.
+
+        Unless resolve_urls is False, ``url(resources/...)`` references are
+        made absolute under ``resource_dir``.
+        """
+        declared, body = parse_variables(source)
+        if variables:
+            declared.update(variables)
+
+        def substitute(match):
+            name = match.group(1)
+            if name not in declared:
+                raise ValueError(f"Undefined stylesheet variable: @{name}")
+            return declared[name]
+
+        body = _REFERENCE_RE.sub(substitute, body)
+        return self.resolve_urls(body) if resolve_urls else body
+
+    def resolve_urls(self, style):
+        """Point ``url(resources/...)`` references in style at ``resource_dir``."""
+        res_dir = self.resource_dir.replace("\\", "/")
+        return _RESOURCE_URL_RE.sub(lambda m: f"url({m.group(1)}{res_dir}/", style)
+
+    def load(self, qss_file, variables=None):
+        """Return the compiled stylesheet for a file, using the caches."""
+        if not os.path.isabs(qss_file):
+            qss_file = os.path.join(PROJECT_ROOT, qss_file)
+        variables_key = json.dumps(variables or {}, sort_keys=True)
+        try:
+            stat = os.stat(qss_file)
+        except OSError:
+            # Packaged builds may ship only the bundle
+            if self.bundle is None:
+                raise
+            stat = None
+        memory_key = (qss_file, stat and stat.st_mtime_ns, stat and stat.st_size, variables_key)
+        if memory_key in self._memory:
+            return self._memory[memory_key]
+
+        style = self._from_bundle(qss_file, variables_key, stat)
+        if style is not None:
+            self._memory[memory_key] = style
+            return style
+        if stat is None:
+            raise FileNotFoundError(qss_file)
+
+        index_key = f"{qss_file}|{variables_key}|{self.resource_dir}"
+        entry = self._load_index().get(index_key)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            try:
+                with open(self._compiled_path(entry["digest"]), 'r') as f:
+                    style = f.read()
+                self._memory[memory_key] = style
+                return style
+            except OSError:
+                pass
+
+        with open(qss_file, 'r') as f:
+            source = f.read()
+        style = self.compile(source, variables)
+        digest = hashlib.sha256(
+            "\0".join((source, variables_key, self.resource_dir)).encode("utf-8")
+        ).hexdigest()
+        self._store(index_key, digest, stat, style)
+        self._memory[memory_key] = style
+        return style
+
+    def _from_bundle(self, qss_file, variables_key, stat):
+        """Return the packed stylesheet if it is still current, else None."""
+        if self.bundle is None:
+            return None
+        # Packed names are relative to the directory holding resources/
+        relative_path = os.path.relpath(qss_file, os.path.dirname(self.resource_dir))
+        name = stylesheet_name(relative_path.replace("\\", "/"), variables_key)
+        meta = self.bundle.entry_meta(name)
+        if meta is None:
+            return None
+        if stat is not None and (meta["mtime_ns"], meta["size"]) != (stat.st_mtime_ns, stat.st_size):
+            return None
+        # Packed stylesheets keep relative resource URLs so the bundle can move
+        return self.resolve_urls(self.bundle.text(name))
+
+    def clear(self):
+        """Forget compiled stylesheets held in memory."""
+        self._memory.clear()
+        self._index = None
+
+    def _compiled_path(self, digest):
+        return os.path.join(self.cache_dir, f"{digest}.qss")
+
+    def _index_path(self):
+        return os.path.join(self.cache_dir, "index.json")
+
+    def _load_index(self):
+        if self._index is None:
+            try:
+                with open(self._index_path(), 'r') as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _store(self, index_key, digest, stat, style):
+        """Write the compiled stylesheet and index entry; failures are not fatal."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            compiled_path = self._compiled_path(digest)
+            if not os.path.exists(compiled_path):
+                _write_atomic(compiled_path, style)
+            index = self._load_index()
+            index[index_key] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "digest": digest
+            }
+            _write_atomic(self._index_path(), json.dumps(index, indent=1))
+        except OSError:
+            return
+        self._prune(index)
+
+    def _prune(self, index):
+        """Delete compiled stylesheets no index entry refers to any more."""
+        referenced = {f"{entry['digest']}.qss" for entry in index.values()}
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+        for name in names:
+            if name.endswith(".qss") and name not in referenced:
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+
+# Shared instance used by core.utils.load_stylesheet
+stylesheet_compiler = StylesheetCompiler()
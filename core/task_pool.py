@@ -0,0 +1,242 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+import functools
+import heapq
+import itertools
+import os
+import weakref
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class SharedArray:
+    """Picklable reference to an array left in a shared memory block by a worker."""
+
+    __slots__ = ("name", "shape", "dtype")
+
+    def __init__(self, name, shape, dtype):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    def __reduce__(self):
+        return (SharedArray, (self.name, self.shape, self.dtype))
+
+def export_arrays(value, threshold):
+    """Move arrays of at least threshold bytes in value into shared memory.
+
+    Runs in the worker. Dicts, lists and tuples are searched recursively;
+    everything else is returned unchanged and pickled as usual.
+    """
+    if numpy is not None and isinstance(value, numpy.ndarray):
+        if value.nbytes < threshold or value.dtype.hasobject:
+            return value
+        block = shared_memory.SharedMemory(create=True, size=value.nbytes)
+        numpy.ndarray(value.shape, value.dtype, buffer=block.buf)[...] = value
+        shared = SharedArray(block.name, value.shape, value.dtype.str)
+        # The block stays registered with the resource tracker, which spawned
+        # workers share with the GUI process: the GUI process unlinks it once
+        # attached, and the tracker unlinks it at exit if it never is
+        block.close()
+        return shared
+    if isinstance(value, dict):
+        return {key: export_arrays(item, threshold) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(export_arrays(item, threshold) for item in value)
+    return value
+
+def import_arrays(value):
+    """Replace SharedArray references in value with arrays mapped onto their blocks.
+
+    The arrays are zero-copy views; each block is unlinked straight away
+    and unmapped when the last view of its array is garbage collected.
+    """
+    if isinstance(value, SharedArray):
+        block = shared_memory.SharedMemory(name=value.name)
+        array = numpy.ndarray(value.shape, numpy.dtype(value.dtype), buffer=block.buf)
+        block.unlink()
+        weakref.finalize(array, block.close)
+        return array
+    if isinstance(value, dict):
+        return {key: import_arrays(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(import_arrays(item) for item in value)
+    return value
+
+def release_arrays(value):
+    """Unlink the shared memory blocks referenced by a discarded result."""
+    if isinstance(value, SharedArray):
+        try:
+            block = shared_memory.SharedMemory(name=value.name)
+        except FileNotFoundError:
+            return
+        block.unlink()
+        block.close()
+    elif isinstance(value, dict):
+        for item in value.values():
+            release_arrays(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            release_arrays(item)
+
+def _run_job(fn, args, kwargs, threshold):
+    return export_arrays(fn(*args, **kwargs), threshold)
+
+class TaskHandle(QObject):
+    """A submitted job; its signals are emitted on the GUI thread."""
+
+    # Emitted with the job's return value
+    finished = pyqtSignal(object)
+    # Emitted with the exception the job raised
+    failed = pyqtSignal(object)
+    cancelled = pyqtSignal()
+
+    def __init__(self, pool, job_id, priority):
+        super().__init__()
+        self.pool = pool
+        self.job_id = job_id
+        self.priority = priority
+        self.state = "pending"
+
+    def cancel(self):
+        """Cancel the job; a running job finishes in its worker but is discarded."""
+        self.pool.cancel(self.job_id)
+
+    def done(self):
+        return self.state in ("finished", "failed", "cancelled")
+
+class TaskPool(QObject):
+    """Runs CPU-bound functions in worker processes off the GUI thread.
+
+    Jobs wait in a priority queue in the GUI process and only
+    ``max_workers`` are handed to the process pool at a time, so a newly
+    submitted high priority job overtakes queued background work. Array
+    results of ``shared_memory_threshold`` bytes or more come back
+    through shared memory blocks instead of being pickled through the
+    result pipe. Workers are started with "spawn", so job functions must
+    be importable module-level functions.
+
+    Results are delivered by the job's TaskHandle signals on the GUI
+    thread. Jobs submitted with an ``owner`` widget are cancelled when it
+    is destroyed.
+    """
+
+    HIGH = 10
+    NORMAL = 0
+    LOW = -10
+
+    shared_memory_threshold = 64 * 1024
+
+    # (job id, concurrent future) from the executor's callback thread
+    _jobDone = pyqtSignal(int, object)
+
+    def __init__(self, max_workers=None, parent=None):
+        super().__init__(parent)
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self._executor = None
+        self._counter = itertools.count()
+        self._queue = []
+        self._handles = {}
+        self._running = {}
+        self._jobDone.connect(self._on_job_done)
+        self.submitted = 0
+        self.completed = 0
+        self.cancelled = 0
+
+    def submit(self, fn, *args, priority=NORMAL, owner=None, **kwargs):
+        """Queue fn(*args, **kwargs) for a worker process and return its TaskHandle."""
+        job_id = next(self._counter)
+        handle = TaskHandle(self, job_id, priority)
+        self._handles[job_id] = handle
+        heapq.heappush(self._queue, (-priority, job_id, fn, args, kwargs))
+        if owner is not None:
+            owner.destroyed.connect(functools.partial(self._cancel_later, weakref.ref(handle)))
+        self.submitted += 1
+        self._dispatch()
+        return handle
+
+    def cancel(self, job_id):
+        """Cancel a queued or running job."""
+        handle = self._handles.get(job_id)
+        if handle is None or handle.done():
+            return
+        if job_id not in self._running:
+            # Still queued; its heap entry is skipped when popped
+            del self._handles[job_id]
+        else:
+            self._running[job_id].cancel()
+        handle.state = "cancelled"
+        self.cancelled += 1
+        handle.cancelled.emit()
+
+    def pending_count(self):
+        return sum(1 for entry in self._queue if entry[1] in self._handles)
+
+    def running_count(self):
+        return len(self._running)
+
+    def shutdown(self, wait=True):
+        """Cancel everything and stop the worker processes."""
+        for job_id in list(self._handles):
+            self.cancel(job_id)
+        self._queue.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+        # Results already back but not yet delivered would only be unlinked at exit
+        for future in self._running.values():
+            if future.done() and not future.cancelled() and future.exception() is None:
+                release_arrays(future.result())
+
+    def _cancel_later(self, handle_ref, *args):
+        handle = handle_ref()
+        if handle is not None:
+            self.cancel(handle.job_id)
+
+    def _dispatch(self):
+        """Hand the highest priority queued jobs to free workers."""
+        while self._queue and len(self._running) < self.max_workers:
+            _, job_id, fn, args, kwargs = heapq.heappop(self._queue)
+            handle = self._handles.get(job_id)
+            if handle is None:
+                continue
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(self.max_workers, mp_context=get_context("spawn"))
+            future = self._executor.submit(_run_job, fn, args, kwargs, self.shared_memory_threshold)
+            handle.state = "running"
+            self._running[job_id] = future
+            # Runs on the executor's thread; the signal queues it to the GUI thread
+            future.add_done_callback(functools.partial(self._jobDone.emit, job_id))
+
+    def _on_job_done(self, job_id, future):
+        self._running.pop(job_id, None)
+        handle = self._handles.pop(job_id, None)
+        exception = None if future.cancelled() else future.exception()
+        if handle is None or handle.state == "cancelled":
+            if not future.cancelled() and exception is None:
+                release_arrays(future.result())
+        elif exception is not None:
+            handle.state = "failed"
+            handle.failed.emit(exception)
+        else:
+            handle.state = "finished"
+            self.completed += 1
+            handle.finished.emit(import_arrays(future.result()))
+        self._dispatch()
+
+_pool = None
+
+def task_pool():
+    """Return the shared task pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        _pool = TaskPool()
+    return _pool
+
+def shutdown_task_pool(wait=False):
+    """Stop the shared pool's workers if it was ever used."""
+    if _pool is not None:
+        _pool.shutdown(wait)
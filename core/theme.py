@@ -0,0 +1,220 @@
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QPalette
+from collections import namedtuple
+from core.stylesheet import stylesheet_compiler
+import re
+import time
+
+# Base colors of each preset; they override the @variables in style.qss
+PRESETS = {
+    "Default Dark": {
+        "background": "#121212",
+        "background-alt": "#181818",
+        "foreground": "#FFFFFF",
+        "muted": "#888888",
+        "surface": "rgba(31, 31, 31, 0.8)",
+        "surface-hover": "rgba(45, 45, 45, 0.8)",
+        "border": "rgba(45, 45, 45, 0.8)",
+        "hover-subtle": "rgba(45, 45, 45, 0.3)",
+        "scrollbar": "rgba(45, 45, 45, 0.5)"
+    },
+    "Monokai": {
+        "background": "#1E1F1C",
+        "background-alt": "#272822",
+        "foreground": "#F8F8F2",
+        "muted": "#A59F85",
+        "surface": "rgba(52, 53, 46, 0.8)",
+        "surface-hover": "rgba(73, 72, 62, 0.8)",
+        "border": "rgba(73, 72, 62, 0.8)",
+        "hover-subtle": "rgba(73, 72, 62, 0.3)",
+        "scrollbar": "rgba(73, 72, 62, 0.5)"
+    },
+    "Solarized Dark": {
+        "background": "#002B36",
+        "background-alt": "#073642",
+        "foreground": "#EEE8D5",
+        "muted": "#839496",
+        "surface": "rgba(7, 54, 66, 0.8)",
+        "surface-hover": "rgba(16, 72, 86, 0.8)",
+        "border": "rgba(16, 72, 86, 0.8)",
+        "hover-subtle": "rgba(16, 72, 86, 0.3)",
+        "scrollbar": "rgba(88, 110, 117, 0.5)"
+    },
+    "Nord": {
+        "background": "#2E3440",
+        "background-alt": "#323946",
+        "foreground": "#ECEFF4",
+        "muted": "#A3ACBD",
+        "surface": "rgba(59, 66, 82, 0.8)",
+        "surface-hover": "rgba(67, 76, 94, 0.8)",
+        "border": "rgba(67, 76, 94, 0.8)",
+        "hover-subtle": "rgba(67, 76, 94, 0.3)",
+        "scrollbar": "rgba(76, 86, 106, 0.5)"
+    },
+    "Dracula": {
+        "background": "#21222C",
+        "background-alt": "#282A36",
+        "foreground": "#F8F8F2",
+        "muted": "#9EA8C7",
+        "surface": "rgba(40, 42, 54, 0.8)",
+        "surface-hover": "rgba(68, 71, 90, 0.8)",
+        "border": "rgba(68, 71, 90, 0.8)",
+        "hover-subtle": "rgba(68, 71, 90, 0.3)",
+        "scrollbar": "rgba(98, 114, 164, 0.5)"
+    }
+}
+
+# Used instead of the preset when dark mode is off
+LIGHT = {
+    "background": "#F3F3F3",
+    "background-alt": "#EAEAEA",
+    "foreground": "#1B1B1B",
+    "muted": "#666666",
+    "surface": "rgba(255, 255, 255, 0.8)",
+    "surface-hover": "rgba(232, 232, 232, 0.8)",
+    "border": "rgba(0, 0, 0, 0.1)",
+    "hover-subtle": "rgba(0, 0, 0, 0.05)",
+    "scrollbar": "rgba(0, 0, 0, 0.25)"
+}
+
+# Accent name -> (normal, hover, pressed) RGB
+ACCENTS = {
+    "Blue": ((0, 120, 215), (16, 132, 226), (0, 108, 193)),
+    "Green": ((16, 137, 62), (28, 153, 76), (12, 118, 52)),
+    "Purple": ((136, 23, 152), (152, 42, 168), (118, 18, 132)),
+    "Orange": ((202, 80, 16), (218, 96, 32), (178, 70, 12)),
+    "Pink": ((227, 0, 140), (235, 28, 156), (198, 0, 122))
+}
+
+FONT_SIZES = {"Small": "10px", "Medium": "11px", "Large": "13px"}
+
+ThemeKey = namedtuple("ThemeKey", "preset accent dark font_size")
+Theme = namedtuple("Theme", "key variables stylesheet palette")
+
+DEFAULT_THEME = ThemeKey("Default Dark", "Blue", True, "Medium")
+
+_RGBA_RE = re.compile(r"rgba?\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*(?:,\s*([\d.]+)\s*)?\)")
+
+def parse_color(value):
+    """Return a QColor for a QSS color value (#hex, rgb() or rgba())."""
+    match = _RGBA_RE.fullmatch(value.strip())
+    if not match:
+        return QColor(value.strip())
+    red, green, blue, alpha = match.groups()
+    return QColor(int(red), int(green), int(blue),
+                  round(float(alpha) * 255) if alpha is not None else 255)
+
+def _rgb(color, alpha=None):
+    if alpha is None:
+        return "#{:02X}{:02X}{:02X}".format(*color)
+    return "rgba({}, {}, {}, {})".format(*color, alpha)
+
+def theme_variables(key):
+    """Return the stylesheet variables for a theme key."""
+    variables = dict(PRESETS.get(key.preset, PRESETS[DEFAULT_THEME.preset]) if key.dark else LIGHT)
+    normal, hover, pressed = ACCENTS.get(key.accent, ACCENTS[DEFAULT_THEME.accent])
+    variables.update({
+        "accent": _rgb(normal, 0.8),
+        "accent-hover": _rgb(hover, 0.8),
+        "accent-pressed": _rgb(pressed, 0.8),
+        "accent-subtle": _rgb(normal, 0.3),
+        "primary": _rgb(normal),
+        "primary-hover": _rgb(hover),
+        "primary-pressed": _rgb(pressed),
+        # Text on accent backgrounds stays white in light mode too
+        "on-accent": "#FFFFFF",
+        "font-size": FONT_SIZES.get(key.font_size, FONT_SIZES[DEFAULT_THEME.font_size])
+    })
+    return variables
+
+def build_palette(variables):
+    """Return a QPalette matching the theme, for widgets not covered by QSS."""
+    background = parse_color(variables["background"])
+    foreground = parse_color(variables["foreground"])
+    surface = parse_color(variables["surface"])
+    primary = parse_color(variables["primary"])
+    palette = QPalette()
+    for role, color in (
+        (QPalette.Window, background),
+        (QPalette.WindowText, foreground),
+        (QPalette.Base, background),
+        (QPalette.AlternateBase, surface),
+        (QPalette.Text, foreground),
+        (QPalette.Button, surface),
+        (QPalette.ButtonText, foreground),
+        (QPalette.ToolTipBase, surface),
+        (QPalette.ToolTipText, foreground),
+        (QPalette.PlaceholderText, parse_color(variables["muted"])),
+        (QPalette.Highlight, primary),
+        (QPalette.HighlightedText, QColor(255, 255, 255))
+    ):
+        palette.setColor(role, color)
+    return palette
+
+class ThemeEngine(QObject):
+    """Compiles theme presets once and switches the live window between them.
+
+    Each theme is compiled to a stylesheet and palette the first time it
+    is needed, or ahead of time with ``precompile``, and kept in memory.
+    ``apply`` installs both on the window with one setStyleSheet call, so
+    a switch costs a single repolish of the tree and no page is rebuilt.
+    Widgets that paint their own colors listen to ``themeApplied``.
+    """
+
+    themeApplied = pyqtSignal(object)
+
+    frame_budget_ms = 16.0
+
+    def __init__(self, qss_file="resources/style.qss", compiler=stylesheet_compiler, parent=None):
+        super().__init__(parent)
+        self.qss_file = qss_file
+        self.compiler = compiler
+        self.current = None
+        self._themes = {}
+        self._queue = []
+        self.switch_times = []
+        self.over_budget = 0
+
+    def theme(self, key):
+        """Return the compiled Theme for a key."""
+        theme = self._themes.get(key)
+        if theme is None:
+            variables = theme_variables(key)
+            stylesheet = self.compiler.load(self.qss_file, variables)
+            theme = Theme(key, variables, stylesheet, build_palette(variables))
+            self._themes[key] = theme
+        return theme
+
+    def precompile(self, keys):
+        """Compile themes one per event-loop iteration while the app is idle."""
+        self._queue.extend(key for key in keys if key not in self._themes)
+        if self._queue:
+            QTimer.singleShot(0, self._compile_next)
+
+    def _compile_next(self):
+        if not self._queue:
+            return
+        self.theme(self._queue.pop(0))
+        if self._queue:
+            QTimer.singleShot(0, self._compile_next)
+
+    def apply(self, window, key):
+        """Switch window to a theme; return the switch time in ms, or None if unchanged."""
+        if key == self.current:
+            return None
+        start = time.perf_counter()
+        theme = self.theme(key)
+        window.setUpdatesEnabled(False)
+        try:
+            window.setPalette(theme.palette)
+            window.setStyleSheet(theme.stylesheet)
+            self.current = key
+            self.themeApplied.emit(theme)
+        finally:
+            window.setUpdatesEnabled(True)
+        elapsed = (time.perf_counter() - start) * 1000
+        self.switch_times.append(elapsed)
+        del self.switch_times[:-100]
+        if elapsed > self.frame_budget_ms:
+            self.over_budget += 1
+        return elapsed
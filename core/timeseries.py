@@ -0,0 +1,134 @@
+import numpy
+
+class RingBuffer:
+    """Fixed-capacity (x, y) series backed by numpy arrays.
+
+    Every sample is written twice, at ``i`` and ``i + capacity``, so the
+    newest ``len(self)`` samples are always one contiguous slice and
+    ``arrays()`` returns views without copying, however often the buffer
+    has wrapped. The oldest samples are dropped once it is full.
+    """
+
+    def __init__(self, capacity, dtype=numpy.float64):
+        self.capacity = capacity
+        self._x = numpy.zeros(2 * capacity, dtype)
+        self._y = numpy.zeros(2 * capacity, dtype)
+        self._start = 0
+        self._count = 0
+        # Bumped on every change so consumers can cache derived data
+        self.version = 0
+
+    def __len__(self):
+        return self._count
+
+    def extend(self, xs, ys):
+        """Append samples; only the last ``capacity`` of them are kept."""
+        xs = numpy.asarray(xs, self._x.dtype).ravel()[-self.capacity:]
+        ys = numpy.asarray(ys, self._y.dtype).ravel()[-self.capacity:]
+        if len(xs) != len(ys):
+            raise ValueError("x and y must have the same length")
+        count = len(xs)
+        if not count:
+            return
+        end = (self._start + self._count) % self.capacity
+        first = min(count, self.capacity - end)
+        for buffer, values in ((self._x, xs), (self._y, ys)):
+            buffer[end:end + first] = values[:first]
+            buffer[end + self.capacity:end + self.capacity + first] = values[:first]
+            buffer[:count - first] = values[first:]
+            buffer[self.capacity:self.capacity + count - first] = values[first:]
+        overflow = max(0, self._count + count - self.capacity)
+        self._start = (self._start + overflow) % self.capacity
+        self._count = min(self.capacity, self._count + count)
+        self.version += 1
+
+    def append(self, x, y):
+        self.extend((x,), (y,))
+
+    def arrays(self):
+        """Return (x, y) views of the samples, oldest first."""
+        window = slice(self._start, self._start + self._count)
+        return self._x[window], self._y[window]
+
+    def clear(self):
+        self._start = 0
+        self._count = 0
+        self.version += 1
+
+def minmax_reduce(x, y, buckets):
+    """Keep the minimum and maximum of each of ``buckets`` equal slices, in x order.
+
+    A cheap, fully vectorized pre-pass that bounds the input of ``lttb``
+    without losing the peaks a line chart must show.
+    """
+    size = len(x) // buckets
+    if size < 3:
+        return x, y
+    used = size * buckets
+    rows = y[:used].reshape(buckets, size)
+    offsets = numpy.arange(buckets) * size
+    low = rows.argmin(axis=1) + offsets
+    high = rows.argmax(axis=1) + offsets
+    indices = numpy.empty(2 * buckets + 2, numpy.intp)
+    indices[1:-1:2] = numpy.minimum(low, high)
+    indices[2:-1:2] = numpy.maximum(low, high)
+    indices[0] = 0
+    indices[-1] = len(x) - 1
+    return x[indices], y[indices]
+
+def lttb(x, y, threshold):
+    """Downsample to ``threshold`` points with Largest-Triangle-Three-Buckets.
+
+    The first and last points are kept; from each bucket in between the
+    point forming the largest triangle with the previously kept point and
+    the average of the next bucket is kept, which preserves the visual
+    shape of the series far better than striding.
+    """
+    count = len(x)
+    if threshold >= count or threshold < 3:
+        return x, y
+    # Bucket edges for the points between the first and the last
+    edges = (numpy.arange(threshold - 1) * ((count - 2) / (threshold - 2)) + 1).astype(numpy.intp)
+    edges[-1] = count - 1
+    # Average of every bucket, vectorized; the last "next bucket" is the last point
+    sums_x = numpy.add.reduceat(x[:count - 1], edges[:-1])
+    sums_y = numpy.add.reduceat(y[:count - 1], edges[:-1])
+    lengths = numpy.diff(edges)
+    average_x = numpy.append(sums_x / lengths, x[-1])
+    average_y = numpy.append(sums_y / lengths, y[-1])
+
+    xs = x.tolist()
+    ys = y.tolist()
+    bounds = edges.tolist()
+    next_x = average_x[1:].tolist()
+    next_y = average_y[1:].tolist()
+    selected = [0]
+    a_x, a_y = xs[0], ys[0]
+    # The selection is sequential; each step is plain float arithmetic
+    for bucket in range(threshold - 2):
+        n_x = next_x[bucket] - a_x
+        n_y = next_y[bucket] - a_y
+        best = bounds[bucket]
+        best_area = -1.0
+        for index in range(bounds[bucket], bounds[bucket + 1]):
+            area = abs(n_x * (ys[index] - a_y) - n_y * (xs[index] - a_x))
+            if area > best_area:
+                best_area = area
+                best = index
+        selected.append(best)
+        a_x, a_y = xs[best], ys[best]
+    selected.append(count - 1)
+    indices = numpy.array(selected, numpy.intp)
+    return x[indices], y[indices]
+
+def downsample(x, y, points, prefilter=8):
+    """Reduce a series to about ``points`` points for drawing.
+
+    Inputs larger than ``prefilter`` times the target first go through
+    ``minmax_reduce`` so the LTTB pass stays proportional to the output.
+    """
+    if len(x) <= points:
+        return x, y
+    if len(x) > prefilter * points:
+        x, y = minmax_reduce(x, y, prefilter * points // 2)
+    return lttb(x, y, points)
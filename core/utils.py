@@ -1,49 +1,189 @@
-from PyQt5.QtCore import Qt, QPoint
-from PyQt5.QtGui import QIcon
+from PyQt5.QtCore import Qt, QPoint, QSize, QTimer, QObject, QEvent, QCoreApplication
+from PyQt5.QtGui import QGuiApplication
+from core.bundle import ResourceBundle, DEFAULT_BUNDLE_PATH
+from core.icon_cache import icon_cache
+from core.stylesheet import stylesheet_compiler
+import functools
 import os
+import time
 
+@functools.lru_cache(maxsize=None)
 def _project_root():
     return os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
 
-def _qss_path(path):
-    return path.replace("\\", "/")
+def use_bundle(bundle):
+    """Serve icons and stylesheets from a ResourceBundle, or loose files if None."""
+    icon_cache.bundle = bundle
+    stylesheet_compiler.bundle = bundle
 
-def get_icon(name):
-    """Load and return an icon from the resources directory."""
-    icon_path = os.path.join(_project_root(), "resources", "icons", f"{name}.svg")
-    if not os.path.exists(icon_path):
-        # Return an empty icon if the file doesn't exist
-        return QIcon()
-    return QIcon(icon_path)
+# Packed resources from build_resources.py; absent during development
+use_bundle(ResourceBundle.open(DEFAULT_BUNDLE_PATH))
 
-def load_stylesheet(qss_file):
-    """Load and return the contents of a QSS stylesheet file."""
+def _device_pixel_ratio():
+    app = QGuiApplication.instance()
+    return app.devicePixelRatio() if app else 1.0
+
+def get_icon(name, size=None):
+    """Return a cached icon from the resources directory.
+
+    Without a size the icon is rendered by Qt's SVG engine at whatever
+    size it is drawn. With a size it is backed by a single pre-rasterized
+    pixmap from the shared icon cache.
+    """
+    if size is None:
+        return icon_cache.icon(name)
+    return icon_cache.sized_icon(name, size, _device_pixel_ratio())
+
+def get_pixmap(name, size):
+    """Return a cached pixmap of an icon rendered at size x size."""
+    return icon_cache.pixmap(name, size, _device_pixel_ratio())
+
+def prewarm_icons(specs):
+    """Rasterize (name, size) pairs in the background ahead of first use."""
+    return icon_cache.prewarm(specs, _device_pixel_ratio())
+
+def load_stylesheet(qss_file, variables=None):
+    """Return the compiled contents of a QSS stylesheet file.
+
+    ``@name`` variables declared in the file are substituted, optionally
+    overridden by ``variables``, and ``url(resources/...)`` paths are made
+    absolute. The result is cached on disk keyed by a content hash.
+    """
     if not os.path.isabs(qss_file):
         qss_file = os.path.join(_project_root(), qss_file)
-    with open(qss_file, 'r') as f:
-        style = f.read()
-    res_dir = _qss_path(os.path.join(_project_root(), "resources"))
-    style = style.replace("url(resources/", f"url({res_dir}/")
-    style = style.replace("url(\"resources/", f"url(\"{res_dir}/")
-    style = style.replace("url('resources/", f"url('{res_dir}/")
-    return style
+    return stylesheet_compiler.load(qss_file, variables)
 
 class WindowDragger:
-    """Helper class for implementing window dragging."""
+    """Helper class for implementing window dragging.
+
+    When the platform supports it the drag is handed to the window
+    system with ``startSystemMove``. Otherwise mouse moves only record
+    the target position and a frame timer applies the latest one, so a
+    high polling rate mouse still causes at most one move per frame.
+    ``move_events`` and ``moves_applied`` count both sides for
+    instrumentation.
+    """
+
+    use_system_move = True
+    frame_interval = 16
+
     def __init__(self, window):
         self.window = window
         self.dragging = False
         self.offset = QPoint()
+        self._pending = None
+        self._frame_timer = QTimer()
+        self._frame_timer.setInterval(self.frame_interval)
+        self._frame_timer.timeout.connect(self._apply_pending)
+        self.move_events = 0
+        self.moves_applied = 0
+        self.system_moves = 0
+
+    def _start_system_move(self):
+        handle = self.window.windowHandle()
+        if not self.use_system_move or handle is None or not hasattr(handle, "startSystemMove"):
+            return False
+        return handle.startSystemMove()
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
+            if self._start_system_move():
+                # The window system owns the drag; no release will follow
+                self.system_moves += 1
+                return
             self.dragging = True
-            self.offset = event.pos()
+            self.offset = event.globalPos() - self.window.pos()
 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.LeftButton:
+            self._apply_pending()
+            self._frame_timer.stop()
             self.dragging = False
 
     def mouseMoveEvent(self, event):
         if self.dragging:
-            self.window.move(self.window.pos() + event.pos() - self.offset) 
+            self.move_events += 1
+            self._pending = event.globalPos() - self.offset
+            if not self._frame_timer.isActive():
+                # Apply the first move right away, then at most once per frame
+                self._apply_pending()
+                self._frame_timer.start()
+
+    def _apply_pending(self):
+        if self._pending is None:
+            self._frame_timer.stop()
+            return
+        self.window.move(self._pending)
+        self._pending = None
+        self.moves_applied += 1
+
+class LiveResizer(QObject):
+    """Throttles window resizes driven by a QSizeGrip.
+
+    The grip's own mouse handling is replaced: moves only record the
+    target size and a timer applies the latest one every
+    ``live_interval`` ms, so pages re-lay out at most that often while
+    the grip is held. On release the final size is applied and
+    ``finished`` is called so the window can do one full layout pass.
+    ``frame_times`` keeps the cost of the last applied resizes in ms,
+    including the layout passes they trigger.
+    """
+
+    live_interval = 33
+    max_frame_samples = 120
+
+    def __init__(self, window, grip, finished=None):
+        super().__init__(window)
+        self.window = window
+        self.finished = finished
+        self.active = False
+        self._press_pos = QPoint()
+        self._start_size = QSize()
+        self._pending = None
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.live_interval)
+        self._timer.timeout.connect(self._apply_pending)
+        self.resizes_requested = 0
+        self.resizes_applied = 0
+        self.frame_times = []
+        grip.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        kind = event.type()
+        if kind == QEvent.MouseButtonPress and event.button() == Qt.LeftButton:
+            self.active = True
+            # Read per drag so live_interval can be changed on an instance
+            self._timer.setInterval(self.live_interval)
+            self._press_pos = event.globalPos()
+            self._start_size = self.window.size()
+            return True
+        if kind == QEvent.MouseMove and self.active:
+            delta = event.globalPos() - self._press_pos
+            self._pending = QSize(self._start_size.width() + delta.x(),
+                                  self._start_size.height() + delta.y())
+            self.resizes_requested += 1
+            if not self._timer.isActive():
+                self._apply_pending()
+                self._timer.start()
+            return True
+        if kind == QEvent.MouseButtonRelease and self.active and event.button() == Qt.LeftButton:
+            self._apply_pending()
+            self._timer.stop()
+            self.active = False
+            if self.finished:
+                self.finished()
+            return True
+        return False
+
+    def _apply_pending(self):
+        if self._pending is None:
+            self._timer.stop()
+            return
+        start = time.perf_counter()
+        self.window.resize(self._pending)
+        # Run the posted layout requests now so the re-layout is part of the frame
+        QCoreApplication.sendPostedEvents(None, QEvent.LayoutRequest)
+        self._pending = None
+        self.resizes_applied += 1
+        self.frame_times.append((time.perf_counter() - start) * 1000)
+        del self.frame_times[:-self.max_frame_samples]
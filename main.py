@@ -1,27 +1,70 @@
 import sys
 import os
+import argparse
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt
-from ui.main_window import MainWindow
+from core.profiler import profiler, FirstFrameWatcher
+
+def parse_args(argv):
+    """Parse the app's own options, leaving the rest for Qt."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--profile-startup", metavar="PATH",
+                        help="record a startup timeline and write it to PATH")
+    parser.add_argument("--profile-format", choices=["json", "chrome"], default="json",
+                        help="timeline format: plain JSON or Chrome trace events")
+    parser.add_argument("--exit-after-first-frame", action="store_true",
+                        help="quit as soon as the first frame has been painted")
+    parser.add_argument("--headless", action="store_true",
+                        help="run on the offscreen Qt platform")
+    parser.add_argument("--opaque", action="store_true",
+                        help="draw an opaque window instead of a per-pixel translucent one")
+    return parser.parse_known_args(argv[1:])
 
 def main():
+    options, qt_args = parse_args(sys.argv)
+    if options.headless:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    if options.profile_startup:
+        profiler.enable()
+    
+    with profiler.span("import modules"):
+        from PyQt5.QtWidgets import QApplication
+        from PyQt5.QtCore import Qt
+        from ui.main_window import MainWindow, TITLE_BAR_ICONS, TITLE_BAR_ICON_SIZE
+        from ui.sidebar import DEFAULT_NAVIGATION, SidebarDelegate
+        from core.utils import prewarm_icons
+    
     # Enable High DPI support
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
     
     # Create the application
-    app = QApplication(sys.argv)
+    with profiler.span("create QApplication"):
+        app = QApplication(sys.argv[:1] + qt_args)
+    
+    # Rasterize the title bar and sidebar icons while the window is being built
+    prewarm_icons([(name, TITLE_BAR_ICON_SIZE) for name in TITLE_BAR_ICONS]
+                  + [(entry.icon, SidebarDelegate.icon_size)
+                     for group in DEFAULT_NAVIGATION for entry in group.entries])
     
     # Create and show the main window
-    window = MainWindow()
-    window.show()
+    with profiler.span("create MainWindow"):
+        window = MainWindow(opaque=options.opaque)
+    
+    def first_frame_done():
+        if options.profile_startup:
+            profiler.dump(options.profile_startup, options.profile_format)
+        if options.exit_after_first_frame:
+            app.quit()
+    
+    FirstFrameWatcher(window, profiler, first_frame_done)
+    with profiler.span("show MainWindow"):
+        window.show()
     
     # Start the event loop
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
-    main() 
\ No newline at end of file
+    main()
@@ -0,0 +1 @@
+"""Reusable UI components."""
\ No newline at end of file
@@ -0,0 +1,87 @@
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import Qt, QRectF
+from PyQt5.QtGui import QPainter, QColor, QLinearGradient, QPixmap
+from collections import OrderedDict
+from core.census import image_bytes
+
+class PageBackground:
+    """Solid or vertical-gradient page background with a shared render cache.
+
+    Solid backgrounds are filled directly over the exposed rect. Gradients
+    are rendered once per (size, device pixel ratio) into a pixmap shared
+    by every page using the same colors, and only the exposed part of
+    that pixmap is blitted on each paint.
+    """
+
+    # (top, bottom, width, height, dpr) -> QPixmap, shared across pages
+    _cache = OrderedDict()
+    max_cached = 8
+
+    def __init__(self, top, bottom=None):
+        self.top = QColor(top)
+        self.bottom = QColor(bottom) if bottom is not None else None
+
+    @classmethod
+    def memory(cls):
+        """Return the number and pixel bytes of the shared gradient cache."""
+        return {
+            'pixmaps': len(cls._cache),
+            'pixmap_bytes': sum(image_bytes(pixmap) for pixmap in cls._cache.values())
+        }
+
+    def is_gradient(self):
+        return self.bottom is not None and self.bottom != self.top
+
+    def pixmap(self, width, height, device_pixel_ratio=1.0):
+        """Return the cached gradient pixmap for a page size."""
+        key = (self.top.rgba(), self.bottom.rgba(), width, height, device_pixel_ratio)
+        pixmap = self._cache.get(key)
+        if pixmap is not None:
+            self._cache.move_to_end(key)
+            return pixmap
+
+        pixmap = QPixmap(round(width * device_pixel_ratio), round(height * device_pixel_ratio))
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        gradient = QLinearGradient(0, 0, 0, height)
+        gradient.setColorAt(0, self.top)
+        gradient.setColorAt(1, self.bottom)
+        painter = QPainter(pixmap)
+        painter.fillRect(QRectF(0, 0, width, height), gradient)
+        painter.end()
+
+        self._cache[key] = pixmap
+        while len(self._cache) > self.max_cached:
+            self._cache.popitem(last=False)
+        return pixmap
+
+    def paint(self, painter, widget, exposed):
+        """Paint the background of widget within the exposed rect only."""
+        if not self.is_gradient():
+            painter.fillRect(exposed, self.top)
+            return
+        dpr = widget.devicePixelRatioF()
+        pixmap = self.pixmap(widget.width(), widget.height(), dpr)
+        source = QRectF(exposed.x() * dpr, exposed.y() * dpr,
+                        exposed.width() * dpr, exposed.height() * dpr)
+        painter.drawPixmap(QRectF(exposed), pixmap, source)
+
+class BackgroundPage(QWidget):
+    """Page base class that paints a cached background.
+
+    With ``opaque_background`` set the page declares WA_OpaquePaintEvent,
+    so Qt skips painting whatever lies behind it.
+    """
+
+    background = PageBackground(QColor(18, 18, 18))
+    opaque_background = True
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        if self.opaque_background:
+            self.setAttribute(Qt.WA_OpaquePaintEvent)
+
+    def paintEvent(self, event):
+        """Paint the page background over the exposed region."""
+        painter = QPainter(self)
+        for rect in event.region().rects():
+            self.background.paint(painter, self, rect)
@@ -0,0 +1,134 @@
+from PyQt5.QtWidgets import QListView, QStyledItemDelegate, QAbstractItemView, QFrame, QStyle
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QRectF, QSize
+from PyQt5.QtGui import QPainter, QColor, QFont, QFontMetrics, QTextOption
+from ui.components.shadow import shadow_renderer, CARD_SHADOW
+
+TitleRole = Qt.UserRole + 1
+ContentRole = Qt.UserRole + 2
+
+class CardListModel(QAbstractListModel):
+    """Flat list model of (title, content) card entries."""
+
+    def __init__(self, entries=None, parent=None):
+        super().__init__(parent)
+        self._entries = list(entries or [])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        title, content = self._entries[index.row()]
+        if role in (Qt.DisplayRole, TitleRole):
+            return title
+        if role == ContentRole:
+            return content
+        if role == Qt.ToolTipRole:
+            return content
+        return None
+
+    def append_cards(self, entries):
+        """Append (title, content) entries in a single insert."""
+        entries = list(entries)
+        if not entries:
+            return
+        first = len(self._entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        self._entries.extend(entries)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._entries.clear()
+        self.endResetModel()
+
+class CardDelegate(QStyledItemDelegate):
+    """Paints model rows as content cards in the dashboard style.
+
+    All rows share one height (title line plus up to ``content_lines`` of
+    wrapped content), which lets the view lay out any number of rows
+    without measuring them.
+    """
+
+    background = QColor(31, 31, 31, 204)
+    hover_background = QColor(45, 45, 45, 204)
+    title_color = QColor(255, 255, 255)
+    content_color = QColor(136, 136, 136)
+    spacing = 16
+    padding = 12
+    radius = 4
+    content_lines = 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.title_font = QFont()
+        self.title_font.setPixelSize(14)
+        self.title_font.setBold(True)
+        self.content_font = QFont()
+        self.content_font.setPixelSize(11)
+        self._title_height = QFontMetrics(self.title_font).height()
+        self._line_height = QFontMetrics(self.content_font).lineSpacing()
+
+    def row_height(self):
+        return (self.spacing + 2 * self.padding + self._title_height + 8
+                + self._line_height * self.content_lines)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.row_height())
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        card = QRect(option.rect).adjusted(0, self.spacing // 2, 0, -self.spacing // 2)
+        # Leave room for the shadow inside the row
+        card.adjust(0, 0, 0, -CARD_SHADOW.offset_y)
+        shadow_renderer.paint(painter, card, CARD_SHADOW, painter.device().devicePixelRatioF())
+
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.hover_background if hovered else self.background)
+        painter.drawRoundedRect(QRectF(card), self.radius, self.radius)
+
+        inner = card.adjusted(self.padding, self.padding, -self.padding, -self.padding)
+        painter.setFont(self.title_font)
+        painter.setPen(self.title_color)
+        title_rect = QRect(inner.left(), inner.top(), inner.width(), self._title_height)
+        title = QFontMetrics(self.title_font).elidedText(index.data(TitleRole), Qt.ElideRight,
+                                                         title_rect.width())
+        painter.drawText(title_rect, Qt.AlignLeft | Qt.AlignVCenter, title)
+
+        painter.setFont(self.content_font)
+        painter.setPen(self.content_color)
+        content_rect = QRect(inner.left(), title_rect.bottom() + 8, inner.width(),
+                             self._line_height * self.content_lines)
+        text_option = QTextOption(Qt.AlignLeft | Qt.AlignTop)
+        text_option.setWrapMode(QTextOption.WordWrap)
+        painter.setClipRect(content_rect)
+        painter.drawText(QRectF(content_rect), index.data(ContentRole), text_option)
+        painter.restore()
+
+class CardListView(QListView):
+    """Virtualized list of content cards.
+
+    Only visible rows are painted and no widgets are created per row, so
+    memory and scroll cost stay flat as entries are appended.
+    """
+
+    def __init__(self, model=None, parent=None):
+        super().__init__(parent)
+        self.setObjectName("cardListView")
+        self.setFrameShape(QFrame.NoFrame)
+        self.setUniformItemSizes(True)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WA_Hover)
+        self.setItemDelegate(CardDelegate(self))
+        self.setModel(model if model is not None else CardListModel(parent=self))
+
+    def append_cards(self, entries):
+        """Append (title, content) entries to the underlying model."""
+        self.model().append_cards(entries)
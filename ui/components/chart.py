@@ -0,0 +1,210 @@
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import Qt, QRectF, QElapsedTimer
+from PyQt5.QtGui import QPainter, QColor, QPen, QPolygonF
+import numpy
+from core.timeseries import RingBuffer, downsample
+
+def polygon_from_arrays(xs, ys):
+    """Build a QPolygonF by writing coordinates straight into its storage."""
+    polygon = QPolygonF(len(xs))
+    pointer = polygon.data()
+    pointer.setsize(len(xs) * 2 * numpy.dtype(numpy.float64).itemsize)
+    coords = numpy.frombuffer(pointer, numpy.float64).reshape(-1, 2)
+    coords[:, 0] = xs
+    coords[:, 1] = ys
+    return polygon
+
+class ChartSeries:
+    """One line of a TimeSeriesChart; ``color`` None follows the chart palette."""
+
+    def __init__(self, name, capacity, color=None):
+        self.name = name
+        self.color = color
+        self.buffer = RingBuffer(capacity)
+        self._cache_key = None
+        self._cache = None
+
+    def visible(self, x0, x1, points):
+        """Return the downsampled samples covering [x0, x1] and the raw count."""
+        x, y = self.buffer.arrays()
+        # One sample beyond each edge so the line runs off the plot
+        start = max(0, int(numpy.searchsorted(x, x0, "left")) - 1)
+        stop = min(len(x), int(numpy.searchsorted(x, x1, "right")) + 1)
+        key = (self.buffer.version, start, stop, points)
+        if key != self._cache_key:
+            self._cache = downsample(x[start:stop], y[start:stop], points)
+            self._cache_key = key
+        return self._cache, stop - start
+
+class TimeSeriesChart(QWidget):
+    """Line chart for large, continuously growing time series.
+
+    Each series lives in a numpy ring buffer. A paint binary-searches the
+    visible x range, reduces it to ``points_per_pixel`` points per pixel
+    column with LTTB and draws every series as a single polyline built
+    directly from the arrays, so the cost follows the widget width rather
+    than the number of samples. The y axis fits the visible data.
+
+    ``span`` is the visible x range (None shows everything). While
+    ``follow`` is set the newest sample stays at the right edge; dragging
+    pans back in time, the wheel zooms and a double click resumes
+    following.
+    """
+
+    background = QColor(24, 24, 24)
+    grid_color = QColor(45, 45, 45, 77)
+    text_color = QColor(136, 136, 136)
+    series_colors = [QColor(0, 120, 215), QColor(16, 185, 129),
+                     QColor(234, 88, 12), QColor(168, 85, 247)]
+    points_per_pixel = 1
+    line_width = 1.0
+    antialiased = False
+    grid_lines = 4
+    padding = 8
+
+    def __init__(self, span=None, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setMinimumHeight(120)
+        self.series = {}
+        self.span = span
+        self.follow = True
+        self._view_end = None
+        self._drag_x = None
+        self.paints = 0
+        self.points_rendered = 0
+        self.last_paint_ms = 0.0
+
+    def add_series(self, name, capacity=100_000, color=None):
+        """Create a series holding up to capacity samples."""
+        if name in self.series:
+            raise ValueError(f"Series {name!r} already exists")
+        self.series[name] = ChartSeries(name, capacity, color)
+        return self.series[name]
+
+    def extend(self, name, xs, ys):
+        """Append samples with increasing x to a series and schedule a repaint."""
+        self.series[name].buffer.extend(xs, ys)
+        self.update()
+
+    def append(self, name, x, y):
+        self.extend(name, (x,), (y,))
+
+    def data_range(self):
+        """Return the (first, last) x over all series, or None when empty."""
+        bounds = []
+        for series in self.series.values():
+            if len(series.buffer):
+                x, _ = series.buffer.arrays()
+                bounds.append((x[0], x[-1]))
+        if not bounds:
+            return None
+        return min(b[0] for b in bounds), max(b[1] for b in bounds)
+
+    def x_range(self):
+        """Return the visible (x0, x1), or None when there is no data."""
+        bounds = self.data_range()
+        if bounds is None:
+            return None
+        if self.span is None:
+            return bounds
+        end = bounds[1] if self.follow or self._view_end is None else self._view_end
+        # Until the data covers the span it is stretched over the full width
+        return max(end - self.span, bounds[0]), end
+
+    def pan(self, dx):
+        """Scroll the view by dx; reaching the newest sample resumes following."""
+        visible = self.x_range()
+        if visible is None or self.span is None:
+            return
+        end = visible[1] + dx
+        latest = self.data_range()[1]
+        self.follow = end >= latest
+        self._view_end = min(end, latest)
+        self.update()
+
+    def zoom(self, factor):
+        """Scale the visible span around its right edge."""
+        bounds = self.data_range()
+        if bounds is None:
+            return
+        span = self.span if self.span is not None else bounds[1] - bounds[0]
+        self.span = max(span * factor, 1e-9)
+        self.update()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._drag_x = event.x()
+
+    def mouseMoveEvent(self, event):
+        if self._drag_x is not None and self.span is not None and self.width():
+            self.pan((self._drag_x - event.x()) * self.span / self.width())
+            self._drag_x = event.x()
+
+    def mouseReleaseEvent(self, event):
+        self._drag_x = None
+
+    def mouseDoubleClickEvent(self, event):
+        self.follow = True
+        self.update()
+
+    def wheelEvent(self, event):
+        self.zoom(0.8 if event.angleDelta().y() > 0 else 1.25)
+
+    def paintEvent(self, event):
+        clock = QElapsedTimer()
+        clock.start()
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.background)
+        plot = QRectF(self.rect()).adjusted(self.padding, self.padding, -self.padding, -self.padding)
+        visible = self.x_range()
+        if visible is None or plot.width() < 2 or plot.height() < 2:
+            return
+        x0, x1 = visible
+        points = max(3, int(plot.width() * self.points_per_pixel))
+
+        lines = []
+        for index, series in enumerate(self.series.values()):
+            (xs, ys), raw = series.visible(x0, x1, points)
+            self.points_rendered += raw
+            if len(xs) >= 2:
+                color = series.color or self.series_colors[index % len(self.series_colors)]
+                lines.append((xs, ys, color))
+        if not lines:
+            return
+        y0 = min(float(numpy.nanmin(ys)) for _, ys, _ in lines)
+        y1 = max(float(numpy.nanmax(ys)) for _, ys, _ in lines)
+        margin = (y1 - y0) * 0.05 or abs(y0) * 0.05 or 1.0
+        y0, y1 = y0 - margin, y1 + margin
+
+        self._paint_grid(painter, plot, y0, y1)
+        scale_x = plot.width() / ((x1 - x0) or 1.0)
+        scale_y = plot.height() / (y1 - y0)
+        painter.setClipRect(plot)
+        painter.setRenderHint(QPainter.Antialiasing, self.antialiased)
+        for xs, ys, color in lines:
+            polygon = polygon_from_arrays(plot.left() + (xs - x0) * scale_x,
+                                          plot.bottom() - (ys - y0) * scale_y)
+            painter.setPen(QPen(color, self.line_width))
+            painter.drawPolyline(polygon)
+        painter.end()
+        self.paints += 1
+        self.last_paint_ms = clock.nsecsElapsed() / 1e6
+
+    def _paint_grid(self, painter, plot, y0, y1):
+        """Draw horizontal grid lines labelled with their y value."""
+        painter.setPen(self.grid_color)
+        step = plot.height() / self.grid_lines
+        for line in range(self.grid_lines + 1):
+            y = plot.top() + line * step
+            painter.drawLine(int(plot.left()), int(y), int(plot.right()), int(y))
+        painter.setPen(self.text_color)
+        for line in range(self.grid_lines + 1):
+            y = plot.top() + line * step
+            value = y1 - (y1 - y0) * line / self.grid_lines
+            # The top label sits below its line so it stays inside the widget
+            if line:
+                rect, align = QRectF(plot.left(), y - 14, plot.width(), 14), Qt.AlignBottom
+            else:
+                rect, align = QRectF(plot.left(), y, plot.width(), 14), Qt.AlignTop
+            painter.drawText(rect, Qt.AlignRight | align, f"{value:,.6g}")
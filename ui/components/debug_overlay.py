@@ -0,0 +1,69 @@
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QPainter, QColor, QFont, QFontMetrics
+
+class DebugOverlay(QWidget):
+    """Translucent panel showing the latest Instrumentation sample.
+
+    It ignores the mouse and repaints only when a new sample arrives.
+    """
+
+    max_classes = 5
+
+    def __init__(self, instrumentation, parent=None):
+        super().__init__(parent)
+        self.instrumentation = instrumentation
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+        self.text_font = QFont("monospace")
+        self.text_font.setStyleHint(QFont.TypeWriter)
+        self.text_font.setPixelSize(11)
+        self._lines = ["Collecting..."]
+        instrumentation.ignored.add(self)
+        instrumentation.sampled.connect(self.update_sample)
+        self.hide()
+
+    def update_sample(self, sample):
+        """Format a sample into text lines and resize to fit."""
+        lines = [
+            f"event loop lag  max {sample['lag_max_ms']:6.1f} ms  avg {sample['lag_avg_ms']:5.1f} ms",
+            f"paints {sample['paints_per_s']:7.1f}/s   repolish {sample['repolish_per_s']:6.1f}/s"
+        ]
+        for name, rate in sorted(sample['rates'].items()):
+            lines.append(f"{name} {rate:7.1f}/s")
+        for page, ms in sorted(sample['paint_ms_by_page'].items(), key=lambda item: -item[1]):
+            lines.append(f"page  {page:<20} {ms:7.2f} ms")
+        by_class = sorted(sample['paint_ms_by_class'].items(), key=lambda item: -item[1])
+        for name, ms in by_class[:self.max_classes]:
+            lines.append(f"class {name:<20} {ms:7.2f} ms")
+        self._lines = lines
+        self.reposition()
+        self.update()
+
+    def reposition(self):
+        """Pin the overlay to the top-right corner of its parent."""
+        metrics = QFontMetrics(self.text_font)
+        width = max(metrics.horizontalAdvance(line) for line in self._lines) + 16
+        height = metrics.lineSpacing() * len(self._lines) + 12
+        parent = self.parentWidget()
+        x = parent.width() - width - 8 if parent else 0
+        self.setGeometry(QRect(x, 32, width, height))
+        self.raise_()
+
+    def showEvent(self, event):
+        self.reposition()
+        super().showEvent(event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(0, 0, 0, 180))
+        painter.drawRoundedRect(self.rect(), 4, 4)
+        painter.setFont(self.text_font)
+        painter.setPen(QColor(120, 220, 120))
+        metrics = QFontMetrics(self.text_font)
+        y = 6 + metrics.ascent()
+        for line in self._lines:
+            painter.drawText(8, y, line)
+            y += metrics.lineSpacing()
@@ -0,0 +1,196 @@
+from PyQt5.QtWidgets import QLayout
+from PyQt5.QtCore import Qt, QEvent, QRect, QSize
+
+class _Measurement:
+    """Cached size hint and heights-for-width of one widget."""
+
+    __slots__ = ("constraints", "hint", "heights")
+
+    def __init__(self, constraints, hint):
+        self.constraints = constraints
+        self.hint = hint
+        self.heights = {}
+
+class ResponsiveGridLayout(QLayout):
+    """Reflows widgets into as many columns as the available width allows.
+
+    With ``uniform`` set, items are placed in equal-width columns of at
+    least ``min_column_width`` (at most ``max_columns``), and each row is
+    as tall as its tallest item. Otherwise items keep their size-hint
+    width and wrap like words in a paragraph.
+
+    Each widget's size hint and heights for the widths it has been laid
+    out at are cached. An entry is only recomputed when that widget's own
+    layout asks to be redone, its size constraints change or it is given
+    a width it has not been measured at, so one card changing does not
+    remeasure its siblings. Geometry is only set on items whose rectangle
+    actually moved. Widgets without a layout of their own are queried on
+    every pass, since their changes cannot be attributed to them.
+    """
+
+    # Distinct widths remembered per widget; resizing sweeps through many
+    max_cached_widths = 16
+
+    def __init__(self, parent=None, min_column_width=200, max_columns=None,
+                 uniform=True, spacing=16):
+        super().__init__(parent)
+        self.min_column_width = min_column_width
+        self.max_columns = max_columns
+        self.uniform = uniform
+        self.setSpacing(spacing)
+        self._items = []
+        self._measurements = {}
+        self._arranged = None
+        self._height_for_width = None
+        self.measurements = 0
+        self.geometry_updates = 0
+
+    def addItem(self, item):
+        self._items.append(item)
+        widget = item.widget()
+        if widget is not None:
+            widget.installEventFilter(self)
+        self.invalidate()
+
+    def count(self):
+        return len(self._items)
+
+    def itemAt(self, index):
+        if 0 <= index < len(self._items):
+            return self._items[index]
+        return None
+
+    def takeAt(self, index):
+        if not 0 <= index < len(self._items):
+            return None
+        item = self._items.pop(index)
+        widget = item.widget()
+        if widget is not None:
+            widget.removeEventFilter(self)
+            self._measurements.pop(widget, None)
+        self.invalidate()
+        return item
+
+    def expandingDirections(self):
+        return Qt.Orientations(0)
+
+    def hasHeightForWidth(self):
+        return True
+
+    def heightForWidth(self, width):
+        if self._height_for_width is None or self._height_for_width[0] != width:
+            self._height_for_width = (width, self._arrange(QRect(0, 0, width, 0), False))
+        return self._height_for_width[1]
+
+    def minimumSize(self):
+        size = QSize()
+        for item in self._items:
+            if not item.isEmpty():
+                size = size.expandedTo(item.minimumSize())
+        if self.uniform:
+            size.setWidth(max(size.width(), self.min_column_width))
+        margins = self.contentsMargins()
+        return size + QSize(margins.left() + margins.right(), margins.top() + margins.bottom())
+
+    def sizeHint(self):
+        size = self.minimumSize()
+        return QSize(size.width(), self.heightForWidth(size.width()))
+
+    def invalidate(self):
+        # Cached measurements stay; they are validated per widget
+        self._arranged = None
+        self._height_for_width = None
+        super().invalidate()
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.LayoutRequest:
+            # The widget's own layout changed, so its measurement may have too
+            self._measurements.pop(watched, None)
+        return False
+
+    def setGeometry(self, rect):
+        super().setGeometry(rect)
+        if self._arranged != rect:
+            self._arrange(rect, True)
+            self._arranged = QRect(rect)
+
+    def _measure(self, item, width=None):
+        """Return the (size hint, height at width) of an item; height is None without width."""
+        widget = item.widget()
+        if widget is None or widget.layout() is None:
+            hint = item.sizeHint()
+            if width is None:
+                return hint, None
+            return hint, item.heightForWidth(width) if item.hasHeightForWidth() else hint.height()
+        constraints = (widget.minimumSize(), widget.maximumSize(), widget.sizePolicy())
+        entry = self._measurements.get(widget)
+        if entry is None or entry.constraints != constraints:
+            entry = self._measurements[widget] = _Measurement(constraints, item.sizeHint())
+            self.measurements += 1
+        if width is None:
+            return entry.hint, None
+        height = entry.heights.get(width)
+        if height is None:
+            if item.hasHeightForWidth():
+                height = item.heightForWidth(width)
+            else:
+                height = min(max(entry.hint.height(), item.minimumSize().height()),
+                             item.maximumSize().height())
+            if len(entry.heights) >= self.max_cached_widths:
+                del entry.heights[next(iter(entry.heights))]
+            entry.heights[width] = height
+            self.measurements += 1
+        return entry.hint, height
+
+    def _place(self, item, x, y, width, height):
+        geometry = QRect(x, y, width, height)
+        if item.geometry() != geometry:
+            item.setGeometry(geometry)
+            self.geometry_updates += 1
+
+    def _arrange(self, rect, apply):
+        """Lay items out in rect (only measuring unless apply) and return the height used."""
+        margins = self.contentsMargins()
+        area = rect.adjusted(margins.left(), margins.top(), -margins.right(), -margins.bottom())
+        items = [item for item in self._items if not item.isEmpty()]
+        spacing = max(0, self.spacing())
+        if not items:
+            return margins.top() + margins.bottom()
+        if self.uniform:
+            bottom = self._arrange_grid(items, area, spacing, apply)
+        else:
+            bottom = self._arrange_flow(items, area, spacing, apply)
+        return bottom - area.y() + margins.top() + margins.bottom()
+
+    def _arrange_grid(self, items, area, spacing, apply):
+        columns = max(1, (area.width() + spacing) // (self.min_column_width + spacing))
+        if self.max_columns:
+            columns = min(columns, self.max_columns)
+        columns = min(columns, len(items))
+        pitch = (area.width() + spacing) / columns
+        # Rounded column edges so the columns exactly fill the width
+        edges = [area.x() + round(column * pitch) for column in range(columns + 1)]
+        widths = [max(1, edges[column + 1] - edges[column] - spacing) for column in range(columns)]
+        y = area.y()
+        for start in range(0, len(items), columns):
+            row = items[start:start + columns]
+            height = max(self._measure(item, widths[column])[1] for column, item in enumerate(row))
+            if apply:
+                for column, item in enumerate(row):
+                    self._place(item, edges[column], y, widths[column], height)
+            y += height + spacing
+        return y - spacing
+
+    def _arrange_flow(self, items, area, spacing, apply):
+        x, y, line_height = area.x(), area.y(), 0
+        for item in items:
+            hint, _ = self._measure(item)
+            width = max(1, min(hint.width(), area.width()))
+            if x > area.x() and x + width > area.x() + area.width():
+                x, y, line_height = area.x(), y + line_height + spacing, 0
+            height = self._measure(item, width)[1]
+            if apply:
+                self._place(item, x, y, width, height)
+            x += width + spacing
+            line_height = max(line_height, height)
+        return y + line_height
@@ -0,0 +1,148 @@
+from PyQt5.QtWidgets import QFrame
+from PyQt5.QtCore import Qt, QObject, QTimer, QEasingCurve, QElapsedTimer, QRectF
+from PyQt5.QtGui import QPainter, QColor
+
+def blend_colors(start, end, progress):
+    """Linearly interpolate between two QColors, including alpha."""
+    return QColor(
+        round(start.red() + (end.red() - start.red()) * progress),
+        round(start.green() + (end.green() - start.green()) * progress),
+        round(start.blue() + (end.blue() - start.blue()) * progress),
+        round(start.alpha() + (end.alpha() - start.alpha()) * progress)
+    )
+
+class AnimationClock(QObject):
+    """Single app-wide timer that advances every running animation.
+
+    Animations register while they are in flight and drop out when they
+    finish, so the timer only runs while something is actually moving.
+    """
+
+    def __init__(self, interval=16, parent=None):
+        super().__init__(parent)
+        self._animations = set()
+        self._elapsed = QElapsedTimer()
+        self._elapsed.start()
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self._tick)
+        self.frames = 0
+
+    def now(self):
+        """Return the clock time in milliseconds."""
+        return self._elapsed.elapsed()
+
+    def start(self, animation):
+        """Advance an animation on every tick until its step() returns False."""
+        self._animations.add(animation)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def stop(self, animation):
+        """Stop advancing an animation."""
+        if animation not in self._animations:
+            return
+        self._animations.discard(animation)
+        if not self._animations:
+            self._timer.stop()
+
+    def active_count(self):
+        """Return the number of animations in flight."""
+        return len(self._animations)
+
+    def _tick(self):
+        self.frames += 1
+        now = self.now()
+        for animation in list(self._animations):
+            if not animation.step(now):
+                self._animations.discard(animation)
+        if not self._animations:
+            self._timer.stop()
+
+_clock = None
+
+def animation_clock():
+    """Return the shared animation clock, creating it on first use."""
+    global _clock
+    if _clock is None:
+        _clock = AnimationClock()
+    return _clock
+
+class HoverEffect:
+    """Eases a widget's hover progress between 0 and 1 and repaints it."""
+
+    def __init__(self, widget, duration=150, easing=QEasingCurve.OutCubic):
+        self.widget = widget
+        self.duration = duration
+        self._curve = QEasingCurve(easing)
+        self._linear = 0.0
+        self._from = 0.0
+        self._target = 0.0
+        self._start_time = 0
+        self.progress = 0.0
+
+    def set_hovered(self, hovered):
+        """Start easing towards the hovered or resting state."""
+        target = 1.0 if hovered else 0.0
+        if target == self._target:
+            return
+        clock = animation_clock()
+        self._from = self._linear
+        self._target = target
+        self._start_time = clock.now()
+        clock.start(self)
+
+    def step(self, now):
+        """Advance the animation; return False once it has settled."""
+        span = abs(self._target - self._from)
+        duration = max(1, self.duration * span)
+        t = min(1.0, (now - self._start_time) / duration)
+        self._linear = self._from + (self._target - self._from) * t
+        self.progress = self._curve.valueForProgress(self._linear)
+        self.widget.update()
+        return t < 1.0
+
+    def reset(self):
+        """Stop animating and snap back to the resting state."""
+        animation_clock().stop(self)
+        self._linear = self._from = self._target = 0.0
+        self.progress = 0.0
+
+class HoverCard(QFrame):
+    """Frame that paints its own rounded background and animates it on hover.
+
+    The background color is interpolated in paintEvent, so a hover costs
+    a repaint of this card only, never a stylesheet re-parse.
+    """
+
+    base_color = QColor(31, 31, 31, 204)
+    hover_color = QColor(45, 45, 45, 204)
+    radius = 4
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._hover_effect = HoverEffect(self)
+
+    def hover_progress(self):
+        """Return the current eased hover progress in [0, 1]."""
+        return self._hover_effect.progress
+
+    def enterEvent(self, event):
+        self._hover_effect.set_hovered(True)
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        self._hover_effect.set_hovered(False)
+        super().leaveEvent(event)
+
+    def hideEvent(self, event):
+        self._hover_effect.reset()
+        super().hideEvent(event)
+
+    def paintEvent(self, event):
+        """Paint the interpolated background behind the card's children."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(blend_colors(self.base_color, self.hover_color, self._hover_effect.progress))
+        painter.drawRoundedRect(QRectF(self.rect()), self.radius, self.radius)
@@ -0,0 +1,147 @@
+from PyQt5.QtWidgets import (QWidget, QGraphicsScene, QGraphicsPixmapItem, QGraphicsBlurEffect,
+                             QStyleOption, QStyle, qDrawBorderPixmap)
+from PyQt5.QtCore import Qt, QEvent, QRect, QRectF, QMargins
+from PyQt5.QtGui import QPainter, QColor, QImage, QPixmap
+from collections import namedtuple
+import math
+from core.census import image_bytes
+
+# color is an (r, g, b, a) tuple so specs can be used as cache keys
+ShadowSpec = namedtuple("ShadowSpec", "blur_radius color offset_x offset_y corner_radius")
+
+# Matches the QGraphicsDropShadowEffect ContentCard used to attach
+CARD_SHADOW = ShadowSpec(10, (0, 0, 0, 80), 0, 2, 4)
+
+class ShadowRenderer:
+    """Blurs each distinct shadow once and paints it as a nine-patch pixmap.
+
+    The cached pixmap is a blurred rounded rectangle whose interior is wide
+    enough to reach full opacity, so its corners hold the whole falloff;
+    edges and center are stretched to the target size, so a shadow of any
+    size costs nine pixmap blits per paint.
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    def memory(self):
+        """Return the number and pixel bytes of the cached nine-patches."""
+        return {
+            'pixmaps': len(self._cache),
+            'pixmap_bytes': sum(image_bytes(pixmap) for pixmap in self._cache.values())
+        }
+
+    def _margin(self, spec):
+        # The blur fades in over about twice its radius inside the card edge,
+        # so the corners must reach that far for the edges to be stretchable
+        return math.ceil(spec.blur_radius) + max(spec.corner_radius, 2 * math.ceil(spec.blur_radius))
+
+    def nine_patch(self, spec, device_pixel_ratio=1.0):
+        """Return the cached nine-patch pixmap for a shadow spec."""
+        key = (spec, device_pixel_ratio)
+        pixmap = self._cache.get(key)
+        if pixmap is None:
+            pixmap = self._render(spec, device_pixel_ratio)
+            self._cache[key] = pixmap
+        return pixmap
+
+    def _render(self, spec, device_pixel_ratio):
+        pad = math.ceil(spec.blur_radius)
+        margin = self._margin(spec)
+        # The rounded rect is wide enough to reach full opacity in its center
+        side = 2 * margin + 1
+        pixels = math.ceil(side * device_pixel_ratio)
+
+        # Solid rounded rect in the shadow color, inset by the blur padding
+        source = QImage(pixels, pixels, QImage.Format_ARGB32_Premultiplied)
+        source.fill(Qt.transparent)
+        painter = QPainter(source)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.scale(device_pixel_ratio, device_pixel_ratio)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(*spec.color))
+        painter.drawRoundedRect(QRectF(pad, pad, side - 2 * pad, side - 2 * pad),
+                                spec.corner_radius, spec.corner_radius)
+        painter.end()
+
+        # Blur it once through the graphics view pipeline
+        scene = QGraphicsScene()
+        item = QGraphicsPixmapItem(QPixmap.fromImage(source))
+        blur = QGraphicsBlurEffect()
+        # The blur effect spreads about twice as far as a drop shadow of the
+        # same radius; half matches QGraphicsDropShadowEffect (see
+        # benchmarks/shadow_check.py)
+        blur.setBlurRadius(spec.blur_radius * 0.5 * device_pixel_ratio)
+        blur.setBlurHints(QGraphicsBlurEffect.QualityHint)
+        item.setGraphicsEffect(blur)
+        scene.addItem(item)
+        blurred = QImage(pixels, pixels, QImage.Format_ARGB32_Premultiplied)
+        blurred.fill(Qt.transparent)
+        painter = QPainter(blurred)
+        scene.render(painter, QRectF(0, 0, pixels, pixels), QRectF(0, 0, pixels, pixels))
+        painter.end()
+
+        pixmap = QPixmap.fromImage(blurred)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        return pixmap
+
+    def paint(self, painter, rect, spec, device_pixel_ratio=1.0):
+        """Paint the shadow of a card occupying rect."""
+        pad = math.ceil(spec.blur_radius)
+        margin = self._margin(spec)
+        target = rect.translated(spec.offset_x, spec.offset_y).adjusted(-pad, -pad, pad, pad)
+        qDrawBorderPixmap(painter, target, QMargins(margin, margin, margin, margin),
+                          self.nine_patch(spec, device_pixel_ratio))
+
+    def clear(self):
+        self._cache.clear()
+
+# Shared instance; shadows are identical across cards
+shadow_renderer = ShadowRenderer()
+
+class ShadowHost(QWidget):
+    """Container that paints cached shadows beneath its direct children.
+
+    A child opts in by setting a ``shadow_spec`` attribute. Shadows are
+    painted in the host's paintEvent, before the children paint
+    themselves, and only where they intersect the exposed region.
+    """
+
+    def _shadow_bounds(self, rect, spec):
+        pad = math.ceil(spec.blur_radius)
+        return rect.translated(spec.offset_x, spec.offset_y).adjusted(-pad, -pad, pad, pad)
+
+    def childEvent(self, event):
+        if event.type() == QEvent.ChildAdded and event.child().isWidgetType():
+            event.child().installEventFilter(self)
+        super().childEvent(event)
+
+    def eventFilter(self, watched, event):
+        """Repaint the old and new shadow area when a card moves or resizes."""
+        spec = getattr(watched, "shadow_spec", None)
+        if spec is not None and watched.parent() is self:
+            if event.type() == QEvent.Move:
+                old = QRect(event.oldPos(), watched.size())
+            elif event.type() == QEvent.Resize:
+                old = QRect(watched.pos(), event.oldSize())
+            elif event.type() in (QEvent.Show, QEvent.Hide):
+                old = watched.geometry()
+            else:
+                return False
+            self.update(self._shadow_bounds(old, spec) | self._shadow_bounds(watched.geometry(), spec))
+        return False
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        option = QStyleOption()
+        option.initFrom(self)
+        self.style().drawPrimitive(QStyle.PE_Widget, option, painter, self)
+
+        dpr = self.devicePixelRatioF()
+        exposed = event.rect()
+        for child in self.findChildren(QWidget, options=Qt.FindDirectChildrenOnly):
+            spec = getattr(child, "shadow_spec", None)
+            if spec is None or not child.isVisible():
+                continue
+            if self._shadow_bounds(child.geometry(), spec).intersects(exposed):
+                shadow_renderer.paint(painter, child.geometry(), spec, dpr)
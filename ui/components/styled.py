@@ -0,0 +1,63 @@
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel
+
+class TitleLabel(QLabel):
+    """Bold label on a surface background, styled by ``#titleLabel`` in the QSS.
+
+    ``level`` selects the font size and padding: "page", "value", "card",
+    "section" or "window".
+    """
+
+    def __init__(self, text="", level="section", parent=None):
+        super().__init__(text, parent)
+        self.setObjectName("titleLabel")
+        self.setProperty("level", level)
+
+class CaptionLabel(QLabel):
+    """Muted secondary text, styled by ``#captionLabel`` in the QSS.
+
+    ``level`` is "card" for compact padding or "page" for roomier padding.
+    """
+
+    def __init__(self, text="", level="card", word_wrap=False, parent=None):
+        super().__init__(text, parent)
+        self.setObjectName("captionLabel")
+        self.setProperty("level", level)
+        self.setWordWrap(word_wrap)
+
+class RowLabel(QLabel):
+    """Label for the leading side of a setting row, styled by ``#rowLabel``."""
+
+    def __init__(self, text="", parent=None):
+        super().__init__(text, parent)
+        self.setObjectName("rowLabel")
+
+class SettingRow(QWidget):
+    """Horizontal row pairing a RowLabel with an input widget."""
+
+    def __init__(self, label_text, widget, parent=None):
+        super().__init__(parent)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.label = RowLabel(label_text)
+        self.widget = widget
+        layout.addWidget(self.label)
+        layout.addWidget(widget)
+
+def inline_stylesheet_report(root):
+    """Return the widgets under root (inclusive) that carry their own stylesheet.
+
+    Every such widget gets a private style object and re-parses its sheet
+    on polish, so this should stay at or near zero.
+    """
+    widgets = [root] + root.findChildren(QWidget)
+    offenders = [
+        f"{type(widget).__name__}#{widget.objectName()}" if widget.objectName()
+        else type(widget).__name__
+        for widget in widgets
+        if widget.styleSheet() and widget.window() is not widget
+    ]
+    return {
+        'widgets': len(widgets),
+        'inline_stylesheets': len(offenders),
+        'offenders': offenders
+    }
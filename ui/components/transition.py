@@ -0,0 +1,98 @@
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import Qt, QEasingCurve, QPointF
+from PyQt5.QtGui import QPainter
+from ui.components.hover import animation_clock
+import time
+
+class PageTransition(QWidget):
+    """Animates a page switch using snapshots instead of live widgets.
+
+    The overlay covers its parent and paints two pixmaps, sliding or
+    cross-fading between them on the shared animation clock, so no page
+    is laid out or repainted while the animation runs. ``finished`` is
+    called when it ends (or is cut short) so the real page can be shown.
+    """
+
+    duration = 200
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self._curve = QEasingCurve(QEasingCurve.OutCubic)
+        self._outgoing = None
+        self._incoming = None
+        self._mode = "slide"
+        self._direction = 1
+        self._finished = None
+        self._start_time = 0
+        self.progress = 0.0
+        self.hide()
+
+    @staticmethod
+    def snapshot(page, size):
+        """Render a page at size into a pixmap, laying it out first if hidden."""
+        if page.size() != size:
+            page.resize(size)
+        if page.layout() is not None:
+            page.layout().activate()
+        return page.grab()
+
+    def is_running(self):
+        return self._finished is not None
+
+    def start(self, outgoing, incoming, mode="slide", direction=1, finished=None):
+        """Animate from the outgoing to the incoming pixmap."""
+        self.finish()
+        self._outgoing = outgoing
+        self._incoming = incoming
+        self._mode = mode
+        self._direction = direction
+        self._finished = finished
+        self.progress = 0.0
+        self.setGeometry(self.parentWidget().rect())
+        self.show()
+        self.raise_()
+        clock = animation_clock()
+        self._start_time = clock.now()
+        clock.start(self)
+
+    def step(self, now):
+        """Advance the animation; return False once it has finished."""
+        t = min(1.0, (now - self._start_time) / self.duration)
+        self.progress = self._curve.valueForProgress(t)
+        self.update()
+        if t >= 1.0:
+            self.finish()
+            return False
+        return True
+
+    def finish(self):
+        """End the running transition at once and hand over to the real page."""
+        if self._finished is None:
+            return
+        animation_clock().stop(self)
+        finished, self._finished = self._finished, None
+        self._outgoing = self._incoming = None
+        self.hide()
+        finished()
+
+    def paintEvent(self, event):
+        if self._incoming is None:
+            return
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        if self._mode == "fade":
+            painter.drawPixmap(0, 0, self._outgoing)
+            painter.setOpacity(self.progress)
+            painter.drawPixmap(0, 0, self._incoming)
+            return
+        offset = self.width() * self.progress * self._direction
+        painter.drawPixmap(QPointF(-offset, 0), self._outgoing)
+        painter.drawPixmap(QPointF(self.width() * self._direction - offset, 0), self._incoming)
+
+def timed_snapshots(outgoing, incoming, size):
+    """Snapshot both pages; return (outgoing, incoming, elapsed_ms)."""
+    start = time.perf_counter()
+    before = PageTransition.snapshot(outgoing, size)
+    after = PageTransition.snapshot(incoming, size)
+    return before, after, (time.perf_counter() - start) * 1000
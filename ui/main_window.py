@@ -1,25 +1,59 @@
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
                              QLabel, QPushButton, QStackedWidget, QFrame, QSizeGrip)
-from PyQt5.QtCore import Qt, QPoint, QSize, pyqtSlot
-from PyQt5.QtGui import QIcon, QResizeEvent, QMoveEvent
+from PyQt5.QtCore import Qt, QPoint, QSize, QTimer, pyqtSlot
+from PyQt5.QtGui import QIcon, QColor, QResizeEvent, QMoveEvent
 
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from ui.sidebar import Sidebar
+from ui.sidebar import Sidebar, SidebarDelegate
+from ui.page_registry import PageRegistry
+from ui.components.styled import TitleLabel
+from ui.components.hover import HoverCard, animation_clock
+from ui.components.background import BackgroundPage, PageBackground
+from ui.components.card_view import CardDelegate
+from ui.components.chart import TimeSeriesChart
+from ui.components.shadow import shadow_renderer
+from ui.components.debug_overlay import DebugOverlay
+from ui.components.transition import PageTransition, timed_snapshots
 from ui.pages.home import HomePage
 from ui.pages.dashboard import DashboardPage
 from ui.pages.settings import SettingsPage
-from core.utils import WindowDragger, load_stylesheet, get_icon
+from core.data_provider import LocalDataProvider, stop_metric_feeds
+from core.profiler import profiler
+from core.instrumentation import Instrumentation
+from core.task_pool import shutdown_task_pool
+from core.settings_store import SettingsStore
+from core.settings_bus import SettingsBus
+from core.census import take_census, count_objects
+from core.icon_cache import icon_cache
+from core.theme import ThemeEngine, ThemeKey, DEFAULT_THEME, PRESETS, parse_color
+from core.utils import WindowDragger, LiveResizer, get_icon, get_pixmap
+
+# Title bar icons, rasterized once at this size and shared
+TITLE_BAR_ICON_SIZE = 16
+TITLE_BAR_ICONS = ["app", "minimize", "maximize", "restore", "close"]
 
 class MainWindow(QMainWindow):
     """Main application window with custom title bar and sidebar."""
     
-    def __init__(self):
+    # Per-pixel translucency is only needed for see-through or rounded
+    # window edges; an opaque window skips alpha compositing entirely
+    opaque = False
+    
+    # "slide", "fade" or None for instant page switches
+    page_transition = "slide"
+    # Switch instantly when snapshotting the pages takes longer than this
+    transition_budget_ms = 16.0
+    
+    def __init__(self, opaque=None, settings_store=None):
         super().__init__()
+        if opaque is not None:
+            self.opaque = opaque
         self.setWindowFlags(Qt.FramelessWindowHint)
-        self.setAttribute(Qt.WA_TranslucentBackground)
+        if not self.opaque:
+            self.setAttribute(Qt.WA_TranslucentBackground)
         self.setAttribute(Qt.WA_DeleteOnClose)  # Memory management
         
         # Window properties
@@ -27,18 +61,35 @@ class MainWindow(QMainWindow):
         self.minimum_height = 600
         self.setMinimumSize(self.minimum_width, self.minimum_height)
         
+        # Page lifetime limits (None disables the limit)
+        self.max_alive_pages = 4
+        self.page_memory_budget = None
+        
+        # Persistent settings, loaded before any page is built
+        self.settings_store = settings_store or SettingsStore()
+        self.settings_store.load()
+        
+        # Batched setting changes; subscribers outlive the settings page
+        self.settings_bus = SettingsBus(quiet_period=100, parent=self)
+        
+        # Source of live dashboard metrics (None keeps the cards static)
+        self.metrics_provider = LocalDataProvider()
+        
         # Initialize window dragger
         self.window_dragger = WindowDragger(self)
         
-        # Cache for frequently used widgets
-        self._cached_widgets = {}
-        
         # Set up the UI
-        self.setup_ui()
+        with profiler.span("setup_ui"):
+            self.setup_ui()
         
-        # Load and apply stylesheet
+        # Load and apply the theme stylesheet
+        self.theme_engine = ThemeEngine(parent=self)
+        self.theme_engine.themeApplied.connect(self._apply_painted_colors)
         self.load_styles()
         
+        # Debug Mode instrumentation overlay
+        self.setup_instrumentation()
+        
         # Center the window
         self.center_window()
         
@@ -73,15 +124,21 @@ class MainWindow(QMainWindow):
         self.stacked_widget = QStackedWidget()
         self.stacked_widget.setObjectName("contentArea")
         
-        # Initialize pages
-        self.home_page = HomePage()
-        self.dashboard_page = DashboardPage()
-        self.settings_page = SettingsPage()
+        # Register pages; each is built the first time it is shown
+        self.pages = PageRegistry(
+            self.stacked_widget,
+            max_alive_pages=self.max_alive_pages,
+            memory_budget=self.page_memory_budget,
+            parent=self
+        )
+        self.pages.register(0, HomePage)
+        self.pages.register(1, lambda: DashboardPage(provider=self.metrics_provider))
+        self.pages.register(2, lambda: SettingsPage(store=self.settings_store, bus=self.settings_bus))
+        self.pages.show(0)
         
-        # Add pages to stacked widget
-        self.stacked_widget.addWidget(self.home_page)
-        self.stacked_widget.addWidget(self.dashboard_page)
-        self.stacked_widget.addWidget(self.settings_page)
+        # Snapshot overlay for animated page switches
+        self.transition = PageTransition(self.stacked_widget)
+        self._snapshot_ms = {}
         
         content_layout.addWidget(self.stacked_widget)
         main_layout.addWidget(content_container)
@@ -89,9 +146,9 @@ class MainWindow(QMainWindow):
         # Connect sidebar signals
         self.sidebar.pageChanged.connect(self.change_page)
         
-        # Add size grip for resizing
+        # Add size grip for resizing; live drags are throttled
         size_grip = QSizeGrip(self)
-        size_grip.setStyleSheet("background: transparent;")
+        self.live_resizer = LiveResizer(self, size_grip, finished=self._finish_live_resize)
         
         # Create corner widget container
         corner_widget = QWidget()
@@ -100,10 +157,85 @@ class MainWindow(QMainWindow):
         corner_layout.addWidget(size_grip)
         content_layout.addWidget(corner_widget, alignment=Qt.AlignBottom | Qt.AlignRight)
 
+    def setup_instrumentation(self):
+        """Create the instrumentation overlay and tie it to the Debug Mode setting."""
+        self.instrumentation = Instrumentation(parent=self)
+        self.instrumentation.page_resolver = self._page_name_for
+        self.instrumentation.add_counter("animation frames", lambda: animation_clock().frames)
+        self.instrumentation.add_counter("drag events", lambda: self.window_dragger.move_events)
+        self.instrumentation.add_counter("drag moves", lambda: self.window_dragger.moves_applied)
+        self.instrumentation.add_counter("live resizes", lambda: self.live_resizer.resizes_applied)
+        self.debug_overlay = DebugOverlay(self.instrumentation, self.centralWidget())
+        
+        self.settings_bus.subscribe(
+            lambda delta: self.set_debug_mode(delta.changes["advanced.debug_mode"]),
+            prefix="advanced.debug_mode"
+        )
+        self.set_debug_mode(self.settings_store.get("advanced.debug_mode", False))
+    
+    def set_debug_mode(self, enabled):
+        """Show or hide the instrumentation overlay; collection stops when hidden."""
+        self.instrumentation.set_enabled(enabled)
+        self.debug_overlay.setVisible(enabled)
+    
+    def _page_name_for(self, widget):
+        """Return the class name of the page containing widget, if any."""
+        while widget is not None:
+            parent = widget.parentWidget()
+            if parent is self.stacked_widget:
+                return type(widget).__name__
+            widget = parent
+        return None
+
+    def census(self):
+        """Return a CensusSnapshot of the sidebar, each built page and shared caches.
+        
+        "content area" holds whatever the stacked widget owns besides the
+        pages themselves: placeholders and the transition overlay.
+        """
+        roots = {"sidebar": self.sidebar}
+        for index in self.pages.loaded_indices():
+            page = self.pages.page(index)
+            roots[f"page {index} {type(page).__name__}"] = page
+        snapshot = take_census(roots, shared={
+            "icon cache": icon_cache.memory(),
+            "shadow cache": shadow_renderer.memory(),
+            "background cache": PageBackground.memory()
+        })
+        content = count_objects(self.stacked_widget)
+        for name, counts in snapshot.sections.items():
+            if name.startswith("page "):
+                for key in content:
+                    content[key] -= counts[key]
+        snapshot.sections["content area"] = content
+        return snapshot
+
     @pyqtSlot(int)
     def change_page(self, index):
-        """Change the current page with smooth transition."""
-        self.stacked_widget.setCurrentIndex(index)
+        """Change the current page with smooth transition.
+        
+        Both pages are captured as pixmaps and animated by the transition
+        overlay; the real page is shown once it ends. Pages whose last
+        snapshot blew the frame budget switch instantly.
+        """
+        self.transition.finish()
+        self.sidebar.set_current_page(index)
+        current = self.stacked_widget.currentIndex()
+        if (not self.page_transition or index == current or not self.isVisible()
+                or self._snapshot_ms.get(index, 0) > self.transition_budget_ms):
+            self.pages.show(index)
+            return
+        
+        outgoing = self.stacked_widget.currentWidget()
+        incoming = self.pages.page(index)
+        before, after, elapsed = timed_snapshots(outgoing, incoming, self.stacked_widget.size())
+        self._snapshot_ms[index] = elapsed
+        if elapsed > self.transition_budget_ms:
+            self.pages.show(index)
+            return
+        self.transition.start(before, after, self.page_transition,
+                              1 if index > current else -1,
+                              finished=lambda: self.pages.show(index))
 
     def add_title_bar(self, layout):
         """Add a custom title bar with optimized controls."""
@@ -120,17 +252,10 @@ class MainWindow(QMainWindow):
         title_container_layout.setSpacing(4)
         
         window_icon = QLabel()
-        window_icon.setPixmap(get_icon("app").pixmap(16, 16))
+        window_icon.setPixmap(get_pixmap("app", TITLE_BAR_ICON_SIZE))
         title_container_layout.addWidget(window_icon)
         
-        title = QLabel("Modern PyQt5 App")
-        title.setStyleSheet("""
-            font-weight: bold;
-            font-size: 10px;
-            background-color: rgba(31, 31, 31, 0.8);
-            border-radius: 4px;
-            padding: 4px;
-        """)
+        title = TitleLabel("Modern PyQt5 App", level="window")
         title_container_layout.addWidget(title)
         title_bar_layout.addWidget(title_container)
         
@@ -145,7 +270,7 @@ class MainWindow(QMainWindow):
         # Minimize button
         minimize_btn = QPushButton()
         minimize_btn.setObjectName("minimizeBtn")
-        minimize_btn.setIcon(get_icon("minimize"))
+        minimize_btn.setIcon(get_icon("minimize", TITLE_BAR_ICON_SIZE))
         minimize_btn.setToolTip("Minimize")
         minimize_btn.clicked.connect(self.showMinimized)
         controls_layout.addWidget(minimize_btn)
@@ -153,7 +278,7 @@ class MainWindow(QMainWindow):
         # Maximize button
         self.maximize_btn = QPushButton()
         self.maximize_btn.setObjectName("maximizeBtn")
-        self.maximize_btn.setIcon(get_icon("maximize"))
+        self.maximize_btn.setIcon(get_icon("maximize", TITLE_BAR_ICON_SIZE))
         self.maximize_btn.setToolTip("Maximize")
         self.maximize_btn.clicked.connect(self.toggle_maximize)
         controls_layout.addWidget(self.maximize_btn)
@@ -161,7 +286,7 @@ class MainWindow(QMainWindow):
         # Close button
         close_btn = QPushButton()
         close_btn.setObjectName("closeBtn")
-        close_btn.setIcon(get_icon("close"))
+        close_btn.setIcon(get_icon("close", TITLE_BAR_ICON_SIZE))
         close_btn.setToolTip("Close")
         close_btn.clicked.connect(self.close)
         controls_layout.addWidget(close_btn)
@@ -178,11 +303,11 @@ class MainWindow(QMainWindow):
         """Toggle between maximized and normal window state with animation."""
         if self._is_maximized:
             self.showNormal()
-            self.maximize_btn.setIcon(get_icon("maximize"))
+            self.maximize_btn.setIcon(get_icon("maximize", TITLE_BAR_ICON_SIZE))
             self.maximize_btn.setToolTip("Maximize")
         else:
             self.showMaximized()
-            self.maximize_btn.setIcon(get_icon("restore"))
+            self.maximize_btn.setIcon(get_icon("restore", TITLE_BAR_ICON_SIZE))
             self.maximize_btn.setToolTip("Restore")
         self._is_maximized = not self._is_maximized
 
@@ -198,20 +323,78 @@ class MainWindow(QMainWindow):
         )
 
     def load_styles(self):
-        """Load and apply the application stylesheet."""
-        style = load_stylesheet("resources/style.qss")
-        if style:
-            self.setStyleSheet(style)
+        """Apply the saved theme and follow theme settings from then on."""
+        key = self._theme_key(self.settings_store.get)
+        with profiler.span("load_stylesheet", "style"):
+            self.theme_engine.theme(key)
+        with profiler.span("apply_stylesheet", "style"):
+            self.theme_engine.apply(self, key)
+        
+        self.settings_bus.subscribe(
+            lambda delta: self.theme_engine.apply(self, self._theme_key(self.settings_bus.value)),
+            prefix="theme."
+        )
+        # Compile the other presets once startup has settled
+        QTimer.singleShot(1000, lambda: self.theme_engine.precompile(
+            [key._replace(preset=name) for name in PRESETS]
+        ))
+    
+    def _theme_key(self, get):
+        """Build a ThemeKey from a settings lookup such as store.get."""
+        return ThemeKey(
+            get("theme.custom_theme", DEFAULT_THEME.preset),
+            get("theme.accent_color", DEFAULT_THEME.accent),
+            get("theme.dark_mode", DEFAULT_THEME.dark),
+            get("theme.font_size", DEFAULT_THEME.font_size)
+        )
+    
+    def _apply_painted_colors(self, theme):
+        """Recolor widgets that paint themselves instead of using the stylesheet."""
+        colors = {name: parse_color(value) for name, value in theme.variables.items()
+                  if name in ("background", "background-alt", "foreground", "muted",
+                              "surface", "surface-hover", "hover-subtle", "accent", "accent-subtle")}
+        HoverCard.base_color = colors["surface"]
+        HoverCard.hover_color = colors["surface-hover"]
+        CardDelegate.background = colors["surface"]
+        CardDelegate.hover_background = colors["surface-hover"]
+        CardDelegate.title_color = colors["foreground"]
+        CardDelegate.content_color = colors["muted"]
+        SidebarDelegate.hover_color = colors["hover-subtle"]
+        SidebarDelegate.selected_color = colors["accent-subtle"]
+        SidebarDelegate.header_color = colors["muted"]
+        BackgroundPage.background = PageBackground(colors["background"])
+        DashboardPage.background = PageBackground(colors["background"], colors["background-alt"])
+        TimeSeriesChart.background = colors["background-alt"]
+        TimeSeriesChart.grid_color = colors["hover-subtle"]
+        TimeSeriesChart.text_color = colors["muted"]
+        accent = QColor(colors["accent"])
+        accent.setAlpha(255)
+        TimeSeriesChart.series_colors = [accent] + TimeSeriesChart.series_colors[1:]
 
     def resizeEvent(self, event: QResizeEvent):
         """Handle window resize events."""
         super().resizeEvent(event)
         # Update cached sizes and layouts if needed
         new_size = event.size()
+        if hasattr(self, 'debug_overlay') and self.debug_overlay.isVisible():
+            self.debug_overlay.reposition()
+        if hasattr(self, 'transition'):
+            self.transition.finish()
+        if hasattr(self, 'live_resizer') and self.live_resizer.active:
+            # Size-dependent tweaks wait for the final layout pass
+            return
         if hasattr(self, '_last_size'):
             if self._last_size != new_size:
                 self._update_layout_for_size(new_size)
         self._last_size = new_size
+    
+    def _finish_live_resize(self):
+        """Run the layout work deferred while the size grip was held."""
+        size = self.size()
+        self._update_layout_for_size(size)
+        self._last_size = size
+        self.centralWidget().layout().activate()
+        self.update()
 
     def _update_layout_for_size(self, size: QSize):
         """Update layouts based on new window size."""
@@ -230,6 +413,7 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Clean up resources before closing."""
-        # Clear caches
-        self._cached_widgets.clear()
+        self.settings_store.close()
+        shutdown_task_pool()
+        stop_metric_feeds()
         super().closeEvent(event) 
\ No newline at end of file
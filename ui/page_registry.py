@@ -0,0 +1,132 @@
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import QObject, pyqtSignal
+from collections import OrderedDict
+from core.profiler import profiler
+from core.census import count_objects
+
+def estimate_page_cost(page):
+    """Approximate the resident size of a page in bytes from its object census."""
+    return count_objects(page)["approx_bytes"]
+
+class PageRegistry(QObject):
+    """Builds stacked widget pages on first use and evicts hidden ones.
+
+    Each index of the stacked widget holds either a lightweight placeholder
+    or the real page. Pages are constructed by their factory the first time
+    they are shown. When more than ``max_alive_pages`` are alive, or their
+    estimated cost exceeds ``memory_budget``, the least recently shown
+    hidden pages are destroyed again. Pages may implement ``save_state()``
+    and ``restore_state(state)`` to survive eviction.
+    """
+
+    # Emitted after a page has been constructed and inserted
+    pageCreated = pyqtSignal(int, QWidget)
+    # Emitted after a page has been destroyed and replaced by a placeholder
+    pageEvicted = pyqtSignal(int)
+
+    def __init__(self, stacked_widget, max_alive_pages=None, memory_budget=None,
+                 cost_function=estimate_page_cost, parent=None):
+        super().__init__(parent)
+        self.stacked_widget = stacked_widget
+        self.max_alive_pages = max_alive_pages
+        self.memory_budget = memory_budget
+        self.cost_function = cost_function
+        self._factories = {}
+        self._pinned = set()
+        self._saved_states = {}
+        # index -> (page, cost), ordered from least to most recently shown
+        self._alive = OrderedDict()
+
+    def register(self, index, factory, pinned=False):
+        """Register a page factory for a stacked widget index."""
+        if index in self._factories:
+            raise ValueError(f"Page index {index} is already registered")
+        self._factories[index] = factory
+        if pinned:
+            self._pinned.add(index)
+        while self.stacked_widget.count() <= index:
+            self.stacked_widget.addWidget(QWidget())
+
+    def is_loaded(self, index):
+        """Return whether the page at index is currently constructed."""
+        return index in self._alive
+
+    def loaded_indices(self):
+        """Return the indices of constructed pages, least recently shown first."""
+        return list(self._alive)
+
+    def page(self, index):
+        """Return the page at index, constructing it if needed."""
+        if index in self._alive:
+            return self._alive[index][0]
+        factory = self._factories.get(index)
+        if factory is None:
+            raise KeyError(f"No page registered for index {index}")
+
+        with profiler.span(f"construct page {index}", "page"):
+            page = factory()
+        state = self._saved_states.pop(index, None)
+        if state is not None and hasattr(page, "restore_state"):
+            page.restore_state(state)
+
+        current = self.stacked_widget.currentIndex()
+        placeholder = self.stacked_widget.widget(index)
+        self.stacked_widget.insertWidget(index, page)
+        self.stacked_widget.removeWidget(placeholder)
+        placeholder.deleteLater()
+        if current == index:
+            self.stacked_widget.setCurrentIndex(index)
+
+        self._alive[index] = (page, self.cost_function(page) if self.cost_function else 0)
+        self.pageCreated.emit(index, page)
+        return page
+
+    def show(self, index):
+        """Construct the page at index if needed and make it current."""
+        page = self.page(index)
+        self._alive.move_to_end(index)
+        self.stacked_widget.setCurrentIndex(index)
+        self._evict()
+        return page
+
+    def evict(self, index):
+        """Destroy the page at index, keeping its saved state for later."""
+        if index not in self._alive:
+            return
+        page, _ = self._alive.pop(index)
+        if hasattr(page, "save_state"):
+            self._saved_states[index] = page.save_state()
+
+        current = self.stacked_widget.currentIndex()
+        self.stacked_widget.insertWidget(index, QWidget())
+        self.stacked_widget.removeWidget(page)
+        if current == index:
+            self.stacked_widget.setCurrentIndex(index)
+        page.deleteLater()
+        self.pageEvicted.emit(index)
+
+    def clear(self):
+        """Destroy every constructed page."""
+        for index in list(self._alive):
+            self.evict(index)
+
+    def total_cost(self):
+        """Return the summed estimated cost of all constructed pages."""
+        return sum(cost for _, cost in self._alive.values())
+
+    def _over_budget(self):
+        if self.max_alive_pages is not None and len(self._alive) > self.max_alive_pages:
+            return True
+        if self.memory_budget is not None and self.total_cost() > self.memory_budget:
+            return True
+        return False
+
+    def _evict(self):
+        """Evict least recently shown hidden pages until within budget."""
+        current = self.stacked_widget.currentIndex()
+        for index in list(self._alive):
+            if not self._over_budget():
+                break
+            if index == current or index in self._pinned:
+                continue
+            self.evict(index)
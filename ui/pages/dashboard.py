@@ -1,9 +1,17 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                             QPushButton, QFrame, QScrollArea, QGraphicsDropShadowEffect)
-from PyQt5.QtCore import Qt, QPropertyAnimation, QParallelAnimationGroup, QEasingCurve, QRectF
-from PyQt5.QtGui import QPainter, QColor, QPainterPath, QLinearGradient
+from PyQt5.QtWidgets import QVBoxLayout, QFrame, QScrollArea, QGraphicsDropShadowEffect
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor
+from ui.components.hover import HoverCard
+from ui.components.background import BackgroundPage, PageBackground
+from ui.components.styled import TitleLabel, CaptionLabel
+from ui.components.shadow import ShadowHost, CARD_SHADOW
+from ui.components.card_view import CardListView
+from ui.components.chart import TimeSeriesChart
+from ui.components.grid_layout import ResponsiveGridLayout
+from core.data_provider import MetricFeed
+import time
 
-class StatCard(QFrame):
+class StatCard(HoverCard):
     """Interactive statistics card with hover animations."""
     
     def __init__(self, title, value, parent=None):
@@ -16,65 +24,27 @@ class StatCard(QFrame):
         layout.setSpacing(4)
         
         # Value
-        value_label = QLabel(value)
-        value_label.setStyleSheet("""
-            font-size: 24px;
-            font-weight: bold;
-            background-color: rgba(31, 31, 31, 0.8);
-            border-radius: 4px;
-            padding: 4px;
-        """)
-        layout.addWidget(value_label)
+        self.value_label = TitleLabel(value, level="value")
+        layout.addWidget(self.value_label)
         
         # Title
-        title_label = QLabel(title)
-        title_label.setStyleSheet("""
-            color: #888;
-            background-color: rgba(31, 31, 31, 0.8);
-            border-radius: 4px;
-            padding: 4px;
-        """)
+        title_label = CaptionLabel(title)
         layout.addWidget(title_label)
-        
-        # Setup animations
-        self._hover_animation = QPropertyAnimation(self, b"styleSheet")
-        self._hover_animation.setDuration(150)
-        self._hover_animation.setEasingCurve(QEasingCurve.OutCubic)
-        
-        self._base_style = """
-            QFrame#statCard {
-                background-color: rgba(31, 31, 31, 0.8);
-                border-radius: 4px;
-                padding: 8px;
-            }
-        """
-        
-        self._hover_style = """
-            QFrame#statCard {
-                background-color: rgba(45, 45, 45, 0.8);
-                border-radius: 4px;
-                padding: 8px;
-            }
-        """
-        
-        self.setStyleSheet(self._base_style)
-    
-    def enterEvent(self, event):
-        self._hover_animation.setStartValue(self._base_style)
-        self._hover_animation.setEndValue(self._hover_style)
-        self._hover_animation.start()
-        super().enterEvent(event)
     
-    def leaveEvent(self, event):
-        self._hover_animation.setStartValue(self._hover_style)
-        self._hover_animation.setEndValue(self._base_style)
-        self._hover_animation.start()
-        super().leaveEvent(event)
+    def set_value(self, value):
+        """Update the displayed value, repainting only if the text changed."""
+        if value != self.value_label.text():
+            self.value_label.setText(value)
 
 class ContentCard(QFrame):
-    """Content card with hover effect."""
+    """Content card with a drop shadow.
+    
+    ``shadow`` selects how the shadow is drawn: "cached" paints a shared
+    nine-patch from the parent ShadowHost, "effect" uses a per-card
+    QGraphicsDropShadowEffect, and None disables it.
+    """
     
-    def __init__(self, title, content, parent=None):
+    def __init__(self, title, content, parent=None, shadow="cached"):
         super().__init__(parent)
         self.setObjectName("contentCard")
         
@@ -83,48 +53,37 @@ class ContentCard(QFrame):
         layout.setSpacing(8)
         
         # Title
-        title_label = QLabel(title)
-        title_label.setStyleSheet("""
-            font-size: 14px;
-            font-weight: bold;
-            background-color: rgba(31, 31, 31, 0.8);
-            border-radius: 4px;
-            padding: 4px;
-        """)
+        title_label = TitleLabel(title, level="section")
         layout.addWidget(title_label)
         
         # Content
-        content_label = QLabel(content)
-        content_label.setWordWrap(True)
-        content_label.setStyleSheet("""
-            color: #888;
-            background-color: rgba(31, 31, 31, 0.8);
-            border-radius: 4px;
-            padding: 4px;
-        """)
+        content_label = CaptionLabel(content, word_wrap=True)
         layout.addWidget(content_label)
         
-        # Setup shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(10)
-        shadow.setColor(QColor(0, 0, 0, 80))
-        shadow.setOffset(0, 2)
-        self.setGraphicsEffect(shadow)
-        
-        # Setup style
-        self.setStyleSheet("""
-            QFrame#contentCard {
-                background-color: rgba(31, 31, 31, 0.8);
-                border-radius: 4px;
-                padding: 8px;
-            }
-        """)
+        # Setup shadow
+        self.shadow_spec = None
+        if shadow == "cached":
+            self.shadow_spec = CARD_SHADOW
+        elif shadow == "effect":
+            effect = QGraphicsDropShadowEffect()
+            effect.setBlurRadius(CARD_SHADOW.blur_radius)
+            effect.setColor(QColor(*CARD_SHADOW.color))
+            effect.setOffset(CARD_SHADOW.offset_x, CARD_SHADOW.offset_y)
+            self.setGraphicsEffect(effect)
 
-class DashboardPage(QWidget):
-    """Dashboard page with statistics and content cards."""
+class DashboardPage(BackgroundPage):
+    """Dashboard page with statistics and content cards.
     
-    def __init__(self, parent=None):
+    When given a DataProvider, the stat cards are bound to its metrics and
+    updated live while the page is visible.
+    """
+    
+    background = PageBackground(QColor(18, 18, 18), QColor(24, 24, 24))
+    
+    def __init__(self, parent=None, provider=None):
         super().__init__(parent)
+        self.stat_cards = {}
+        self.metric_feed = MetricFeed(provider, parent=self) if provider else None
         self.setup_ui()
     
     def setup_ui(self):
@@ -139,40 +98,46 @@ class DashboardPage(QWidget):
         scroll_area.setWidgetResizable(True)
         scroll_area.setFrameShape(QFrame.NoFrame)
         
-        # Content widget
-        content_widget = QWidget()
+        # Content widget; paints the content card shadows
+        content_widget = ShadowHost()
         content_layout = QVBoxLayout(content_widget)
         content_layout.setContentsMargins(0, 0, 0, 0)
         content_layout.setSpacing(16)
         
         # Header
-        header = QLabel("Dashboard")
-        header.setStyleSheet("""
-            font-size: 24px;
-            font-weight: bold;
-            background-color: rgba(31, 31, 31, 0.8);
-            border-radius: 4px;
-            padding: 8px;
-        """)
+        header = TitleLabel("Dashboard", level="page")
         content_layout.addWidget(header)
         
-        # Statistics section
-        stats_layout = QHBoxLayout()
-        stats_layout.setSpacing(16)
+        # Statistics section; wraps into fewer columns on narrow windows
+        stats_layout = ResponsiveGridLayout(min_column_width=160, spacing=16)
         
-        # Stat cards
+        # Stat cards: title, initial value, metric key, formatter
         stats = [
-            ("Active Users", "1,234"),
-            ("Total Revenue", "$5,678"),
-            ("Growth Rate", "+12.3%")
+            ("Active Users", "1,234", "active_users", "{:,.0f}".format),
+            ("Total Revenue", "$5,678", "total_revenue", "${:,.0f}".format),
+            ("Growth Rate", "+12.3%", "growth_rate", "{:+.1f}%".format)
         ]
         
-        for title, value in stats:
+        for title, value, key, formatter in stats:
             card = StatCard(title, value)
             stats_layout.addWidget(card)
+            self.stat_cards[key] = card
+            if self.metric_feed:
+                self.metric_feed.bind(key, card.set_value, formatter)
         
         content_layout.addLayout(stats_layout)
         
+        # Live chart of the last two minutes of active users
+        chart_header = TitleLabel("Active Users", level="section")
+        content_layout.addWidget(chart_header)
+        
+        self.activity_chart = TimeSeriesChart(span=120)
+        self.activity_chart.setMinimumHeight(180)
+        self.activity_chart.add_series("active_users", capacity=86400)
+        if self.metric_feed:
+            self.metric_feed.bind("active_users", self.record_active_users, float)
+        content_layout.addWidget(self.activity_chart)
+        
         # Content cards section
         cards_layout = QVBoxLayout()
         cards_layout.setSpacing(16)
@@ -189,24 +154,40 @@ class DashboardPage(QWidget):
             cards_layout.addWidget(card)
         
         content_layout.addLayout(cards_layout)
-        content_layout.addStretch()
+        
+        # Activity feed; rows are painted by a delegate, not built as widgets
+        feed_header = TitleLabel("Activity Feed", level="section")
+        content_layout.addWidget(feed_header)
+        
+        self.activity_view = CardListView()
+        self.activity_view.setMinimumHeight(320)
+        self.activity_view.append_cards([
+            ("Deployment finished", "Version 1.4.2 was rolled out to all regions."),
+            ("New sign-ups", "48 users joined in the last hour."),
+            ("Backup completed", "Nightly backup finished in 3 minutes with no errors.")
+        ])
+        content_layout.addWidget(self.activity_view, 1)
         
         # Set scroll area widget
         scroll_area.setWidget(content_widget)
         main_layout.addWidget(scroll_area)
     
-    def paintEvent(self, event):
-        """Custom paint event for page background."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Create gradient background
-        gradient = QLinearGradient(0, 0, 0, self.height())
-        gradient.setColorAt(0, QColor(18, 18, 18))
-        gradient.setColorAt(1, QColor(24, 24, 24))
-        
-        # Draw background
-        path = QPainterPath()
-        rect = self.rect()
-        path.addRect(QRectF(rect))
-        painter.fillPath(path, gradient) 
\ No newline at end of file
+    def record_active_users(self, value):
+        """Append a live active users sample to the chart."""
+        self.activity_chart.append("active_users", time.monotonic(), value)
+    
+    def append_activity(self, entries):
+        """Append (title, content) entries to the activity feed."""
+        self.activity_view.append_cards(entries)
+    
+    def showEvent(self, event):
+        """Resume live metrics while the page is visible."""
+        super().showEvent(event)
+        if self.metric_feed:
+            self.metric_feed.start()
+    
+    def hideEvent(self, event):
+        """Pause live metrics while the page is hidden."""
+        if self.metric_feed:
+            self.metric_feed.stop()
+        super().hideEvent(event)
@@ -1,8 +1,11 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QScrollArea
-from PyQt5.QtCore import Qt, QPropertyAnimation, QParallelAnimationGroup, QEasingCurve, QRectF
-from PyQt5.QtGui import QPainter, QColor, QPainterPath
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QFrame, QScrollArea
+from PyQt5.QtCore import Qt
+from ui.components.hover import HoverCard
+from ui.components.background import BackgroundPage
+from ui.components.styled import TitleLabel, CaptionLabel
+from ui.components.grid_layout import ResponsiveGridLayout
 
-class ActionCard(QFrame):
+class ActionCard(HoverCard):
     """Interactive action card with hover animations."""
     
     def __init__(self, title, description, parent=None):
@@ -15,63 +18,14 @@ class ActionCard(QFrame):
         layout.setSpacing(8)
         
         # Title
-        title_label = QLabel(title)
-        title_label.setStyleSheet("""
-            font-size: 18px;
-            font-weight: bold;
-            background-color: rgba(31, 31, 31, 0.8);
-            border-radius: 4px;
-            padding: 4px;
-        """)
+        title_label = TitleLabel(title, level="card")
         layout.addWidget(title_label)
         
         # Description
-        desc_label = QLabel(description)
-        desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("""
-            color: #888;
-            background-color: rgba(31, 31, 31, 0.8);
-            border-radius: 4px;
-            padding: 4px;
-        """)
+        desc_label = CaptionLabel(description, word_wrap=True)
         layout.addWidget(desc_label)
-        
-        # Setup animations
-        self._hover_animation = QPropertyAnimation(self, b"styleSheet")
-        self._hover_animation.setDuration(150)
-        self._hover_animation.setEasingCurve(QEasingCurve.OutCubic)
-        
-        self._base_style = """
-            QFrame#actionCard {
-                background-color: rgba(31, 31, 31, 0.8);
-                border-radius: 4px;
-                padding: 8px;
-            }
-        """
-        
-        self._hover_style = """
-            QFrame#actionCard {
-                background-color: rgba(45, 45, 45, 0.8);
-                border-radius: 4px;
-                padding: 8px;
-            }
-        """
-        
-        self.setStyleSheet(self._base_style)
-    
-    def enterEvent(self, event):
-        self._hover_animation.setStartValue(self._base_style)
-        self._hover_animation.setEndValue(self._hover_style)
-        self._hover_animation.start()
-        super().enterEvent(event)
-    
-    def leaveEvent(self, event):
-        self._hover_animation.setStartValue(self._hover_style)
-        self._hover_animation.setEndValue(self._base_style)
-        self._hover_animation.start()
-        super().leaveEvent(event)
 
-class HomePage(QWidget):
+class HomePage(BackgroundPage):
     """Home page with welcome message and quick actions."""
     
     def __init__(self, parent=None):
@@ -103,31 +57,17 @@ class HomePage(QWidget):
         welcome_layout.setSpacing(8)
         
         # Welcome header
-        header = QLabel("Welcome to Modern PyQt5 App")
-        header.setStyleSheet("""
-            font-size: 24px;
-            font-weight: bold;
-            background-color: rgba(31, 31, 31, 0.8);
-            border-radius: 4px;
-            padding: 8px;
-        """)
+        header = TitleLabel("Welcome to Modern PyQt5 App", level="page")
         welcome_layout.addWidget(header)
         
         # Welcome message
-        message = QLabel("Get started with these quick actions:")
-        message.setStyleSheet("""
-            color: #888;
-            background-color: rgba(31, 31, 31, 0.8);
-            border-radius: 4px;
-            padding: 8px;
-        """)
+        message = CaptionLabel("Get started with these quick actions:", level="page")
         welcome_layout.addWidget(message)
         
         content_layout.addWidget(welcome_frame)
         
-        # Quick actions grid
-        actions_layout = QHBoxLayout()
-        actions_layout.setSpacing(16)
+        # Quick actions grid; wraps into fewer columns on narrow windows
+        actions_layout = ResponsiveGridLayout(min_column_width=200, spacing=16)
         
         # Action cards
         actions = [
@@ -146,14 +86,3 @@ class HomePage(QWidget):
         # Set scroll area widget
         scroll_area.setWidget(content_widget)
         main_layout.addWidget(scroll_area)
-    
-    def paintEvent(self, event):
-        """Custom paint event for page background."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Draw background
-        path = QPainterPath()
-        rect = self.rect()
-        path.addRect(QRectF(rect))
-        painter.fillPath(path, QColor(18, 18, 18)) 
\ No newline at end of file
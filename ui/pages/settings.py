@@ -1,10 +1,11 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                             QCheckBox, QFrame, QComboBox, QPushButton, QScrollArea,
-                             QSpinBox, QLineEdit)
-from PyQt5.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve, QRectF
-from PyQt5.QtGui import QPainter, QColor, QPainterPath
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QCheckBox, QFrame, QComboBox,
+                             QPushButton, QScrollArea, QSpinBox, QLineEdit)
+from PyQt5.QtCore import pyqtSignal
+from ui.components.hover import HoverCard
+from ui.components.background import BackgroundPage
+from ui.components.styled import TitleLabel, SettingRow
 
-class SettingsSection(QFrame):
+class SettingsSection(HoverCard):
     """Settings section with animated hover effect."""
     
     def __init__(self, title, parent=None):
@@ -16,14 +17,7 @@ class SettingsSection(QFrame):
         layout.setSpacing(8)
         
         # Title
-        title_label = QLabel(title)
-        title_label.setStyleSheet("""
-            font-size: 14px;
-            font-weight: bold;
-            background-color: rgba(31, 31, 31, 0.8);
-            border-radius: 4px;
-            padding: 4px;
-        """)
+        title_label = TitleLabel(title, level="section")
         layout.addWidget(title_label)
         
         # Content container
@@ -32,44 +26,15 @@ class SettingsSection(QFrame):
         self.content_layout.setContentsMargins(8, 0, 8, 0)
         self.content_layout.setSpacing(8)
         layout.addWidget(self.content_container)
-        
-        # Setup animations
-        self._hover_animation = QPropertyAnimation(self, b"styleSheet")
-        self._hover_animation.setDuration(150)
-        self._hover_animation.setEasingCurve(QEasingCurve.OutCubic)
-        
-        self._base_style = """
-            QFrame#settingsSection {
-                background-color: rgba(31, 31, 31, 0.8);
-                border-radius: 4px;
-                padding: 8px;
-            }
-        """
-        
-        self._hover_style = """
-            QFrame#settingsSection {
-                background-color: rgba(45, 45, 45, 0.8);
-                border-radius: 4px;
-                padding: 8px;
-            }
-        """
-        
-        self.setStyleSheet(self._base_style)
-    
-    def enterEvent(self, event):
-        self._hover_animation.setStartValue(self._base_style)
-        self._hover_animation.setEndValue(self._hover_style)
-        self._hover_animation.start()
-        super().enterEvent(event)
-    
-    def leaveEvent(self, event):
-        self._hover_animation.setStartValue(self._hover_style)
-        self._hover_animation.setEndValue(self._base_style)
-        self._hover_animation.start()
-        super().leaveEvent(event)
 
-class SettingsPage(QWidget):
-    """Settings page with customizable options."""
+class SettingsPage(BackgroundPage):
+    """Settings page with customizable options.
+    
+    When given a SettingsStore, the page is populated from it on
+    construction and save_settings persists the current values. When
+    given a SettingsBus, every edit is also published to it under the
+    setting's dotted key.
+    """
     
     # Signals for settings changes
     themeChanged = pyqtSignal(bool)
@@ -80,26 +45,20 @@ class SettingsPage(QWidget):
     apiKeyChanged = pyqtSignal(str)
     customThemeChanged = pyqtSignal(str)
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, store=None, bus=None):
         super().__init__(parent)
+        self.settings_store = store
+        self.settings_bus = bus
         self.setup_ui()
+        if store is not None:
+            self.restore_state(store.snapshot())
+        if bus is not None:
+            bus.seed(self.save_state())
+            self._connect_bus(bus)
     
     def create_setting_row(self, label_text, widget):
         """Helper method to create a consistent setting row layout."""
-        container = QWidget()
-        layout = QHBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        
-        label = QLabel(label_text)
-        label.setStyleSheet("""
-            background-color: rgba(31, 31, 31, 0.8);
-            border-radius: 4px;
-            padding: 4px;
-        """)
-        layout.addWidget(label)
-        layout.addWidget(widget)
-        
-        return container
+        return SettingRow(label_text, widget)
 
     def setup_ui(self):
         """Initialize the settings UI components."""
@@ -120,14 +79,7 @@ class SettingsPage(QWidget):
         content_layout.setSpacing(16)
         
         # Header
-        header = QLabel("Settings")
-        header.setStyleSheet("""
-            font-size: 24px;
-            font-weight: bold;
-            background-color: rgba(31, 31, 31, 0.8);
-            border-radius: 4px;
-            padding: 8px;
-        """)
+        header = TitleLabel("Settings", level="page")
         content_layout.addWidget(header)
         
         # SECTION 1: Appearance
@@ -239,60 +191,76 @@ class SettingsPage(QWidget):
         
         # Add save button
         self.save_button = QPushButton("Save Settings")
+        self.save_button.setObjectName("saveButton")
         self.save_button.clicked.connect(self.save_settings)
-        self.save_button.setStyleSheet("""
-            QPushButton {
-                background-color: #0078D7;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                color: white;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1084E2;
-            }
-            QPushButton:pressed {
-                background-color: #006CC1;
-            }
-        """)
         content_layout.addWidget(self.save_button)
         
         # Set scroll area widget
         scroll_area.setWidget(content_widget)
         main_layout.addWidget(scroll_area)
-    
-    def paintEvent(self, event):
-        """Custom paint event for page background."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Draw background
-        path = QPainterPath()
-        rect = self.rect()
-        path.addRect(QRectF(rect))
-        painter.fillPath(path, QColor(18, 18, 18))
 
-    def save_settings(self):
-        """Save the current settings."""
-        # TODO: Implement settings persistence
-        # Example implementation structure:
-        settings = {
-            'theme': {
-                'dark_mode': self.theme_toggle.isChecked(),
-                'font_size': self.font_size_combo.currentText(),
-                'language': self.language_combo.currentText(),
-                'custom_theme': self.custom_theme_combo.currentText(),
-                'accent_color': self.accent_color_combo.currentText()
-            },
-            'preferences': {
-                'auto_save_interval': self.auto_save_spin.value(),
-                'notifications_enabled': self.notifications_toggle.isChecked()
-            },
-            'advanced': {
-                'api_key': self.api_key_input.text(),
-                'debug_mode': self.debug_mode.isChecked()
-            }
+    def _state_widgets(self):
+        """Return the input widgets whose values make up the page state."""
+        return {
+            'theme.dark_mode': self.theme_toggle,
+            'theme.font_size': self.font_size_combo,
+            'theme.language': self.language_combo,
+            'theme.custom_theme': self.custom_theme_combo,
+            'theme.accent_color': self.accent_color_combo,
+            'preferences.auto_save_interval': self.auto_save_spin,
+            'preferences.notifications_enabled': self.notifications_toggle,
+            'advanced.api_key': self.api_key_input,
+            'advanced.debug_mode': self.debug_mode
         }
-        # TODO: Save settings to file/database
-        pass 
\ No newline at end of file
+
+    def _widget_value(self, widget):
+        if isinstance(widget, QCheckBox):
+            return widget.isChecked()
+        if isinstance(widget, QComboBox):
+            return widget.currentText()
+        if isinstance(widget, QSpinBox):
+            return widget.value()
+        return widget.text()
+
+    def _connect_bus(self, bus):
+        """Publish every edit to the settings bus under its dotted key."""
+        for key, widget in self._state_widgets().items():
+            if isinstance(widget, QCheckBox):
+                signal = widget.toggled
+            elif isinstance(widget, QComboBox):
+                signal = widget.currentTextChanged
+            elif isinstance(widget, QSpinBox):
+                signal = widget.valueChanged
+            else:
+                signal = widget.textChanged
+            signal.connect(lambda value, key=key: bus.publish(key, value))
+
+    def save_state(self):
+        """Capture unsaved edits so they survive page eviction."""
+        return {key: self._widget_value(widget) for key, widget in self._state_widgets().items()}
+
+    def restore_state(self, state):
+        """Restore values captured by save_state without emitting signals."""
+        for key, widget in self._state_widgets().items():
+            if key not in state:
+                continue
+            widget.blockSignals(True)
+            if isinstance(widget, QCheckBox):
+                widget.setChecked(state[key])
+            elif isinstance(widget, QComboBox):
+                widget.setCurrentText(state[key])
+            elif isinstance(widget, QSpinBox):
+                widget.setValue(state[key])
+            else:
+                widget.setText(state[key])
+            widget.blockSignals(False)
+
+    def save_settings(self):
+        """Save the current settings.
+        
+        Returns the dotted keys that changed; the write itself happens on
+        the store's background thread.
+        """
+        if self.settings_store is None:
+            return []
+        return self.settings_store.update(self.save_state())
@@ -1,72 +1,265 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QPushButton,
-                             QSizePolicy, QSpacerItem)
-from PyQt5.QtCore import pyqtSignal, Qt, QSize, QPropertyAnimation, QEasingCurve, QPoint
-from core.utils import get_icon
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QPushButton, QListView,
+                             QStyledItemDelegate, QAbstractItemView, QFrame, QStyle)
+from PyQt5.QtCore import pyqtSignal, Qt, QSize, QAbstractListModel, QModelIndex, QRectF, QPointF
+from PyQt5.QtGui import QPainter, QColor, QPolygonF
+from collections import namedtuple
+from core.utils import get_icon, get_pixmap
+
+# One navigation target; page_index is the stacked widget index it shows
+NavEntry = namedtuple("NavEntry", "icon title page_index")
+# A run of entries; untitled groups have no header and cannot collapse
+NavGroup = namedtuple("NavGroup", "title entries")
+
+DEFAULT_NAVIGATION = [
+    NavGroup(None, [
+        NavEntry("home", "Home", 0),
+        NavEntry("dashboard", "Dashboard", 1),
+        NavEntry("settings", "Settings", 2)
+    ])
+]
+
+IconRole = Qt.UserRole + 1
+PageRole = Qt.UserRole + 2
+HeaderRole = Qt.UserRole + 3
+CollapsedRole = Qt.UserRole + 4
+
+class NavigationModel(QAbstractListModel):
+    """Flat list of group headers and the entries of expanded groups."""
+
+    def __init__(self, groups=None, parent=None):
+        super().__init__(parent)
+        self._groups = list(groups or [])
+        self._collapsed = set()
+        self._rows = []
+        self._row_of_page = {}
+        self._rebuild()
+
+    def _rebuild(self):
+        """Recompute the visible rows and the page -> row lookup."""
+        self._rows = []
+        for group_index, group in enumerate(self._groups):
+            if group.title is not None:
+                self._rows.append((group_index, None))
+            if group_index not in self._collapsed:
+                self._rows.extend((group_index, entry) for entry in group.entries)
+        self._row_of_page = {entry.page_index: row for row, (_, entry) in enumerate(self._rows)
+                             if entry is not None}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        group_index, entry = self._rows[index.row()]
+        if entry is None:
+            if role in (Qt.DisplayRole, Qt.ToolTipRole):
+                return self._groups[group_index].title
+            if role == HeaderRole:
+                return True
+            if role == CollapsedRole:
+                return group_index in self._collapsed
+            return None
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return entry.title
+        if role == IconRole:
+            return entry.icon
+        if role == PageRole:
+            return entry.page_index
+        if role == HeaderRole:
+            return False
+        return None
+
+    def flags(self, index):
+        if index.isValid() and self._rows[index.row()][1] is None:
+            return Qt.ItemIsEnabled
+        return super().flags(index)
+
+    def add_group(self, group):
+        """Append a group of entries."""
+        self.beginResetModel()
+        self._groups.append(group)
+        self._rebuild()
+        self.endResetModel()
+
+    def toggle_group(self, row):
+        """Collapse or expand the group whose header is at row."""
+        group_index, _ = self._rows[row]
+        count = len(self._groups[group_index].entries)
+        if not count:
+            return
+        if group_index in self._collapsed:
+            self.beginInsertRows(QModelIndex(), row + 1, row + count)
+            self._collapsed.discard(group_index)
+            self._rebuild()
+            self.endInsertRows()
+        else:
+            self.beginRemoveRows(QModelIndex(), row + 1, row + count)
+            self._collapsed.add(group_index)
+            self._rebuild()
+            self.endRemoveRows()
+        header = self.index(row)
+        self.dataChanged.emit(header, header, [CollapsedRole])
+
+    def first_page(self):
+        """Return the page index of the first entry, or None if there are none."""
+        for group in self._groups:
+            if group.entries:
+                return group.entries[0].page_index
+        return None
+
+    def row_for_page(self, page_index):
+        """Return the row showing page_index, or -1 if it is hidden or absent."""
+        return self._row_of_page.get(page_index, -1)
+
+class SidebarDelegate(QStyledItemDelegate):
+    """Paints navigation rows as icon buttons and group headers as chevrons.
+
+    Icons are fetched from the shared icon cache only when a row is
+    painted, so entries scrolled out of view never load theirs.
+    """
+
+    row_height = 32
+    icon_size = 24
+    margin = 2
+    radius = 3
+    hover_color = QColor(45, 45, 45, 77)
+    selected_color = QColor(0, 120, 215, 77)
+    header_color = QColor(136, 136, 136)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.row_height)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        rect = QRectF(option.rect).adjusted(self.margin, self.margin, -self.margin, -self.margin)
+        if index.data(HeaderRole):
+            self._paint_header(painter, rect, index.data(CollapsedRole))
+            painter.restore()
+            return
+
+        if option.state & QStyle.State_Selected:
+            background = self.selected_color
+        elif option.state & QStyle.State_MouseOver:
+            background = self.hover_color
+        else:
+            background = None
+        if background is not None:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(background)
+            painter.drawRoundedRect(rect, self.radius, self.radius)
+
+        size = min(self.icon_size, int(rect.width()), int(rect.height()))
+        pixmap = get_pixmap(index.data(IconRole), size)
+        center = rect.center()
+        painter.drawPixmap(QPointF(center.x() - size / 2, center.y() - size / 2), pixmap)
+        painter.restore()
+
+    def _paint_header(self, painter, rect, collapsed):
+        center = rect.center()
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.header_color)
+        if collapsed:
+            points = [QPointF(-2, -4), QPointF(3, 0), QPointF(-2, 4)]
+        else:
+            points = [QPointF(-4, -2), QPointF(4, -2), QPointF(0, 3)]
+        painter.drawPolygon(QPolygonF([center + point for point in points]))
 
 class Sidebar(QWidget):
-    """A vertical sidebar with icon buttons for navigation."""
-    
+    """A vertical sidebar with icon buttons for navigation.
+
+    Entries come from a list of NavGroups and are shown by a single
+    virtualized list view, so construction, scrolling and selection cost
+    the same for three pages or three hundred. Selection is exclusive
+    through the view's selection model; clicking a group header collapses
+    or expands it.
+    """
+
     # Signal emitted when a page button is clicked
     pageChanged = pyqtSignal(int)
-    
-    def __init__(self, parent=None):
+
+    def __init__(self, groups=None, parent=None):
         super().__init__(parent)
         self.setObjectName("sidebar")
+        self.model = NavigationModel(DEFAULT_NAVIGATION if groups is None else groups, self)
+        self._current_page = None
+        # Set while a group toggles, when Qt moves the current row by itself
+        self._toggling = False
         self.setup_ui()
-        
+
     def setup_ui(self):
         """Initialize the sidebar UI components."""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(2)
-        
-        # Create navigation buttons
-        self.buttons = []
-        
-        # Home button
-        self.add_button("home", "Home", 0)
-        
-        # Dashboard button
-        self.add_button("dashboard", "Dashboard", 1)
-        
-        # Settings button
-        self.add_button("settings", "Settings", 2)
-        
-        # Add vertical spacer
-        spacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
-        layout.addItem(spacer)
-        
+
+        # Navigation entries; overflow scrolls with the wheel
+        self.nav_view = QListView()
+        self.nav_view.setObjectName("sidebarList")
+        self.nav_view.setFrameShape(QFrame.NoFrame)
+        self.nav_view.setUniformItemSizes(True)
+        self.nav_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.nav_view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.nav_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.nav_view.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.nav_view.setMouseTracking(True)
+        self.nav_view.viewport().setAttribute(Qt.WA_Hover)
+        self.nav_view.setItemDelegate(SidebarDelegate(self.nav_view))
+        self.nav_view.setModel(self.model)
+        self.nav_view.clicked.connect(self.handle_click)
+        # Arrow keys and Home/End move the current row without a click
+        self.nav_view.selectionModel().currentChanged.connect(self._current_changed)
+        layout.addWidget(self.nav_view)
+
         # Exit button at the bottom
-        self.add_button("exit", "Exit", -1)
-        
-        # Set the first button as active
-        if self.buttons:
-            self.buttons[0].setChecked(True)
-    
-    def add_button(self, icon_name, tooltip, page_index):
-        """Add a navigation button to the sidebar."""
-        button = QPushButton(self)
-        button.setCheckable(True)
-        button.setToolTip(tooltip)
-        button.setIcon(get_icon(icon_name))
-        button.setIconSize(QSize(24, 24))
-        button.clicked.connect(lambda: self.handle_button_click(page_index))
-        
-        self.layout().addWidget(button)
-        self.buttons.append(button)
-        
-        # Connect the button to the button group
-        button.clicked.connect(lambda: self.update_button_states(button))
-    
-    def handle_button_click(self, page_index):
-        """Handle button clicks and emit the pageChanged signal."""
-        if page_index == -1:  # Exit button
-            self.window().close()
-        else:
+        self.exit_button = QPushButton(self)
+        self.exit_button.setToolTip("Exit")
+        self.exit_button.setIcon(get_icon("exit"))
+        self.exit_button.setIconSize(QSize(24, 24))
+        self.exit_button.clicked.connect(lambda: self.window().close())
+        layout.addWidget(self.exit_button)
+
+        # Set the first entry as active
+        first = self.model.first_page()
+        if first is not None:
+            self.set_current_page(first)
+
+    def handle_click(self, index):
+        """Toggle group headers; select entries, emitting pageChanged on a change."""
+        if index.data(HeaderRole):
+            self._toggling = True
+            try:
+                self.model.toggle_group(index.row())
+                # Rows moved; re-select the current page if it is visible again
+                self.set_current_page(self._current_page)
+            finally:
+                self._toggling = False
+            return
+        self._select(index)
+
+    def _current_changed(self, current, previous):
+        if not self._toggling and current.isValid() and not current.data(HeaderRole):
+            self._select(current)
+
+    def _select(self, index):
+        """Make an entry the current page, emitting pageChanged if it changed."""
+        page_index = index.data(PageRole)
+        if page_index != self._current_page:
+            self._current_page = page_index
             self.pageChanged.emit(page_index)
-    
-    def update_button_states(self, clicked_button):
-        """Update the checked state of all buttons."""
-        for button in self.buttons:
-            if button != clicked_button and button != self.buttons[-1]:  # Exclude exit button
-                button.setChecked(False) 
\ No newline at end of file
+
+    def set_current_page(self, page_index):
+        """Select the entry for page_index without emitting pageChanged."""
+        self._current_page = page_index
+        row = self.model.row_for_page(page_index)
+        if row < 0:
+            self.nav_view.clearSelection()
+            return
+        index = self.model.index(row)
+        if self.nav_view.currentIndex() != index:
+            self.nav_view.setCurrentIndex(index)
+
+    def current_page(self):
+        """Return the page index of the selected entry, or None."""
+        return self._current_page